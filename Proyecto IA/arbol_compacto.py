@@ -0,0 +1,341 @@
+# arbol_compacto.py
+# Representación "struct-of-arrays" del árbol del diccionario:
+# cada nodo es un índice entero y sus campos viven en arreglos array('i').
+# Los textos (palabra, palabra normalizada y significado) se guardan en un único
+# pool de bytes UTF-8 con desplazamientos, sin un objeto str por nodo. Los desplazamientos
+# son de 64 bits (array('q')): el pool puede pasar de 2 GiB aunque los ids de nodo no.
+from array import array
+from bisect import bisect_left
+
+from main import (TRAZA_CONTAR, TRAZA_LISTA, TRAZA_NINGUNA, ArbolBST, _norm, _traza_vacia,
+                  calcular_suma_ascii)
+
+NULO = -1   # hijo/padre inexistente o significado ausente
+
+
+class ArbolCompacto:
+
+    def __init__(self):
+        self.raiz = NULO
+        self._altura = -1
+        # campos por nodo (índice = id del nodo)
+        self.suma = array('i')
+        self.izq = array('i')
+        self.der = array('i')
+        self.padre = array('i')
+        self.id_palabra = array('i')
+        self.id_norm = array('i')
+        self.id_significado = array('i')
+        # pool de cadenas: la cadena k ocupa texto[inicios[k]:inicios[k + 1]]
+        self.texto = bytearray()
+        self.inicios = array('q', [0])
+        self._desp_texto = 0   # inicio del pool dentro de 'texto' (≠ 0 si es un mmap de snapshot)
+        self._ids_cadena: dict[str, int] | None = None   # solo durante la carga masiva
+        # True si los arreglos son vistas de un snapshot mapeado (snapshot.cargar_snapshot):
+        # se puede consultar pero no insertar; editable() devuelve una copia en arreglos propios
+        self.solo_lectura = False
+
+    def __len__(self) -> int:
+        return len(self.suma)
+
+# ---------- Pool de cadenas ----------
+    def _agregar_cadena(self, cadena: str) -> int:
+        if self._ids_cadena is not None:
+            ident = self._ids_cadena.get(cadena)
+            if ident is not None:
+                return ident
+        self.texto += cadena.encode('utf-8')
+        self.inicios.append(len(self.texto))
+        ident = len(self.inicios) - 2
+        if self._ids_cadena is not None:
+            self._ids_cadena[cadena] = ident
+        return ident
+
+    def _bytes_cadena(self, ident: int):
+        desp = self._desp_texto
+        return self.texto[desp + self.inicios[ident]:desp + self.inicios[ident + 1]]
+
+    def _cadena(self, ident: int) -> str:
+        return bytes(self._bytes_cadena(ident)).decode('utf-8')
+
+    def palabra(self, i: int) -> str:
+        return self._cadena(self.id_palabra[i])
+
+    def significado(self, i: int) -> str | None:
+        ident = self.id_significado[i]
+        return None if ident == NULO else self._cadena(ident)
+
+    def clave(self, i: int) -> tuple[int, str]:
+        return self.suma[i], self._cadena(self.id_norm[i])
+
+# ---------- Construcción ----------
+    def _nuevo_nodo(self, suma: int, palabra: str, significado: str | None,
+                    palabra_norm: str, padre: int) -> int:
+        i = len(self.suma)
+        self.suma.append(suma)
+        self.izq.append(NULO)
+        self.der.append(NULO)
+        self.padre.append(padre)
+        id_pal = self._agregar_cadena(palabra)
+        self.id_palabra.append(id_pal)
+        self.id_norm.append(id_pal if palabra_norm == palabra else self._agregar_cadena(palabra_norm))
+        self.id_significado.append(NULO if significado is None else self._agregar_cadena(significado))
+        return i
+
+    # Compara (suma, norm) del nodo i contra la clave objetivo sin crear tuplas: -1, 0 o 1.
+    def _comparar(self, i: int, suma: int, norm_bytes: bytes) -> int:
+        s = self.suma[i]
+        if s != suma:
+            return -1 if s < suma else 1
+        actual = self._bytes_cadena(self.id_norm[i])
+        if actual == norm_bytes:
+            return 0
+        return -1 if actual < norm_bytes else 1
+
+    # Inserción BST iterativa (misma semántica que ArbolBST.insertar: ignora duplicados).
+    # Nota: el orden de bytes UTF-8 coincide con el orden de puntos de código de str.
+    def insertar(self, suma_ascii: int, palabra: str, significado: str | None = None) -> None:
+        if self.solo_lectura:
+            raise TypeError("El árbol está mapeado desde un snapshot (solo lectura); "
+                            "use arbol.editable() para obtener una copia que admita inserciones")
+        palabra_norm = _norm(palabra)
+        if self.raiz == NULO:
+            self.raiz = self._nuevo_nodo(suma_ascii, palabra, significado, palabra_norm, NULO)
+            self._altura = 0
+            return
+        norm_bytes = palabra_norm.encode('utf-8')
+        actual = self.raiz
+        profundidad = 1
+        while True:
+            cmp = self._comparar(actual, suma_ascii, norm_bytes)
+            if cmp == 0:
+                return
+            hijos = self.der if cmp < 0 else self.izq
+            if hijos[actual] == NULO:
+                hijos[actual] = self._nuevo_nodo(suma_ascii, palabra, significado, palabra_norm, actual)
+                break
+            actual = hijos[actual]
+            profundidad += 1
+        if profundidad > self._altura:
+            self._altura = profundidad
+
+    @classmethod
+    def desde_ordenada(cls, tuplas_ordenadas: list[tuple[int, str, str]]) -> "ArbolCompacto":
+        return cls._construir_por_rangos(len(tuplas_ordenadas), lambda k, mid: tuplas_ordenadas[mid])
+
+    @classmethod
+    def desde_medianas(cls, lista_balanceada: list[tuple[int, str, str]]) -> "ArbolCompacto":
+        return cls._construir_por_rangos(len(lista_balanceada), lambda k, mid: lista_balanceada[k])
+
+    # Misma idea que ArbolBST._construir_por_rangos, pero escribiendo en los arreglos.
+    @classmethod
+    def _construir_por_rangos(cls, n: int, obtener) -> "ArbolCompacto":
+        arbol = cls()
+        arbol._ids_cadena = {}
+        pila = [(0, n - 1, NULO, False)] if n > 0 else []
+        k = 0
+        while pila:
+            lo, hi, padre, es_izq = pila.pop()
+            mid = (lo + hi) // 2
+            suma, palabra_norm, linea = obtener(k, mid)
+            k += 1
+
+            palabra, _, significado = linea.partition(':')
+            i = arbol._nuevo_nodo(suma, palabra.strip(), significado.strip(), palabra_norm, padre)
+            if padre == NULO:
+                arbol.raiz = i
+            elif es_izq:
+                arbol.izq[padre] = i
+            else:
+                arbol.der[padre] = i
+
+            if mid < hi:
+                pila.append((mid + 1, hi, i, False))
+            if lo < mid:
+                pila.append((lo, mid - 1, i, True))
+
+        arbol._ids_cadena = None   # el diccionario de deduplicación ya no hace falta
+        arbol._altura = n.bit_length() - 1
+        return arbol
+
+    # Convierte un ArbolBST/ArbolAVL ya construido conservando su forma.
+    @classmethod
+    def desde_arbol(cls, origen: ArbolBST) -> "ArbolCompacto":
+        arbol = cls()
+        arbol._ids_cadena = {}
+        pila = [(origen.raiz, NULO, False)] if origen.raiz is not None else []
+        while pila:
+            nodo, padre, es_izq = pila.pop()
+            i = arbol._nuevo_nodo(nodo.suma_ascii, nodo.palabra, nodo.significado, nodo.clave[1], padre)
+            if padre == NULO:
+                arbol.raiz = i
+            elif es_izq:
+                arbol.izq[padre] = i
+            else:
+                arbol.der[padre] = i
+            if nodo.derecha is not None:
+                pila.append((nodo.derecha, i, False))
+            if nodo.izquierda is not None:
+                pila.append((nodo.izquierda, i, True))
+        arbol._ids_cadena = None
+        arbol._altura = origen.altura()
+        return arbol
+
+    # Copia con arreglos y pool de texto propios (p. ej. de un árbol de solo lectura).
+    def editable(self) -> "ArbolCompacto":
+        arbol = ArbolCompacto()
+        for campo in ('suma', 'izq', 'der', 'padre', 'id_palabra', 'id_norm', 'id_significado'):
+            setattr(arbol, campo, array('i', getattr(self, campo)))
+        arbol.inicios = array('q', self.inicios)
+        desp = self._desp_texto
+        arbol.texto = bytearray(self.texto[desp:desp + self.inicios[-1]])
+        arbol.raiz = self.raiz
+        arbol._altura = self._altura
+        return arbol
+
+# ---------- Consultas ----------
+    def altura(self) -> int:
+        return self._altura
+
+    # Búsqueda exacta descendiendo por el orden BST: O(altura), sin objetos por nodo.
+    def buscar(self, palabra: str, suma_ascii: int | None = None) -> int | None:
+        if suma_ascii is None:
+            suma_ascii = calcular_suma_ascii(palabra)
+        norm_bytes = _norm(palabra).encode('utf-8')
+        actual = self.raiz
+        while actual != NULO:
+            cmp = self._comparar(actual, suma_ascii, norm_bytes)
+            if cmp == 0:
+                return actual
+            actual = self.der[actual] if cmp < 0 else self.izq[actual]
+        return None
+
+    def camino_a(self, i: int | None) -> list[tuple[str, int]]:
+        camino = []
+        while i is not None and i != NULO:
+            camino.append((self.palabra(i), self.suma[i]))
+            i = self.padre[i]
+        camino.reverse()
+        return camino
+
+    # Igual que ArbolBST.buscar_lote; 'nodo' es el índice (o None).
+    def buscar_lote(self, palabras: list[str], con_caminos: bool = False):
+        claves = [(calcular_suma_ascii(p), _norm(p).encode('utf-8')) for p in palabras]
+        objetivos = sorted(set(claves))
+        encontrados = {}
+
+        pila = [(self.raiz, 0, len(objetivos), 0)] if self.raiz != NULO and objetivos else []
+        while pila:
+            i_nodo, lo, hi, profundidad = pila.pop()
+            clave = (self.suma[i_nodo], bytes(self._bytes_cadena(self.id_norm[i_nodo])))
+            i = bisect_left(objetivos, clave, lo, hi)
+            j = i
+            if i < hi and objetivos[i] == clave:
+                encontrados[clave] = (i_nodo, profundidad)
+                j = i + 1
+            if lo < i and self.izq[i_nodo] != NULO:
+                pila.append((self.izq[i_nodo], lo, i, profundidad + 1))
+            if j < hi and self.der[i_nodo] != NULO:
+                pila.append((self.der[i_nodo], j, hi, profundidad + 1))
+
+        resultados = []
+        caminos = {}
+        for clave in claves:
+            nodo, profundidad = encontrados.get(clave, (None, None))
+            camino = None
+            if con_caminos:
+                if clave not in caminos:
+                    caminos[clave] = self.camino_a(nodo)
+                camino = caminos[clave]
+            resultados.append((nodo, profundidad, camino))
+        return resultados
+
+    # DLS con la misma semántica que ArbolBST.dls (incluido el parámetro 'traza');
+    # 'nodo' es el índice encontrado o None.
+    # La pila son dos listas de enteros (nodo, nivel): no se crean tuplas ni objetos por nodo.
+    # En un árbol cada nodo se apila una sola vez, así que no hace falta 'visitados',
+    # y el camino sale del arreglo 'padre' en lugar de un diccionario.
+    def dls(self, suma_objetivo: int, limite: int, palabra_objetivo: str | None = None,
+            traza=TRAZA_LISTA):
+        if self.raiz == NULO:
+            return None, _traza_vacia(traza), []
+
+        norm_obj = None
+        if palabra_objetivo is not None:
+            norm_obj = _norm(palabra_objetivo).encode('utf-8')
+
+        en_lista = traza == TRAZA_LISTA
+        avisar = traza if callable(traza) else None
+        contar = avisar is not None or traza == TRAZA_CONTAR
+        recorrido = [] if en_lista else None
+        visitas = 0
+
+        suma, izq, der = self.suma, self.izq, self.der
+        pila_nodos = [self.raiz]
+        pila_niveles = [0]
+
+        while pila_nodos:
+            i = pila_nodos.pop()
+            nivel = pila_niveles.pop()
+            if en_lista:
+                recorrido.append((self.palabra(i), suma[i], nivel))
+            elif contar:
+                visitas += 1
+                if avisar is not None:
+                    avisar(self.palabra(i), suma[i], nivel)
+
+            if nivel > limite:
+                continue
+
+            if norm_obj is not None and suma[i] == suma_objetivo \
+                    and self._bytes_cadena(self.id_norm[i]) == norm_obj:
+                return i, recorrido if en_lista else (visitas if contar else None), self.camino_a(i)
+
+            if nivel < limite:
+                if der[i] != NULO:
+                    pila_nodos.append(der[i])
+                    pila_niveles.append(nivel + 1)
+                if izq[i] != NULO:
+                    pila_nodos.append(izq[i])
+                    pila_niveles.append(nivel + 1)
+
+        return None, recorrido if en_lista else (visitas if contar else None), []
+
+    def iddfs(self, suma_objetivo: int, limite_inicial: int,
+              paso: int,
+              limite_max: int | None,
+              palabra_objetivo: str | None = None,
+              acumular_recorridos: bool = False,
+              traza=TRAZA_LISTA):
+
+        if paso is None or paso <= 0:
+            paso = 1
+        if limite_inicial is None or limite_inicial < 0:
+            limite_inicial = 0
+        if limite_max is None:
+            limite_max = self.altura()
+        else:
+            limite_max = max(0, limite_max)
+
+        en_lista = traza == TRAZA_LISTA
+        if self.raiz == NULO or limite_inicial > limite_max:
+            return None, [] if en_lista else _traza_vacia(traza), []
+
+        recorrido_total = [] if en_lista else _traza_vacia(traza)
+        for limite in range(limite_inicial, limite_max + 1, paso):
+            if en_lista:
+                traza_dls = TRAZA_LISTA if acumular_recorridos else TRAZA_NINGUNA
+            elif callable(traza):
+                traza_dls = lambda p, v, lvl, lim=limite: traza(p, v, lvl, lim)
+            else:
+                traza_dls = traza
+            nodo, recorrido, camino = self.dls(suma_objetivo, limite, palabra_objetivo, traza_dls)
+            if en_lista:
+                if acumular_recorridos:
+                    recorrido_total.extend([(p, v, lvl, limite) for (p, v, lvl) in recorrido])
+            elif recorrido is not None:
+                recorrido_total += recorrido
+            if nodo is not None:
+                return nodo, recorrido_total, camino
+
+        return None, recorrido_total, []
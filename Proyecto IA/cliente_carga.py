@@ -0,0 +1,113 @@
+# cliente_carga.py
+# Generador de carga local para servidor.py: abre varias conexiones concurrentes, envía
+# peticiones (una a la vez por conexión) y reporta latencia p50/p99 y peticiones por segundo.
+#
+#   python cliente_carga.py --palabras diccionario_balanceado.txt --conexiones 32 --peticiones 20000
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from main import leer_lista_desde_archivo_balanceado
+
+
+def _percentil(valores_ordenados: list[float], p: float) -> float:
+    if not valores_ordenados:
+        return 0.0
+    i = min(len(valores_ordenados) - 1, int(p * len(valores_ordenados)))
+    return valores_ordenados[i]
+
+
+def _peticion(op: str, palabras: list[str], rng: random.Random, tam_lote: int, limite: int) -> dict:
+    if op == "lote":
+        return {"op": "lote", "palabras": [rng.choice(palabras) for _ in range(tam_lote)]}
+    if op == "dls":
+        return {"op": "dls", "palabra": rng.choice(palabras), "limite": limite}
+    if op == "iddfs":
+        return {"op": "iddfs", "palabra": rng.choice(palabras)}
+    return {"op": "buscar", "palabra": rng.choice(palabras)}
+
+
+async def _trabajador(abrir, cola: asyncio.Queue, latencias: list[float], errores: list[int]) -> None:
+    reader, writer = await abrir()
+    try:
+        while True:
+            pet = await cola.get()
+            if pet is None:
+                break
+            t0 = time.perf_counter()
+            writer.write(json.dumps(pet, ensure_ascii=False).encode('utf-8') + b"\n")
+            await writer.drain()
+            resp = json.loads(await reader.readline())
+            latencias.append(time.perf_counter() - t0)
+            if not resp.get("ok"):
+                errores[0] += 1
+    finally:
+        writer.close()
+
+
+# Ejecuta la carga y devuelve un resumen con latencias (ms) y peticiones por segundo.
+async def generar_carga(palabras: list[str], conexiones: int = 16, peticiones: int = 10_000,
+                        op: str = "buscar", host: str = "127.0.0.1", puerto: int = 8765,
+                        unix: str | None = None, tam_lote: int = 100, limite: int = 5,
+                        semilla: int = 0) -> dict:
+    rng = random.Random(semilla)
+    cola: asyncio.Queue = asyncio.Queue()
+    for i in range(peticiones):
+        pet = _peticion(op, palabras, rng, tam_lote, limite)
+        pet["id"] = i
+        cola.put_nowait(pet)
+    for _ in range(conexiones):
+        cola.put_nowait(None)      # una marca de fin por conexión
+
+    if unix:
+        abrir = lambda: asyncio.open_unix_connection(unix, limit=16 * 1024 * 1024)
+    else:
+        abrir = lambda: asyncio.open_connection(host, puerto, limit=16 * 1024 * 1024)
+
+    latencias: list[float] = []
+    errores = [0]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_trabajador(abrir, cola, latencias, errores) for _ in range(conexiones)))
+    total = time.perf_counter() - t0
+
+    latencias.sort()
+    return {
+        "op": op,
+        "conexiones": conexiones,
+        "peticiones": len(latencias),
+        "errores": errores[0],
+        "segundos": round(total, 3),
+        "rps": round(len(latencias) / total, 1) if total > 0 else 0.0,
+        "p50_ms": round(_percentil(latencias, 0.50) * 1000, 3),
+        "p99_ms": round(_percentil(latencias, 0.99) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generador de carga para servidor.py")
+    parser.add_argument("--palabras", required=True, help="archivo BALANCEADO del que se toman las palabras")
+    parser.add_argument("--op", choices=["buscar", "lote", "dls", "iddfs"], default="buscar")
+    parser.add_argument("--conexiones", type=int, default=16)
+    parser.add_argument("--peticiones", type=int, default=10_000)
+    parser.add_argument("--tam-lote", type=int, default=100)
+    parser.add_argument("--limite", type=int, default=5, help="límite de profundidad para --op dls")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (en lugar de TCP)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    palabras = [linea.split(':', 1)[0].strip() for _, _, linea in leer_lista_desde_archivo_balanceado(args.palabras)]
+    if not palabras:
+        print("No hay palabras para generar carga.")
+        return
+    resumen = asyncio.run(generar_carga(palabras, args.conexiones, args.peticiones, args.op,
+                                        args.host, args.puerto, args.unix, args.tam_lote,
+                                        args.limite, args.semilla))
+    print(json.dumps(resumen, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
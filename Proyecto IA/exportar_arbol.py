@@ -0,0 +1,243 @@
+# exportar_arbol.py
+# Exporta el árbol a SVG o PNG sin abrir ventanas (sirve en servidores sin pantalla).
+# Usa el layout de layout_arbol.py y escribe la imagen a medida que recorre el árbol:
+# nunca hay una lista con todos los elementos en memoria.
+#
+#   python exportar_arbol.py --balanceado diccionario_balanceado.txt --salida arbol.svg
+#
+# Árboles grandes (10^6 nodos): la imagen se limita a --ancho-max × --alto-max y, desde el
+# nivel en que los nodos quedarían demasiado juntos, cada subárbol se dibuja como un bloque.
+# El PNG se rasteriza en Python puro (sin dependencias), así que no lleva etiquetas de texto,
+# y por franjas de filas: nunca está la imagen entera en memoria.
+import argparse
+import os
+import struct
+import zlib
+from html import escape
+
+from layout_arbol import LayoutArbol, _formatear_etiqueta
+from main import construir_arbol_desde_lista, leer_lista_desde_archivo_balanceado
+
+COLOR_FONDO = "#0b1020"
+COLOR_ARISTA = "#a0b4ff"
+COLOR_NODO = "#233a7a"
+COLOR_BORDE = "#cce1ff"
+COLOR_BLOQUE = "#1a2a57"
+COLOR_TEXTO = "#ffffff"
+
+
+# ---------- SVG ----------
+def _escribir_svg(layout: LayoutArbol, f) -> int:
+    elementos = 0
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{layout.ancho}" height="{layout.alto}" '
+            f'viewBox="0 0 {layout.ancho} {layout.alto}">\n')
+    f.write(f'<rect width="100%" height="100%" fill="{COLOR_FONDO}"/>\n')
+
+    # primero todas las aristas (quedan debajo), después los nodos: dos recorridos del árbol
+    ancho_linea = 2 if layout.escala_x >= 0.5 else 1
+    f.write(f'<g stroke="{COLOR_ARISTA}" stroke-width="{ancho_linea}">\n')
+    for x1, y1, x2, y2 in layout.aristas():
+        f.write(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"/>\n')
+        elementos += 1
+    f.write('</g>\n')
+
+    fuente = layout.tam_fuente
+    f.write(f'<g stroke="{COLOR_BORDE}" stroke-width="{ancho_linea}" fill="{COLOR_NODO}">\n')
+    for nodo, cx, cy, bloque in layout.nodos():
+        if bloque is not None:
+            x0, y0, x1, y1, cantidad = bloque
+            f.write(f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" '
+                    f'fill="{COLOR_BLOQUE}" stroke="{COLOR_ARISTA}"><title>{cantidad} nodos</title></rect>\n')
+        else:
+            f.write(f'<ellipse cx="{cx:.1f}" cy="{cy:.1f}" rx="{layout.rx:.1f}" ry="{layout.ry:.1f}"/>\n')
+            if fuente:
+                linea1, linea2 = _formatear_etiqueta(nodo).split("\n", 1)
+                f.write(f'<text x="{cx:.1f}" y="{cy:.1f}" font-family="Arial" font-size="{fuente}" '
+                        f'font-weight="bold" fill="{COLOR_TEXTO}" stroke="none" text-anchor="middle">'
+                        f'<tspan x="{cx:.1f}" dy="-0.2em">{escape(linea1)}</tspan>'
+                        f'<tspan x="{cx:.1f}" dy="1.2em">{escape(linea2)}</tspan></text>\n')
+        elementos += 1
+    f.write('</g>\n</svg>\n')
+    return elementos
+
+
+# ---------- PNG ----------
+def _rgb(color: str) -> bytes:
+    return bytes.fromhex(color[1:])
+
+
+class _Lienzo:
+    """
+    Franja de 'filas' filas de la imagen (desde la fila y0) en un bytearray RGB, con las
+    primitivas justas para el árbol. Las primitivas reciben coordenadas de la imagen entera
+    y solo pintan lo que cae dentro de la franja.
+    """
+
+    def __init__(self, ancho: int, filas: int, fondo: str):
+        self.ancho, self.filas = ancho, filas
+        self.y0, self.y1 = 0, filas          # filas [y0, y1) de la imagen
+        self._fila_fondo = _rgb(fondo) * ancho
+        self.px = bytearray(self._fila_fondo) * filas
+
+    # Mueve la franja a las filas [y0, y0 + filas) (o hasta 'alto') y la vuelve al fondo.
+    def mover(self, y0: int, alto: int) -> None:
+        self.y0, self.y1 = y0, min(alto, y0 + self.filas)
+        bytes_fila = len(self._fila_fondo)
+        for k in range(self.filas):
+            self.px[k * bytes_fila:(k + 1) * bytes_fila] = self._fila_fondo
+
+    def _tramo(self, y: int, x0: int, x1: int, color: bytes) -> None:
+        if y < self.y0 or y >= self.y1:
+            return
+        x0, x1 = max(0, x0), min(self.ancho - 1, x1)
+        if x0 > x1:
+            return
+        i = ((y - self.y0) * self.ancho + x0) * 3
+        self.px[i:i + (x1 - x0 + 1) * 3] = color * (x1 - x0 + 1)
+
+    # Una asignación de tramo por fila (no un píxel por vez): en cada fila se pinta
+    # el segmento de x que la recta recorre entre y - 0.5 e y + 0.5.
+    def linea(self, x0: float, y0: float, x1: float, y1: float, color: bytes) -> None:
+        if y0 > y1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
+        fila_ini, fila_fin = round(y0), round(y1)
+        if fila_fin < self.y0 or fila_ini >= self.y1:
+            return
+        if fila_ini == fila_fin:
+            self._tramo(fila_ini, round(min(x0, x1)), round(max(x0, x1)), color)
+            return
+        pendiente = (x1 - x0) / (y1 - y0)
+        for y in range(max(self.y0, fila_ini), min(self.y1 - 1, fila_fin) + 1):
+            ya, yb = max(y0, y - 0.5), min(y1, y + 0.5)
+            xa, xb = x0 + (ya - y0) * pendiente, x0 + (yb - y0) * pendiente
+            if xa > xb:
+                xa, xb = xb, xa
+            self._tramo(y, round(xa), max(round(xa), round(xb) - 1), color)
+
+    def elipse(self, cx: float, cy: float, rx: float, ry: float, relleno: bytes, borde: bytes) -> None:
+        y_min, y_max = round(cy - ry), round(cy + ry)
+        for y in range(max(self.y0, y_min), min(self.y1 - 1, y_max) + 1):
+            t = (y - cy) / ry
+            if t * t > 1:
+                continue
+            media = rx * (1 - t * t) ** 0.5
+            x0, x1 = round(cx - media), round(cx + media)
+            if y in (y_min, y_max) or rx < 3:
+                self._tramo(y, x0, x1, borde)
+            else:
+                self._tramo(y, x0, x1, relleno)
+                self._tramo(y, x0, x0, borde)
+                self._tramo(y, x1, x1, borde)
+
+    def rectangulo(self, x0: float, y0: float, x1: float, y1: float, relleno: bytes, borde: bytes) -> None:
+        x0, y0, x1, y1 = round(x0), round(y0), round(x1), round(y1)
+        if y1 < self.y0 or y0 >= self.y1:
+            return
+        self._tramo(y0, x0, x1, borde)
+        self._tramo(y1, x0, x1, borde)
+        # la fila interior se arma una vez y se copia en cada fila
+        xa, xb = max(0, x0), min(self.ancho - 1, x1)
+        if xa > xb:
+            return
+        fila = bytearray(relleno * (xb - xa + 1))
+        if xa == x0:
+            fila[0:3] = borde
+        if xb == x1:
+            fila[-3:] = borde
+        largo = len(fila)
+        for y in range(max(self.y0, y0 + 1), min(self.y1, y1)):
+            i = ((y - self.y0) * self.ancho + xa) * 3
+            self.px[i:i + largo] = fila
+
+    # Comprime las filas de la franja, cada una con el byte de filtro "None" adelante.
+    def comprimir(self, comp) -> bytes:
+        bytes_fila = self.ancho * 3
+        vista = memoryview(self.px)
+        partes = []
+        for k in range(self.y1 - self.y0):
+            partes.append(comp.compress(b'\x00'))
+            partes.append(comp.compress(vista[k * bytes_fila:(k + 1) * bytes_fila]))
+        return b''.join(partes)
+
+
+# Rasteriza por franjas horizontales: por cada franja se recorre el layout otra vez, se
+# pinta solo lo que cae en ella y se comprime y escribe (un IDAT) antes de pasar a la
+# siguiente. La memoria pico es O(ancho × filas_por_franja), no la imagen entera; el costo
+# es un recorrido del layout por franja.
+def _escribir_png(layout: LayoutArbol, f, filas_por_franja: int = 256) -> int:
+    def chunk(tipo: bytes, datos: bytes) -> None:
+        f.write(struct.pack('>I', len(datos)))
+        f.write(tipo)
+        f.write(datos)
+        f.write(struct.pack('>I', zlib.crc32(datos, zlib.crc32(tipo))))
+
+    f.write(b'\x89PNG\r\n\x1a\n')
+    chunk(b'IHDR', struct.pack('>IIBBBBB', layout.ancho, layout.alto, 8, 2, 0, 0, 0))
+    comp = zlib.compressobj(6)
+    arista, nodo_c, borde, bloque_c = _rgb(COLOR_ARISTA), _rgb(COLOR_NODO), _rgb(COLOR_BORDE), _rgb(COLOR_BLOQUE)
+    lienzo = _Lienzo(layout.ancho, min(filas_por_franja, layout.alto), COLOR_FONDO)
+    elementos = 0
+    for y0 in range(0, layout.alto, lienzo.filas):
+        lienzo.mover(y0, layout.alto)
+        elementos = 0
+        for x1, y1, x2, y2 in layout.aristas():
+            lienzo.linea(x1, y1, x2, y2, arista)
+            elementos += 1
+        for _, cx, cy, bloque in layout.nodos():
+            if bloque is not None:
+                lienzo.rectangulo(*bloque[:4], bloque_c, arista)
+            else:
+                lienzo.elipse(cx, cy, layout.rx, layout.ry, nodo_c, borde)
+            elementos += 1
+        datos = lienzo.comprimir(comp)
+        if datos:
+            chunk(b'IDAT', datos)
+    chunk(b'IDAT', comp.flush())
+    chunk(b'IEND', b'')
+    return elementos
+
+
+# ---------- API pública ----------
+_FORMATOS = {".svg": (_escribir_svg, "w"), ".png": (_escribir_png, "wb")}
+
+
+# Exporta el árbol a 'ruta' (.svg o .png). Devuelve el layout usado, o None si no se pudo.
+def exportar_arbol(arbol, ruta: str, ancho_max: int = 8000, alto_max: int = 4000) -> LayoutArbol | None:
+    if arbol is None or arbol.raiz is None:
+        print("⚠️ No hay árbol para exportar.")
+        return None
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension not in _FORMATOS:
+        print(f"Formato no soportado: {extension!r} (use .svg o .png)")
+        return None
+    escribir, modo = _FORMATOS[extension]
+
+    layout = LayoutArbol(arbol.raiz, ancho_max, alto_max)
+    tmp = ruta + '.tmp'
+    with open(tmp, modo, **({"encoding": "utf-8"} if modo == "w" else {})) as f:
+        layout.elementos = escribir(layout, f)
+    os.replace(tmp, ruta)
+    return layout
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exporta el árbol del diccionario a SVG o PNG.")
+    parser.add_argument("--balanceado", required=True, help="archivo BALANCEADO (palabra : significado)")
+    parser.add_argument("--salida", required=True, help="imagen de salida (.svg o .png)")
+    parser.add_argument("--ancho-max", type=int, default=8000)
+    parser.add_argument("--alto-max", type=int, default=4000)
+    args = parser.parse_args()
+
+    lista = leer_lista_desde_archivo_balanceado(args.balanceado)
+    if not lista:
+        print("No se pudo leer el archivo balanceado.")
+        return
+    layout = exportar_arbol(construir_arbol_desde_lista(lista), args.salida, args.ancho_max, args.alto_max)
+    if layout is not None:
+        corte = "ninguno" if layout.nivel_corte is None else layout.nivel_corte
+        print(f"Imagen guardada como: {args.salida} ({layout.ancho}x{layout.alto}, "
+              f"{layout.n} nodos, {layout.elementos} elementos, nivel de agregación: {corte})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# layout_arbol.py
+# Layout del árbol sin interfaz gráfica (no importa tkinter): lo usan visualizador.py
+# para la ventana y exportar_arbol.py para generar imágenes en servidores sin pantalla.
+#
+# El layout es el mismo en ambos casos: x por columna in-order, y por nivel.
+# Todos los recorridos usan pila explícita y memoria O(altura): no se guarda
+# la posición de cada nodo, se va produciendo a medida que se recorre.
+
+# In-order para posicionar por columnas (x) y niveles (y)
+def _asignar_posiciones_inorder(nodo, nivel, dx, dy, margen_x, margen_y, col_ref, posiciones):
+    pila = []
+    actual = nodo
+    while pila or actual is not None:
+        # bajar por la izquierda apilando (nodo, nivel)
+        while actual is not None:
+            pila.append((actual, nivel))
+            actual = actual.izquierda
+            nivel += 1
+        actual, nivel = pila.pop()
+        x = margen_x + col_ref[0] * dx
+        y = margen_y + nivel * dy
+        posiciones[actual] = (x, y)
+        col_ref[0] += 1
+        actual = actual.derecha
+        nivel += 1
+
+def _formatear_etiqueta(nodo):
+    # Mostrar palabra(s) y valor: si es lista, mostramos primeras 2…
+    if isinstance(nodo.palabra, list):
+        if len(nodo.palabra) <= 2:
+            palabras = ", ".join(nodo.palabra)
+        else:
+            palabras = ", ".join(nodo.palabra[:2]) + "…"
+    else:
+        palabras = str(nodo.palabra)
+    # antes: return f"{palabras}\n{nodo.valor}"
+    return f"{palabras}\n{nodo.suma_ascii}"
+
+
+# ---------- Recorrido con columnas ----------
+# Tamaño, tamaño del subárbol izquierdo y niveles por debajo de 'nodo'.
+def _medir_subarbol(nodo):
+    tam = 0
+    bajo = 0
+    pila = [(nodo, 0)]
+    while pila:
+        actual, nivel = pila.pop()
+        tam += 1
+        if nivel > bajo:
+            bajo = nivel
+        if actual.izquierda:
+            pila.append((actual.izquierda, nivel + 1))
+        if actual.derecha:
+            pila.append((actual.derecha, nivel + 1))
+    tam_izq = 0
+    if nodo.izquierda:
+        pila = [nodo.izquierda]
+        while pila:
+            actual = pila.pop()
+            tam_izq += 1
+            if actual.izquierda:
+                pila.append(actual.izquierda)
+            if actual.derecha:
+                pila.append(actual.derecha)
+    return tam, tam_izq, bajo
+
+
+# Recorre el árbol in-order y produce, por nodo:
+#   (nodo, columna, nivel, columna_padre, columna_hijo_izq, bloque)
+# columna_padre solo viene en los hijos derechos y columna_hijo_izq en los padres, así cada
+# arista aparece una sola vez y siempre cuando sus dos extremos ya tienen columna.
+# Con nivel_corte, cada subárbol que empieza en ese nivel sale como un único elemento con
+# bloque = (col_ini, col_fin, cantidad_de_nodos, niveles_por_debajo); si no, bloque = None.
+# 'medidas' (opcional) guarda la medición de cada bloque para los recorridos siguientes.
+def recorrer_layout(raiz, nivel_corte=None, medidas=None):
+    col = 0
+    pila = []   # marcos [nodo, nivel, columna_padre, columna_hijo_izq, es_hijo_izq]
+    actual, nivel, col_padre, es_izq = raiz, 0, None, False
+    while pila or actual is not None:
+        while actual is not None:
+            if nivel_corte is not None and nivel >= nivel_corte:
+                if medidas is None:
+                    tam, tam_izq, bajo = _medir_subarbol(actual)
+                else:
+                    if actual not in medidas:
+                        medidas[actual] = _medir_subarbol(actual)
+                    tam, tam_izq, bajo = medidas[actual]
+                c = col + tam_izq
+                yield actual, c, nivel, col_padre, None, (col, col + tam - 1, tam, bajo)
+                if es_izq:
+                    pila[-1][3] = c
+                col += tam
+                actual = None
+                break
+            pila.append([actual, nivel, col_padre, None, es_izq])
+            actual, nivel, col_padre, es_izq = actual.izquierda, nivel + 1, None, True
+        if not pila:
+            break
+        nodo, nivel, col_padre, col_izq, es_izq = pila.pop()
+        c = col
+        col += 1
+        yield nodo, c, nivel, col_padre, col_izq, None
+        if es_izq:
+            # el padre de un hijo izquierdo es el marco que queda arriba de la pila
+            pila[-1][3] = c
+        actual, nivel, col_padre, es_izq = nodo.derecha, nivel + 1, c, False
+
+
+# Cantidad de nodos, cantidad de niveles y separación mínima (en columnas) entre
+# nodos vecinos de cada nivel. Una pasada, memoria O(altura).
+def medir_niveles(raiz):
+    ultima = []        # última columna vista en cada nivel
+    separacion = []
+    n = 0
+    if raiz is None:
+        return 0, 0, []
+    for _, col, nivel, _, _, _ in recorrer_layout(raiz):
+        n += 1
+        # in-order puede llegar a un nivel profundo antes que a los intermedios
+        while len(ultima) <= nivel:
+            ultima.append(None)
+            separacion.append(float('inf'))
+        if ultima[nivel] is not None and col - ultima[nivel] < separacion[nivel]:
+            separacion[nivel] = col - ultima[nivel]
+        ultima[nivel] = col
+    return n, len(ultima), separacion
+
+
+# ---------- Layout escalado a un tamaño de imagen ----------
+DX, DY = 110, 100          # separación entre columnas y entre niveles (igual que la ventana)
+MARGEN_X, MARGEN_Y = 60, 50
+RX, RY = 38, 24            # radio del óvalo de cada nodo
+UMBRAL_DETALLE_PX = 12     # separación mínima para dibujar nodos sueltos en la imagen
+
+
+class LayoutArbol:
+    """
+    Geometría del árbol para un tamaño máximo de imagen. Si el árbol no entra a escala 1,
+    se comprime cada eje por separado y, desde el primer nivel cuyos nodos quedarían a
+    menos de 'umbral_px' píxeles, los subárboles se agregan en bloques (nivel_corte).
+    """
+
+    def __init__(self, raiz, ancho_max=8000, alto_max=4000, umbral_px=UMBRAL_DETALLE_PX):
+        self.raiz = raiz
+        self.n, self.niveles, self.separacion = medir_niveles(raiz)
+
+        util_x = max(1, ancho_max - 2 * MARGEN_X)
+        util_y = max(1, alto_max - 2 * MARGEN_Y)
+        self.escala_x = min(1.0, util_x / max(1, self.n * DX))
+        self.escala_y = min(1.0, util_y / max(1, self.niveles * DY))
+
+        self.nivel_corte = None
+        for nivel, sep in enumerate(self.separacion):
+            if sep * DX * self.escala_x < umbral_px:
+                self.nivel_corte = nivel
+                break
+
+        self.ancho = int(2 * MARGEN_X + max(0, self.n - 1) * DX * self.escala_x) + 1
+        self.alto = int(2 * MARGEN_Y + max(0, self.niveles - 1) * DY * self.escala_y) + 1
+        # los óvalos se achican con la menor de las dos escalas para no deformarse
+        escala = min(self.escala_x, self.escala_y)
+        self.rx = max(1.5, RX * escala)
+        self.ry = max(1.5, RY * escala)
+        # las etiquetas solo cuando el texto sigue siendo legible
+        self.tam_fuente = round(10 * escala, 1) if escala >= 0.5 else None
+        self.elementos = 0         # lo completa el exportador
+        # medición de cada subárbol agregado: el PNG recorre el layout una vez por franja
+        # y así solo la primera pasada baja hasta las hojas (una entrada por bloque)
+        self._medidas = {}
+
+    def x(self, col):
+        return MARGEN_X + col * DX * self.escala_x
+
+    def y(self, nivel):
+        return MARGEN_Y + nivel * DY * self.escala_y
+
+    def recorrer(self):
+        if self.raiz is None:
+            return iter(())
+        return recorrer_layout(self.raiz, self.nivel_corte, self._medidas)
+
+    # Aristas en coordenadas de imagen: (x1, y1, x2, y2), de padre a hijo.
+    def aristas(self):
+        x, y = self.x, self.y
+        for _, col, nivel, col_padre, col_izq, _ in self.recorrer():
+            if col_izq is not None:
+                yield x(col), y(nivel), x(col_izq), y(nivel + 1)
+            if col_padre is not None:
+                yield x(col_padre), y(nivel - 1), x(col), y(nivel)
+
+    # Nodos en coordenadas de imagen: (nodo, cx, cy, bloque). Si el elemento es un subárbol
+    # agregado, bloque = (x0, y0, x1, y1, cantidad_de_nodos); si no, None.
+    def nodos(self):
+        x, y = self.x, self.y
+        for nodo, col, nivel, _, _, bloque in self.recorrer():
+            if bloque is None:
+                yield nodo, x(col), y(nivel), None
+            else:
+                col_ini, col_fin, tam, bajo = bloque
+                yield nodo, x(col), y(nivel), (x(col_ini) - self.rx, y(nivel) - self.ry,
+                                               x(col_fin) + self.rx, y(nivel + bajo) + self.ry, tam)
@@ -1,5 +1,8 @@
+import marshal
 import re
-from visualizador import mostrar_arbol_async
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict
 
 # ============================================================
 #                    NORMALIZACIÓN DE TEXTO
@@ -16,86 +19,424 @@ def _norm(palabra: str) -> str:
 # ============================================================
 
 class NodoBST:
+
+    # __slots__: sin __dict__ por nodo (ahorra memoria en diccionarios grandes)
+    __slots__ = ('suma_ascii', 'palabra', 'significado', 'clave', 'izquierda', 'derecha', 'padre')
     
     #inicializa el nodo con su clave y punteros a hijos nulos.
-    def __init__(self, suma_ascii: int, palabra: str, significado: str | None = None):
+    # palabra_norm permite reutilizar la normalización ya calculada (carga masiva).
+    def __init__(self, suma_ascii: int, palabra: str, significado: str | None = None,
+                 palabra_norm: str | None = None):
         self.suma_ascii = suma_ascii          # métrica de comparación primaria
         self.palabra = palabra                # palabra original (para mostrar)
         self.significado = significado
-        self.clave = (suma_ascii, _norm(palabra))  # empaqueta criterio de orden
+        if palabra_norm is None:
+            palabra_norm = _norm(palabra)
+        if palabra_norm == palabra:
+            palabra_norm = palabra   # comparte la cadena en vez de guardar una copia igual
+        self.clave = (suma_ascii, palabra_norm)  # empaqueta criterio de orden
         self.izquierda = None                       # hijo izquierdo
         self.derecha = None                       # hijo derecho
+        self.padre = None                         # permite reconstruir el camino sin buscar
+
+
+def _clave_prefijo(nodo: NodoBST) -> tuple[str, int]:
+    return nodo.clave[1], nodo.suma_ascii
+
+
+# Modos de traza de dls/iddfs (además de pasar una función que recibe cada visita)
+TRAZA_LISTA = "lista"      # lista completa de visitas (comportamiento original)
+TRAZA_CONTAR = "contar"    # solo la cantidad de visitas
+TRAZA_NINGUNA = None       # sin traza: búsqueda pura
+
+
+def _traza_vacia(traza):
+    if traza == TRAZA_LISTA:
+        return []
+    return None if traza is TRAZA_NINGUNA else 0
+
+
+# Índice de prefijos para autocompletar: arreglo ordenado por (palabra_norm, suma) + bisect.
+# Las altas se acumulan en 'pendientes' y se incorporan en la próxima consulta:
+# si son pocas, con bisect + insert; si son muchas, ordenando todo de una vez.
+class IndicePrefijos:
+
+    MAX_INSERCIONES_DIRECTAS = 512
+
+    def __init__(self):
+        self._claves: list[tuple[str, int]] = []
+        self._nodos: list[NodoBST] = []
+        self._pendientes: list[NodoBST] = []
+
+    def __len__(self) -> int:
+        return len(self._nodos) + len(self._pendientes)
+
+    def agregar(self, nodo: NodoBST) -> None:
+        self._pendientes.append(nodo)
+
+    def quitar(self, nodo: NodoBST) -> None:
+        self._consolidar()
+        i = bisect_left(self._claves, _clave_prefijo(nodo))
+        if i < len(self._nodos) and self._nodos[i] is nodo:
+            del self._claves[i]
+            del self._nodos[i]
+
+    def _consolidar(self) -> None:
+        if not self._pendientes:
+            return
+        if self._nodos and len(self._pendientes) <= self.MAX_INSERCIONES_DIRECTAS:
+            # pocas altas: insertar cada una en su lugar es más barato que reordenar todo
+            for nodo in self._pendientes:
+                clave = _clave_prefijo(nodo)
+                i = bisect_left(self._claves, clave)
+                self._claves.insert(i, clave)
+                self._nodos.insert(i, nodo)
+            self._pendientes = []
+            return
+        nuevos = sorted(self._pendientes, key=_clave_prefijo)
+        self._pendientes = []
+        if self._nodos:
+            nuevos = self._nodos + nuevos
+            nuevos.sort(key=_clave_prefijo)
+        self._nodos = nuevos
+        self._claves = [_clave_prefijo(n) for n in nuevos]
+
+    # Incorpora ya las altas pendientes, para no pagar el ordenamiento en la primera consulta
+    # (por ejemplo, antes de publicar un árbol recién cargado a otros hilos).
+    def preparar(self) -> None:
+        self._consolidar()
+
+    # Generador perezoso: nodos cuya palabra normalizada empieza con 'prefijo', en orden alfabético.
+    def con_prefijo(self, prefijo: str):
+        self._consolidar()
+        prefijo = _norm(prefijo)
+        claves, nodos = self._claves, self._nodos
+        i = bisect_left(claves, (prefijo,))
+        while i < len(claves) and claves[i][0].startswith(prefijo):
+            yield nodos[i]
+            i += 1
+
+
+# Caché LRU de resultados de búsquedas con traza (DLS/IDDFS).
+# Clave: (clave_objetivo, límite, modo). Valor: (nodo, camino, recorrido).
+# El recorrido se guarda tal cual, o comprimido (marshal + zlib) si comprimir_recorridos=True
+# (menos memoria, pero descomprimir cuesta casi lo mismo que repetir la búsqueda),
+# o no se guarda si guardar_recorridos=False (en un acierto el recorrido vuelve vacío:
+# sirve cuando solo interesan el nodo y el camino).
+class CacheBusquedas:
+
+    def __init__(self, capacidad: int = 1024, guardar_recorridos: bool = True,
+                 comprimir_recorridos: bool = False):
+        self.capacidad = max(1, capacidad)
+        self.guardar_recorridos = guardar_recorridos
+        self.comprimir_recorridos = comprimir_recorridos
+        self._datos: OrderedDict = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def obtener(self, clave):
+        entrada = self._datos.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+        self._datos.move_to_end(clave)
+        self.aciertos += 1
+        nodo, camino, recorrido = entrada
+        if recorrido is None:
+            recorrido = []
+        elif self.comprimir_recorridos:
+            recorrido = marshal.loads(zlib.decompress(recorrido))
+        else:
+            recorrido = list(recorrido)
+        # copias: quien llama puede modificar las listas sin tocar la caché
+        return nodo, recorrido, list(camino)
+
+    def guardar(self, clave, nodo, recorrido: list, camino: list) -> None:
+        if not self.guardar_recorridos:
+            recorrido = None
+        elif self.comprimir_recorridos:
+            recorrido = zlib.compress(marshal.dumps(recorrido), 1)
+        else:
+            recorrido = tuple(recorrido)
+        self._datos[clave] = (nodo, tuple(camino), recorrido)
+        self._datos.move_to_end(clave)
+        while len(self._datos) > self.capacidad:
+            self._datos.popitem(last=False)
+            self.expulsiones += 1
+
+    def invalidar(self) -> None:
+        self._datos.clear()
+
+    def estadisticas(self) -> dict:
+        total = self.aciertos + self.fallos
+        return {"tamano": len(self._datos), "capacidad": self.capacidad,
+                "aciertos": self.aciertos, "fallos": self.fallos,
+                "expulsiones": self.expulsiones,
+                "tasa_aciertos": self.aciertos / total if total else 0.0}
 
 
 #encapsula operaciones sobre el BST
 class ArbolBST:
+
+    clase_nodo = NodoBST
    
     def __init__(self):
         self.raiz = None
+        # índice hash clave -> nodo, se mantiene sincronizado con insertar()
+        self.indice: dict[tuple[int, str], NodoBST] = {}
+        # índice de prefijos (autocompletar), también se llena al insertar
+        self.prefijos = IndicePrefijos()
+        # altura cacheada: se actualiza en cada inserción (-1 = árbol vacío)
+        self._altura = -1
+        # caché de búsquedas con traza (desactivada hasta llamar a activar_cache)
+        self.cache: CacheBusquedas | None = None
+
+    # Activa la caché LRU de dls/iddfs. Cualquier inserción la invalida.
+    def activar_cache(self, capacidad: int = 1024, guardar_recorridos: bool = True,
+                      comprimir_recorridos: bool = False) -> CacheBusquedas:
+        self.cache = CacheBusquedas(capacidad, guardar_recorridos, comprimir_recorridos)
+        return self.cache
+
+    def _invalidar_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidar()
 
     
 #Inserta un nodo respetando el orden BST por clave compuesta.
     def insertar(self, suma_ascii: int, palabra: str, significado: str | None = None ) -> None:
-        nuevo = NodoBST(suma_ascii, palabra, significado)
+        nuevo = self.clase_nodo(suma_ascii, palabra, significado)
+        if nuevo.clave in self.indice:
+            # Duplicado exacto: ya existe, no hace falta recorrer el árbol.
+            return
         if self.raiz is None:
             self.raiz = nuevo
+            profundidad = 0
         else:
-            self._insertar_rec(self.raiz, nuevo)
-
-    def _insertar_rec(self, actual: NodoBST, nuevo: NodoBST) -> None:
-       
+            profundidad = self._insertar_iter(self.raiz, nuevo)
+        self.indice[nuevo.clave] = nuevo
+        self.prefijos.agregar(nuevo)
+        self._invalidar_cache()
+        if profundidad > self._altura:
+            self._altura = profundidad
+
+    # Desciende con un bucle (sin recursión) y devuelve la profundidad del nuevo nodo.
+    def _insertar_iter(self, actual: NodoBST, nuevo: NodoBST) -> int:
+        profundidad = 1
         #la clave compuesta evita que dos palabras con igual suma ASCII se mezclen desordenadas.
-        if nuevo.clave < actual.clave:
-            if actual.izquierda is None:
-                actual.izquierda = nuevo
+        while True:
+            if nuevo.clave < actual.clave:
+                if actual.izquierda is None:
+                    actual.izquierda = nuevo
+                    break
+                actual = actual.izquierda
+            elif nuevo.clave > actual.clave:
+                if actual.derecha is None:
+                    actual.derecha = nuevo
+                    break
+                actual = actual.derecha
             else:
-                self._insertar_rec(actual.izquierda, nuevo)
-        elif nuevo.clave > actual.clave:
-            if actual.derecha is None:
-                actual.derecha = nuevo
-            else:
-                self._insertar_rec(actual.derecha, nuevo)
-        else:
-            # Duplicado exacto: misma suma y misma palabra normalizada.
-            # Se omite para mantener unicidad.
-            pass
-
-    
-# Devuelve la altura del árbol de forma recursiva.
-    def _altura_rec(self, nodo: NodoBST) -> int:
-        
-        if nodo is None:
-            return -1
-        return 1 + max(self._altura_rec(nodo.izquierda), self._altura_rec(nodo.derecha))
- #Altura de la raíz. Útil para acotar la IDDFS y evitar iteraciones inútiles.
+                # Duplicado exacto: misma suma y misma palabra normalizada.
+                # Se omite para mantener unicidad.
+                return -1
+            profundidad += 1
+        nuevo.padre = actual
+        return profundidad
+
+ #Altura de la raíz (cacheada). Útil para acotar la IDDFS y evitar iteraciones inútiles.
     def altura(self) -> int:
-        return self._altura_rec(self.raiz)
+        return self._altura
+
+# ---------- Carga masiva O(n), sin comparar claves ----------
+# Desde tuplas ya ordenadas por (suma_ascii, palabra_norm): el medio de cada rango es la raíz.
+    @classmethod
+    def desde_ordenada(cls, tuplas_ordenadas: list[tuple[int, str, str]]) -> "ArbolBST":
+        return cls._construir_por_rangos(len(tuplas_ordenadas), lambda k, mid: tuplas_ordenadas[mid])
+
+# Desde la lista en orden de "medianas" (la que devuelve normalizar_y_generar_balanceado):
+# ese orden es el preorden del árbol balanceado, así que el k-ésimo rango visitado usa el elemento k.
+    @classmethod
+    def desde_medianas(cls, lista_balanceada: list[tuple[int, str, str]]) -> "ArbolBST":
+        return cls._construir_por_rangos(len(lista_balanceada), lambda k, mid: lista_balanceada[k])
+
+    # Recorre los rangos (lo, hi) en preorden con una pila y enlaza cada nodo a su padre.
+    # Las claves se asumen únicas (normalizar_y_generar_balanceado ya elimina duplicados).
+    @classmethod
+    def _construir_por_rangos(cls, n: int, obtener) -> "ArbolBST":
+        arbol = cls()
+        pila = [(0, n - 1, None, False)] if n > 0 else []
+        k = 0
+        while pila:
+            lo, hi, padre, es_izq = pila.pop()
+            mid = (lo + hi) // 2
+            suma, palabra_norm, linea = obtener(k, mid)
+            k += 1
+
+            # cada línea se separa una sola vez
+            palabra, _, significado = linea.partition(':')
+            nodo = cls.clase_nodo(suma, palabra.strip(), significado.strip(), palabra_norm)
+            cls._preparar_nodo_bulk(nodo, hi - lo + 1)
+            arbol.indice[nodo.clave] = nodo
+            arbol.prefijos.agregar(nodo)
+
+            nodo.padre = padre
+            if padre is None:
+                arbol.raiz = nodo
+            elif es_izq:
+                padre.izquierda = nodo
+            else:
+                padre.derecha = nodo
+
+            # derecha primero para que la izquierda salga antes (preorden)
+            if mid < hi:
+                pila.append((mid + 1, hi, nodo, False))
+            if lo < mid:
+                pila.append((lo, mid - 1, nodo, True))
+
+        # un árbol partido por la mitad con n nodos tiene altura floor(log2 n)
+        arbol._altura = n.bit_length() - 1
+        return arbol
+
+    # Gancho para subclases que guardan datos extra por nodo (p.ej. la altura en AVL).
+    @staticmethod
+    def _preparar_nodo_bulk(nodo: NodoBST, tam_subarbol: int) -> None:
+        pass
+
+# Búsqueda directa por índice hash: una sola consulta, sin recorrer el árbol.
+    def buscar(self, palabra: str, suma_ascii: int | None = None) -> NodoBST | None:
+        if suma_ascii is None:
+            suma_ascii = calcular_suma_ascii(palabra)
+        return self.indice.get((suma_ascii, _norm(palabra)))
+
+# Camino raíz -> nodo subiendo por los punteros 'padre' (no hace búsqueda).
+    def camino_a(self, nodo: NodoBST | None) -> list[tuple[str, int]]:
+        camino = []
+        while nodo is not None:
+            camino.append((nodo.palabra, nodo.suma_ascii))
+            nodo = nodo.padre
+        camino.reverse()
+        return camino
+
+# Iterador perezoso en orden de clave dentro de [desde, hasta) (None = sin cota).
+# Poda por cotas: no baja a subárboles que quedan enteros fuera del rango.
+    def iterar_rango(self, desde: tuple | None = None, hasta: tuple | None = None):
+        pila = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                if desde is not None and nodo.clave < desde:
+                    nodo = nodo.derecha      # el nodo y su subárbol izquierdo quedan por debajo
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierda
+            nodo = pila.pop()
+            if hasta is not None and nodo.clave >= hasta:
+                return                       # in-order: todo lo que sigue también queda fuera
+            yield nodo
+            nodo = nodo.derecha
+
+# Palabras con suma ASCII en [suma_min, suma_max] (ambos incluidos).
+    def rango_suma(self, suma_min: int, suma_max: int):
+        return self.iterar_rango((suma_min,), (suma_max + 1,))
+
+# Autocompletar: palabras que empiezan con 'prefijo' (orden alfabético, perezoso).
+    def con_prefijo(self, prefijo: str):
+        return self.prefijos.con_prefijo(prefijo)
+
+# Consulta por lotes: todas las claves objetivo ordenadas se resuelven en un solo descenso
+# compartido. En cada nodo, bisect parte el rango de objetivos en los que van a la izquierda,
+# el que coincide y los que van a la derecha; los prefijos comunes se recorren una sola vez.
+# Devuelve, en el orden de 'palabras', tuplas (nodo | None, profundidad | None, camino).
+# 'camino' es None si no se pidió con_caminos, y [] si la palabra no está.
+    def buscar_lote(self, palabras: list[str], con_caminos: bool = False):
+        claves = [(calcular_suma_ascii(p), _norm(p)) for p in palabras]
+        objetivos = sorted(set(claves))
+        encontrados = {}
+
+        pila = [(self.raiz, 0, len(objetivos), 0)] if self.raiz is not None and objetivos else []
+        while pila:
+            nodo, lo, hi, profundidad = pila.pop()
+            clave = nodo.clave
+            i = bisect_left(objetivos, clave, lo, hi)
+            j = i
+            if i < hi and objetivos[i] == clave:
+                encontrados[clave] = (nodo, profundidad)
+                j = i + 1
+            if lo < i and nodo.izquierda is not None:
+                pila.append((nodo.izquierda, lo, i, profundidad + 1))
+            if j < hi and nodo.derecha is not None:
+                pila.append((nodo.derecha, j, hi, profundidad + 1))
+
+        resultados = []
+        caminos = {}
+        for clave in claves:
+            nodo, profundidad = encontrados.get(clave, (None, None))
+            camino = None
+            if con_caminos:
+                if clave not in caminos:
+                    caminos[clave] = self.camino_a(nodo)
+                camino = caminos[clave]
+            resultados.append((nodo, profundidad, camino))
+        return resultados
 
 # Búsqueda en Profundidad Limitada (DLS) 
-    def dls(self, suma_objetivo: int, limite: int, palabra_objetivo: str | None = None):
+# traza: TRAZA_LISTA (por defecto, compatibilidad) devuelve la lista de (palabra, suma, nivel);
+#        TRAZA_NINGUNA no registra nada (recorrido = None, sin asignaciones por nodo visitado);
+#        TRAZA_CONTAR devuelve solo la cantidad de nodos visitados;
+#        una función f(palabra, suma, nivel) recibe cada visita en el momento (streaming)
+#        y el recorrido devuelto es la cantidad de visitas.
+    def dls(self, suma_objetivo: int, limite: int, palabra_objetivo: str | None = None,
+            traza=TRAZA_LISTA):
+        if self.cache is None or traza != TRAZA_LISTA:
+            return self._dls(suma_objetivo, limite, palabra_objetivo, traza)
+        clave = (suma_objetivo, None if palabra_objetivo is None else _norm(palabra_objetivo))
+        return self._con_cache((clave, limite, 'dls'), self._dls,
+                               suma_objetivo, limite, palabra_objetivo)
+
+    # Consulta la caché y, si falla, ejecuta la búsqueda y guarda el resultado.
+    def _con_cache(self, clave_cache, buscar, *args):
+        resultado = self.cache.obtener(clave_cache)
+        if resultado is not None:
+            return resultado
+        nodo, recorrido, camino = buscar(*args)
+        self.cache.guardar(clave_cache, nodo, recorrido, camino)
+        return nodo, recorrido, camino
+
+    def _dls(self, suma_objetivo: int, limite: int, palabra_objetivo: str | None = None,
+             traza=TRAZA_LISTA):
        
         if self.raiz is None:
-            return None, [], []
+            return None, _traza_vacia(traza), []
 
         clave_obj = None
         if palabra_objetivo is not None:
             clave_obj = (suma_objetivo, _norm(palabra_objetivo))
 
-        # La pila guarda tuplas (nodo, nivel, padre)
-        pila = [(self.raiz, 0, None)]
-        padres = {}          # para reconstruir el camino
-        visitados = set()    # evita reprocesar el mismo nodo
-        recorrido = []       # traza del orden de visita
-
-        while pila:
-            nodo, nivel, padre = pila.pop()
-
-            if nodo is None or nodo in visitados:
-                continue
-
-            visitados.add(nodo)
-            padres[nodo] = padre
-            recorrido.append((nodo.palabra, nodo.suma_ascii, nivel))
+        en_lista = traza == TRAZA_LISTA
+        avisar = traza if callable(traza) else None
+        contar = avisar is not None or traza == TRAZA_CONTAR
+        recorrido = [] if en_lista else None   # traza del orden de visita
+        visitas = 0
+
+        # Pila de nodos y pila de niveles en paralelo (sin tuplas por nodo). En un árbol cada
+        # nodo se apila una sola vez, así que no hace falta 'visitados', y el camino sale de
+        # los punteros 'padre' en lugar de un diccionario 'padres'.
+        pila_nodos = [self.raiz]
+        pila_niveles = [0]
+
+        while pila_nodos:
+            nodo = pila_nodos.pop()
+            nivel = pila_niveles.pop()
+
+            if en_lista:
+                recorrido.append((nodo.palabra, nodo.suma_ascii, nivel))
+            elif contar:
+                visitas += 1
+                if avisar is not None:
+                    avisar(nodo.palabra, nodo.suma_ascii, nivel)
 
             # Si superamos el límite, no expandimos hijos.
             if nivel > limite:
@@ -103,33 +444,30 @@ class ArbolBST:
 
             # Comprobación de meta por clave exacta 
             if clave_obj is not None and nodo.clave == clave_obj:
-                # Reconstruir camino desde nodo hasta la raíz usando 'padres'
-                camino_nodos = []
-                cur = nodo
-                while cur is not None:
-                    camino_nodos.append(cur)
-                    cur = padres[cur]
-                camino_nodos.reverse()
-                camino = [(n.palabra, n.suma_ascii) for n in camino_nodos]
-                return nodo, recorrido, camino
+                return nodo, recorrido if en_lista else (visitas if contar else None), self.camino_a(nodo)
 
             # LIFo para apilar primero derecha y luego izquierda
             # para visitar antes la izquierda en el pop siguiente
             if nivel < limite:
                 if nodo.derecha:
-                    pila.append((nodo.derecha, nivel + 1, nodo))
+                    pila_nodos.append(nodo.derecha)
+                    pila_niveles.append(nivel + 1)
                 if nodo.izquierda:
-                    pila.append((nodo.izquierda, nivel + 1, nodo))
+                    pila_nodos.append(nodo.izquierda)
+                    pila_niveles.append(nivel + 1)
 
-        return None, recorrido, []
+        return None, recorrido if en_lista else (visitas if contar else None), []
 
     # Búsqueda en Profundidad Iterativa (
-
+# traza: como en dls. Con TRAZA_LISTA se respeta acumular_recorridos (comportamiento original);
+# con otro modo, la función recibe (palabra, suma, nivel, límite) y TRAZA_CONTAR suma
+# las visitas de todas las iteraciones.
     def iddfs(self,suma_objetivo: int,limite_inicial: int,
             paso: int,
             limite_max: int | None,
             palabra_objetivo: str | None = None,
-            acumular_recorridos: bool = False):
+            acumular_recorridos: bool = False,
+            traza=TRAZA_LISTA):
   
         if paso is None or paso <= 0:
             paso = 1
@@ -140,22 +478,40 @@ class ArbolBST:
         else:
             limite_max = max(0, limite_max)
 
-        if self.raiz is None:
-            return None, [], []
+        if self.cache is None or traza != TRAZA_LISTA:
+            return self._iddfs(suma_objetivo, limite_inicial, paso, limite_max,
+                               palabra_objetivo, acumular_recorridos, traza)
+        clave = (suma_objetivo, None if palabra_objetivo is None else _norm(palabra_objetivo))
+        modo = ('iddfs', limite_inicial, paso, acumular_recorridos)
+        return self._con_cache((clave, limite_max, modo), self._iddfs, suma_objetivo, limite_inicial,
+                               paso, limite_max, palabra_objetivo, acumular_recorridos)
+
+    def _iddfs(self, suma_objetivo: int, limite_inicial: int, paso: int, limite_max: int,
+               palabra_objetivo: str | None, acumular_recorridos: bool, traza=TRAZA_LISTA):
 
-        recorrido_total = []
+        en_lista = traza == TRAZA_LISTA
+        if self.raiz is None or limite_inicial > limite_max:
+            return None, [] if en_lista else _traza_vacia(traza), []
+
+        recorrido_total = [] if en_lista else _traza_vacia(traza)
         nodo_encontrado = None
         camino_encontrado = []
 
-        if limite_inicial > limite_max:
-            return None, [], []
-
         for limite in range(limite_inicial, limite_max + 1, paso):
-            nodo, recorrido, camino = self.dls(
-                suma_objetivo, limite, palabra_objetivo
+            if en_lista:
+                traza_dls = TRAZA_LISTA if acumular_recorridos else TRAZA_NINGUNA
+            elif callable(traza):
+                traza_dls = lambda p, v, lvl, lim=limite: traza(p, v, lvl, lim)
+            else:
+                traza_dls = traza
+            nodo, recorrido, camino = self._dls(
+                suma_objetivo, limite, palabra_objetivo, traza_dls
             )
-            if acumular_recorridos:
-                recorrido_total.extend([(p, v, lvl, limite) for (p, v, lvl) in recorrido])
+            if en_lista:
+                if acumular_recorridos:
+                    recorrido_total.extend([(p, v, lvl, limite) for (p, v, lvl) in recorrido])
+            elif recorrido is not None:
+                recorrido_total += recorrido
 
             if nodo:
                 nodo_encontrado = nodo
@@ -164,6 +520,218 @@ class ArbolBST:
 
         return nodo_encontrado, recorrido_total, camino_encontrado
 
+    # IDDFS en una sola pasada: mismo nodo, camino y recorrido_total que iddfs(), pero sin
+    # repetir DLS por cada límite. Se guarda la frontera de cada nivel (nodos a profundidad d)
+    # y al subir el límite solo se expanden los niveles nuevos, así la meta se detecta en O(n)
+    # en lugar de O(n·h). Con acumular_recorridos=True, recorrido_total es un generador que
+    # produce la traza de cada límite al consumirlo (no se materializa); debe recorrerse
+    # antes de modificar el árbol.
+    def iddfs_incremental(self, suma_objetivo: int, limite_inicial: int,
+                          paso: int,
+                          limite_max: int | None,
+                          palabra_objetivo: str | None = None,
+                          acumular_recorridos: bool = False):
+
+        if paso is None or paso <= 0:
+            paso = 1
+        if limite_inicial is None or limite_inicial < 0:
+            limite_inicial = 0
+        if limite_max is None:
+            limite_max = self.altura()
+        else:
+            limite_max = max(0, limite_max)
+
+        if self.raiz is None or limite_inicial > limite_max:
+            return None, [], []
+
+        clave_obj = None
+        if palabra_objetivo is not None:
+            clave_obj = (suma_objetivo, _norm(palabra_objetivo))
+
+        frontera = [self.raiz]      # nodos del nivel 'nivel'
+        nivel = 0
+        encontrado = None
+        limite_final = limite_max    # último límite que se habría ejecutado
+        if clave_obj is not None:
+            for limite in range(limite_inicial, limite_max + 1, paso):
+                # expandir solo los niveles que este límite agrega
+                while nivel <= limite and frontera and encontrado is None:
+                    for nodo in frontera:
+                        if nodo.clave == clave_obj:
+                            encontrado = nodo
+                            break
+                    else:
+                        siguiente = []
+                        for nodo in frontera:
+                            if nodo.izquierda:
+                                siguiente.append(nodo.izquierda)
+                            if nodo.derecha:
+                                siguiente.append(nodo.derecha)
+                        frontera = siguiente
+                        nivel += 1
+                if encontrado is not None:
+                    limite_final = limite
+                    break
+
+        if acumular_recorridos:
+            ultimo = limite_final if encontrado is not None else None
+            recorrido_total = self._trazas_iddfs(limite_inicial, paso, limite_max, encontrado, ultimo)
+        else:
+            recorrido_total = []
+        if encontrado is None:
+            return None, recorrido_total, []
+        return encontrado, recorrido_total, self.camino_a(encontrado)
+
+    # Traza perezosa de iddfs_incremental: para cada límite, el preorden (izquierda primero)
+    # de los nodos con nivel <= límite, igual que el 'recorrido' de dls. En el límite donde
+    # se encontró la meta, la traza termina en ella.
+    def _trazas_iddfs(self, limite_inicial: int, paso: int, limite_max: int,
+                      meta: NodoBST | None, limite_meta: int | None):
+        for limite in range(limite_inicial, limite_max + 1, paso):
+            pila = [(self.raiz, 0)]
+            while pila:
+                nodo, nivel = pila.pop()
+                yield nodo.palabra, nodo.suma_ascii, nivel, limite
+                if limite == limite_meta and nodo is meta:
+                    return
+                if nivel < limite:
+                    if nodo.derecha:
+                        pila.append((nodo.derecha, nivel + 1))
+                    if nodo.izquierda:
+                        pila.append((nodo.izquierda, nivel + 1))
+            if limite == limite_meta:
+                return
+
+
+# ============================================================
+#                  VARIANTE AUTO-BALANCEADA (AVL)
+# ============================================================
+
+class NodoAVL(NodoBST):
+
+    __slots__ = ('altura',)
+
+    # igual que NodoBST, más la altura del subárbol para calcular el factor de balance
+    def __init__(self, suma_ascii: int, palabra: str, significado: str | None = None,
+                 palabra_norm: str | None = None):
+        super().__init__(suma_ascii, palabra, significado, palabra_norm)
+        self.altura = 0
+
+
+def _h(nodo: NodoAVL | None) -> int:
+    return nodo.altura if nodo is not None else -1
+
+
+# Árbol AVL: misma interfaz que ArbolBST (insertar/dls/iddfs/altura) más eliminar.
+# Garantiza altura O(log n) para cualquier orden de inserción, sin reconstruir.
+class ArbolAVL(ArbolBST):
+
+    clase_nodo = NodoAVL
+
+    def insertar(self, suma_ascii: int, palabra: str, significado: str | None = None) -> None:
+        nuevo = self.clase_nodo(suma_ascii, palabra, significado)
+        if nuevo.clave in self.indice:
+            return
+        if self.raiz is None:
+            self.raiz = nuevo
+        else:
+            self._insertar_iter(self.raiz, nuevo)
+            self._rebalancear_desde(nuevo.padre)
+        self.indice[nuevo.clave] = nuevo
+        self.prefijos.agregar(nuevo)
+        self._invalidar_cache()
+
+    # Elimina la palabra (si existe). Devuelve True si se eliminó.
+    def eliminar(self, palabra: str, suma_ascii: int | None = None) -> bool:
+        nodo = self.buscar(palabra, suma_ascii)
+        if nodo is None:
+            return False
+        del self.indice[nodo.clave]
+        self.prefijos.quitar(nodo)
+        self._invalidar_cache()
+
+        if nodo.izquierda is not None and nodo.derecha is not None:
+            # reemplazar por el sucesor in-order (mínimo del subárbol derecho)
+            suc = nodo.derecha
+            while suc.izquierda is not None:
+                suc = suc.izquierda
+            if suc.padre is not nodo:
+                inicio = suc.padre
+                self._trasplantar(suc, suc.derecha)
+                suc.derecha = nodo.derecha
+                suc.derecha.padre = suc
+            else:
+                inicio = suc
+            self._trasplantar(nodo, suc)
+            suc.izquierda = nodo.izquierda
+            suc.izquierda.padre = suc
+        else:
+            inicio = nodo.padre
+            self._trasplantar(nodo, nodo.izquierda or nodo.derecha)
+
+        nodo.izquierda = nodo.derecha = nodo.padre = None
+        self._rebalancear_desde(inicio)
+        return True
+
+    def altura(self) -> int:
+        return _h(self.raiz)
+
+    # En la carga masiva los subárboles difieren en a lo sumo un nodo: ya están balanceados.
+    @staticmethod
+    def _preparar_nodo_bulk(nodo: NodoAVL, tam_subarbol: int) -> None:
+        nodo.altura = tam_subarbol.bit_length() - 1
+
+    # Sustituye el subárbol 'viejo' por 'nuevo' en el padre de 'viejo'.
+    def _trasplantar(self, viejo: NodoAVL, nuevo: NodoAVL | None) -> None:
+        padre = viejo.padre
+        if padre is None:
+            self.raiz = nuevo
+        elif padre.izquierda is viejo:
+            padre.izquierda = nuevo
+        else:
+            padre.derecha = nuevo
+        if nuevo is not None:
+            nuevo.padre = padre
+
+    def _rotar_izquierda(self, x: NodoAVL) -> NodoAVL:
+        y = x.derecha
+        x.derecha = y.izquierda
+        if y.izquierda is not None:
+            y.izquierda.padre = x
+        self._trasplantar(x, y)
+        y.izquierda = x
+        x.padre = y
+        x.altura = 1 + max(_h(x.izquierda), _h(x.derecha))
+        y.altura = 1 + max(_h(y.izquierda), _h(y.derecha))
+        return y
+
+    def _rotar_derecha(self, x: NodoAVL) -> NodoAVL:
+        y = x.izquierda
+        x.izquierda = y.derecha
+        if y.derecha is not None:
+            y.derecha.padre = x
+        self._trasplantar(x, y)
+        y.derecha = x
+        x.padre = y
+        x.altura = 1 + max(_h(x.izquierda), _h(x.derecha))
+        y.altura = 1 + max(_h(y.izquierda), _h(y.derecha))
+        return y
+
+    # Sube hasta la raíz actualizando alturas y rotando donde el balance sale de [-1, 1].
+    def _rebalancear_desde(self, nodo: NodoAVL | None) -> None:
+        while nodo is not None:
+            nodo.altura = 1 + max(_h(nodo.izquierda), _h(nodo.derecha))
+            balance = _h(nodo.izquierda) - _h(nodo.derecha)
+            if balance > 1:
+                if _h(nodo.izquierda.izquierda) < _h(nodo.izquierda.derecha):
+                    self._rotar_izquierda(nodo.izquierda)
+                nodo = self._rotar_derecha(nodo)
+            elif balance < -1:
+                if _h(nodo.derecha.derecha) < _h(nodo.derecha.izquierda):
+                    self._rotar_derecha(nodo.derecha)
+                nodo = self._rotar_izquierda(nodo)
+            nodo = nodo.padre
+
 
 
 def calcular_suma_ascii(palabra: str) -> int:
@@ -189,45 +757,58 @@ def _orden_insercion_balanceada(tuplas_ordenadas: list[tuple[int, str, str]]):
     rec(0, len(tuplas_ordenadas) - 1)
     return [tuplas_ordenadas[i] for i in indices]
 # Devuelve la lista balanceada en memoria: [(suma_ascii, palabra_norm, 'palabra : significado')]
+# Expresiones de limpieza (compiladas una vez, se usan en cada línea del texto fuente)
+_RE_PARENTESIS = re.compile(r'\([^)]*\)')
+_RE_NO_ALFABETICO = re.compile(r'[^a-zA-ZáéíóúÁÉÍÓÚñÑ\s]')
+
+# Limpia una línea 'palabra : significado' del texto fuente.
+# Devuelve (suma_ascii, palabra_norm, 'palabra : significado') o None si la línea no sirve.
+def _limpiar_linea(linea: str) -> tuple[int, str, str] | None:
+    linea = linea.strip()
+    if not linea or ':' not in linea:
+        return None
+
+    palabra_original, significado = linea.split(':', 1)
+    palabra_original = palabra_original.strip()
+    # elimina paréntesis y su contenido del significado (limpieza visual)
+    significado = _RE_PARENTESIS.sub('', significado.strip())
+
+    # filtra caracteres no alfabéticos en la palabra
+    palabra_limpia = _RE_NO_ALFABETICO.sub('', palabra_original)
+    tokens = palabra_limpia.split()
+    if not tokens:
+        return None
+
+    palabra = tokens[0]           # primera palabra como clave
+    return calcular_suma_ascii(palabra), _norm(palabra), f"{palabra} : {significado}"
+
+# Generador: recorre el archivo línea a línea (sin cargarlo entero) y produce las tuplas limpias,
+# sin duplicados (gana la primera aparición de cada palabra normalizada).
+def _leer_registros_unicos(f):
+    vistos = set()  # evita duplicados 
+    for linea in f:
+        registro = _limpiar_linea(linea)
+        if registro is None or registro[1] in vistos:
+            continue
+        vistos.add(registro[1])
+        yield registro
+
 def normalizar_y_generar_balanceado(archivo_entrada: str, archivo_salida_balanceado: str) -> list[tuple[int, str, str]]:
     try:
         with open(archivo_entrada, 'r', encoding='utf-8') as f:
-            lineas_in = f.readlines()
+            tuplas = list(_leer_registros_unicos(f))
     except FileNotFoundError:
         print(f"Error: no se encontró el archivo {archivo_entrada}")
         return []
 
-    lineas_limpias = []
-    vistos = set()  # evita duplicados 
-
-    for linea in lineas_in:
-        linea = linea.strip()
-        if not linea or ':' not in linea:
-            continue
-
-        palabra_original, significado = linea.split(':', 1)
-        palabra_original = palabra_original.strip()
-        # elimina paréntesis y su contenido del significado (limpieza visual)
-        significado = re.sub(r'\([^)]*\)', '', significado.strip())
+    return _ordenar_y_escribir_balanceado(tuplas, archivo_salida_balanceado)
 
-        # filtra caracteres no alfabéticos en la palabra
-        palabra_limpia = re.sub(r'[^a-zA-ZáéíóúÁÉÍÓÚñÑ\s]', '', palabra_original)
-        tokens = palabra_limpia.split()
-        if not tokens:
-            continue
 
-        palabra = tokens[0]           # primera palabra como clave
-        clave_norm = _norm(palabra)
-        if clave_norm in vistos:
-            continue
-        vistos.add(clave_norm)
-        lineas_limpias.append(f"{palabra} : {significado}")
-
-    # arma tuplas (suma, palabra_norm, linea) y ordena
-    tuplas = []
-    for linea in lineas_limpias:
-        palabra = linea.split(':', 1)[0].strip()
-        tuplas.append((calcular_suma_ascii(palabra), _norm(palabra), linea))
+# Ordena las tuplas limpias, las pasa a orden de "medianas" y escribe el archivo balanceado.
+# (compartido con la normalización en paralelo)
+def _ordenar_y_escribir_balanceado(tuplas: list[tuple[int, str, str]],
+                                   archivo_salida_balanceado: str) -> list[tuple[int, str, str]]:
+    # ordena por (suma, palabra_norm)
     tuplas.sort(key=lambda t: (t[0], t[1]))
 
     # genera orden de "medianas" para inserción balanceada
@@ -272,9 +853,11 @@ def leer_lista_desde_archivo_balanceado(archivo: str) -> list[tuple[int, str, st
 
 # Costruciion del árbol desde la lista balanceada
 
-def construir_arbol_desde_lista(lista_balanceada: list[tuple[int, str, str]]) -> ArbolBST:
+# clase_arbol permite construir también un ArbolAVL con la misma lista.
+def construir_arbol_desde_lista(lista_balanceada: list[tuple[int, str, str]],
+                                clase_arbol: type[ArbolBST] = ArbolBST) -> ArbolBST:
   
-    arbol = ArbolBST()
+    arbol = clase_arbol()
 
     for suma, _, linea in lista_balanceada:
         # linea debe traer "palabra : significado"
@@ -300,7 +883,10 @@ def construir_arbol_balanceado_auto(lista_balanceada_mem: list[tuple[int, str, s
     #Si no, pide la ruta del archivo balanceado y lo carga.
     
     if lista_balanceada_mem:
-        return construir_arbol_desde_lista(lista_balanceada_mem)
+        # la lista en memoria viene de normalizar_y_generar_balanceado: orden de medianas garantizado
+        arbol = ArbolBST.desde_medianas(lista_balanceada_mem)
+        print("Árbol construido (carga masiva en orden balanceado).")
+        return arbol
 
     print("\nNo hay lista balanceada en memoria. Se requiere el archivo balanceado.")
     ruta_arch = input("Ruta del archivo BALANCEADO: ").strip()
@@ -330,17 +916,31 @@ def buscar_interactivo(arbol: ArbolBST) -> None:
             return
 
         suma_obj = calcular_suma_ascii(pal)
-        lim = int(input("Ingrese la profundidad máxima de búsqueda: "))
 
-        #  DLS con el límite ingresado por el usuario
-        nodo, recorrido, camino = arbol.dls(suma_obj, lim, pal)
+        # Modo directo (por defecto): una consulta al índice hash, sin traza.
+        modo = input("¿Búsqueda con traza DLS/IDDFS? (s/N): ").strip().lower()
+        if modo not in ('s', 'si', 'sí'):
+            nodo = arbol.buscar(pal, suma_obj)
+            if nodo is None:
+                print(f"\nNo se encontró '{pal}' (suma {suma_obj}).")
+                return
+            print("\nCamino raíz → objetivo:")
+            print("  " + " -> ".join(f"{p}({v})" for p, v in arbol.camino_a(nodo)))
+            print(f"\nEncontrado: '{nodo.palabra}' | Suma ASCII: {nodo.suma_ascii}")
+            if getattr(nodo, 'significado', None):
+                print(f"Significado: {nodo.significado}")
+            return
 
+        lim = int(input("Ingrese la profundidad máxima de búsqueda: "))
+
+        #  DLS con el límite ingresado por el usuario; cada visita se imprime al ocurrir
         print("\nRecorrido con límite inicial:")
-        if not recorrido:
+        nodo, visitas, camino = arbol.dls(
+            suma_obj, lim, pal,
+            traza=lambda p, v, nivel: print(f"  - {p} (ASCII={v}, nivel={nivel})")
+        )
+        if not visitas:
             print("  (sin visitas)")
-        else:
-            for p, v, nivel in recorrido:
-                print(f"  - {p} (ASCII={v}, nivel={nivel})")
 
         if nodo:
             print("\nCamino raíz → objetivo:")
@@ -355,7 +955,8 @@ def buscar_interactivo(arbol: ArbolBST) -> None:
         print("Aplicando búsqueda en profundidad iterativa (IDDFS)...")
 
         limite_max = arbol.altura()  
-        nodo2, recorrido_total, camino2 = arbol.iddfs(
+        # versión en una pasada: misma salida que iddfs(), traza generada al imprimir
+        nodo2, recorrido_total, camino2 = arbol.iddfs_incremental(
             suma_objetivo=suma_obj,
             limite_inicial=lim + 1,
             paso=1,
@@ -386,7 +987,7 @@ def mostrar_menu() -> None:
     print("=" * 58)
     print("1) Normalizar y generar diccionario BALANCEADO (1 archivo)")
     print("2) Construir árbol y Visualizar")
-    print("3) Buscar en el árbol (DLS o IDDFS)")
+    print("3) Buscar en el árbol (directa, DLS o IDDFS)")
     print("4) Salir")
     print("=" * 58)
 
@@ -407,7 +1008,10 @@ def main() -> None:
         elif opcion == '2':
             arbol = construir_arbol_balanceado_auto(lista_balanceada_mem)
             if arbol is not None:
-                # Reutiliza tu visualizador externo
+                # Reutiliza tu visualizador externo. Se importa acá porque trae tkinter:
+                # los módulos que solo usan el árbol (servidor, exportar_arbol, snapshot,
+                # normalizadores) tienen que poder importar main sin interfaz gráfica.
+                from visualizador import mostrar_arbol_async
                 mostrar_arbol_async(arbol, titulo="Árbol BST balanceado")
 
         elif opcion == '3':
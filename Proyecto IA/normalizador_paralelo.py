@@ -0,0 +1,73 @@
+# normalizador_paralelo.py
+# Versión multi-proceso de normalizar_y_generar_balanceado.
+# El archivo fuente se divide en rangos de bytes que terminan en un salto de línea;
+# cada proceso limpia su rango (regex, split, _norm, suma ASCII) y el proceso principal
+# junta los resultados EN ORDEN DE ARCHIVO, así que "gana la primera aparición" igual que en serie.
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from main import _leer_registros_unicos, _ordenar_y_escribir_balanceado
+
+TAM_MIN_RANGO = 1 << 20   # 1 MiB: por debajo de esto no compensa repartir
+RANGOS_POR_TRABAJADOR = 4  # más rangos que procesos para repartir mejor la carga
+
+
+# Divide [0, tamaño) en rangos cuyos cortes caen justo después de un '\n'.
+def _rangos_por_lineas(ruta: str, cantidad: int) -> list[tuple[int, int]]:
+    tam = os.path.getsize(ruta)
+    if tam == 0:
+        return []
+    paso = max(TAM_MIN_RANGO, tam // max(1, cantidad))
+    rangos = []
+    inicio = 0
+    with open(ruta, 'rb') as f:
+        while inicio < tam:
+            corte = inicio + paso
+            if corte >= tam:
+                corte = tam
+            else:
+                f.seek(corte)
+                f.readline()          # avanza hasta el final de la línea en curso
+                corte = f.tell()
+            rangos.append((inicio, corte))
+            inicio = corte
+    return rangos
+
+
+# Trabajo de cada proceso: limpia las líneas del rango y quita duplicados dentro del rango.
+# Las líneas se leen con TextIOWrapper para tener los mismos saltos de línea universales que open().
+def _limpiar_rango(ruta: str, inicio: int, fin: int) -> list[tuple[int, str, str]]:
+    with open(ruta, 'rb') as f:
+        f.seek(inicio)
+        datos = f.read(fin - inicio)
+    with io.TextIOWrapper(io.BytesIO(datos), encoding='utf-8') as texto:
+        return list(_leer_registros_unicos(texto))
+
+
+# Misma salida (archivo y lista) que normalizar_y_generar_balanceado, repartiendo la limpieza
+# entre 'trabajadores' procesos (por defecto, uno por CPU).
+def normalizar_y_generar_balanceado_paralelo(archivo_entrada: str, archivo_salida_balanceado: str,
+                                             trabajadores: int | None = None) -> list[tuple[int, str, str]]:
+    if trabajadores is None or trabajadores <= 0:
+        trabajadores = os.cpu_count() or 1
+    try:
+        rangos = _rangos_por_lineas(archivo_entrada, trabajadores * RANGOS_POR_TRABAJADOR)
+    except FileNotFoundError:
+        print(f"Error: no se encontró el archivo {archivo_entrada}")
+        return []
+
+    tuplas = []
+    vistos = set()
+    with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+        # map conserva el orden de los rangos: se recorren en el mismo orden que el archivo
+        resultados = ejecutor.map(_limpiar_rango, [archivo_entrada] * len(rangos),
+                                  [ini for ini, _ in rangos], [fin for _, fin in rangos])
+        for resultado in resultados:
+            for registro in resultado:
+                if registro[1] in vistos:
+                    continue
+                vistos.add(registro[1])
+                tuplas.append(registro)
+
+    return _ordenar_y_escribir_balanceado(tuplas, archivo_salida_balanceado)
@@ -0,0 +1,186 @@
+# normalizador_streaming.py
+# Versión por flujo de normalizar_y_generar_balanceado para textos fuente más grandes que la RAM.
+# Nunca tiene el corpus completo en memoria: limpia línea a línea, escribe "runs" ordenados
+# en archivos temporales y los fusiona (k-way merge) eliminando duplicados durante la fusión.
+#
+# Fases:
+#   1) runs ordenados por (palabra_norm, n° de línea) -> fusión: gana la primera aparición
+#      de cada palabra normalizada (misma regla que la versión en memoria)
+#   2) runs ordenados por (suma_ascii, palabra_norm) -> fusión: archivo ordenado + índice de offsets
+#   3) recorrido de "medianas" (preorden de los rangos) leyendo el ordenado mediante mmap
+#
+# La memoria pico queda acotada por 'registros_por_run' (registros en el buffer de cada run)
+# y por 'max_runs_abiertos' (archivos fusionados a la vez).
+import heapq
+import mmap
+import os
+import tempfile
+from array import array
+from itertools import islice
+
+from main import _limpiar_linea
+
+REGISTROS_POR_RUN = 200_000
+MAX_RUNS_ABIERTOS = 64
+
+
+# ---------- Runs en disco ----------
+# Cada registro es una línea con campos separados por tabulador; la línea 'palabra : significado'
+# va al final (la palabra limpia no tiene tabuladores y la línea ya viene sin saltos).
+def _escribir_run(registros: list[tuple], directorio: str) -> str:
+    registros.sort()
+    fd, ruta = tempfile.mkstemp(suffix='.run', dir=directorio)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for reg in registros:
+            f.write('\t'.join(map(str, reg)))
+            f.write('\n')
+    return ruta
+
+
+def _leer_run(ruta: str, parsear):
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            yield parsear(linea.rstrip('\n'))
+
+
+# Fase 1: (palabra_norm, n° de línea, suma, linea)
+def _parsear_fase1(texto: str) -> tuple[str, int, int, str]:
+    norm, seq, suma, linea = texto.split('\t', 3)
+    return norm, int(seq), int(suma), linea
+
+
+# Fase 2: (suma, palabra_norm, linea)
+def _parsear_fase2(texto: str) -> tuple[int, str, str]:
+    suma, norm, linea = texto.split('\t', 2)
+    return int(suma), norm, linea
+
+
+# Fusiona los runs en un solo iterador ordenado. Si hay más de 'max_abiertos',
+# primero los agrupa en pasadas intermedias para no abrir demasiados archivos a la vez.
+def _fusionar_runs(rutas: list[str], parsear, directorio: str, max_abiertos: int):
+    rutas = list(rutas)
+    while len(rutas) > max_abiertos:
+        nuevas = []
+        for i in range(0, len(rutas), max_abiertos):
+            grupo = rutas[i:i + max_abiertos]
+            fd, ruta = tempfile.mkstemp(suffix='.run', dir=directorio)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for reg in heapq.merge(*(_leer_run(r, parsear) for r in grupo)):
+                    f.write('\t'.join(map(str, reg)))
+                    f.write('\n')
+            for r in grupo:
+                os.remove(r)
+            nuevas.append(ruta)
+        rutas = nuevas
+    return heapq.merge(*(_leer_run(r, parsear) for r in rutas))
+
+
+# Corta un iterador en runs ordenados de a lo sumo 'tam' registros.
+def _generar_runs(registros, tam: int, directorio: str) -> list[str]:
+    rutas = []
+    while True:
+        bloque = list(islice(registros, tam))
+        if not bloque:
+            return rutas
+        rutas.append(_escribir_run(bloque, directorio))
+
+
+# ---------- Fases ----------
+def _registros_fase1(f):
+    for seq, linea in enumerate(f):
+        registro = _limpiar_linea(linea)
+        if registro is not None:
+            suma, norm, limpia = registro
+            yield norm, seq, suma, limpia
+
+
+# La fusión llega ordenada por (norm, seq): el primero de cada norm es su primera aparición.
+def _unicos_fase1(fusion):
+    anterior = None
+    for norm, _, suma, linea in fusion:
+        if norm == anterior:
+            continue
+        anterior = norm
+        yield suma, norm, linea
+
+
+def _escribir_ordenado(fusion, ruta_datos: str, ruta_offsets: str) -> int:
+    n = 0
+    offsets = array('q')
+    with open(ruta_datos, 'wb') as fd, open(ruta_offsets, 'wb') as fo:
+        pos = 0
+        anterior = None
+        for suma, norm, linea in fusion:
+            if (suma, norm) == anterior:   # por si quedara algún duplicado exacto
+                continue
+            anterior = (suma, norm)
+            datos = f"{linea} (Suma ASCII: {suma})\n".encode('utf-8')
+            offsets.append(pos)
+            fd.write(datos)
+            pos += len(datos)
+            n += 1
+            if len(offsets) >= 65536:
+                offsets.tofile(fo)
+                del offsets[:]
+        offsets.append(pos)   # fin del último registro
+        offsets.tofile(fo)
+    return n
+
+
+# Escribe los registros en orden de "medianas" (mismo orden que _orden_insercion_balanceada)
+# leyendo por índice desde el archivo ordenado mapeado en memoria.
+def _escribir_medianas(ruta_datos: str, ruta_offsets: str, n: int, archivo_salida: str) -> None:
+    with open(archivo_salida, 'wb') as out:
+        if n == 0:
+            return
+        with open(ruta_datos, 'rb') as fd, open(ruta_offsets, 'rb') as fo:
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as datos, \
+                    mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ) as mm_off:
+                offsets = memoryview(mm_off).cast('q')
+                pila = [(0, n - 1)]
+                while pila:
+                    lo, hi = pila.pop()
+                    mid = (lo + hi) // 2
+                    out.write(datos[offsets[mid]:offsets[mid + 1]])
+                    if mid < hi:
+                        pila.append((mid + 1, hi))
+                    if lo < mid:
+                        pila.append((lo, mid - 1))
+                offsets.release()
+
+
+# Misma salida que normalizar_y_generar_balanceado, pero por flujo y con memoria acotada.
+# Devuelve la cantidad de palabras únicas escritas (no la lista, que no se guarda en memoria).
+def normalizar_y_generar_balanceado_streaming(archivo_entrada: str, archivo_salida_balanceado: str,
+                                              registros_por_run: int = REGISTROS_POR_RUN,
+                                              max_runs_abiertos: int = MAX_RUNS_ABIERTOS,
+                                              dir_temporal: str | None = None) -> int:
+    registros_por_run = max(1, registros_por_run)
+    max_runs_abiertos = max(2, max_runs_abiertos)
+    try:
+        entrada = open(archivo_entrada, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Error: no se encontró el archivo {archivo_entrada}")
+        return 0
+
+    with tempfile.TemporaryDirectory(dir=dir_temporal) as tmp:
+        with entrada:
+            runs1 = _generar_runs(_registros_fase1(entrada), registros_por_run, tmp)
+
+        unicos = _unicos_fase1(_fusionar_runs(runs1, _parsear_fase1, tmp, max_runs_abiertos))
+        runs2 = _generar_runs(unicos, registros_por_run, tmp)
+
+        ruta_datos = os.path.join(tmp, 'ordenado.txt')
+        ruta_offsets = os.path.join(tmp, 'ordenado.idx')
+        n = _escribir_ordenado(_fusionar_runs(runs2, _parsear_fase2, tmp, max_runs_abiertos),
+                               ruta_datos, ruta_offsets)
+
+        try:
+            _escribir_medianas(ruta_datos, ruta_offsets, n, archivo_salida_balanceado)
+        except OSError as e:
+            print(f"Error al escribir el archivo balanceado: {e}")
+            return n
+
+    print(f"Archivo BALANCEADO guardado como: {archivo_salida_balanceado}")
+    print(f"Palabras únicas: {n}")
+    return n
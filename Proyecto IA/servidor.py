@@ -0,0 +1,236 @@
+# servidor.py
+# Servidor local de consultas sobre el árbol del diccionario (asyncio, TCP o socket Unix).
+# Protocolo: una petición JSON por línea y una respuesta JSON por línea.
+#
+#   {"id": 1, "op": "buscar", "palabra": "perro", "con_camino": true}
+#   {"id": 2, "op": "lote", "palabras": ["perro", "gato"], "con_caminos": false}
+#   {"id": 3, "op": "dls", "palabra": "perro", "limite": 3}
+#   {"id": 4, "op": "iddfs", "palabra": "perro", "limite_inicial": 0, "paso": 1,
+#              "limite_max": null, "acumular": true}
+#   {"id": 5, "op": "prefijo", "prefijo": "pe", "max": 20}
+#   {"id": 6, "op": "rango", "suma_min": 500, "suma_max": 520, "max": 100}
+#   {"id": 7, "op": "recargar", "balanceado": "dicc.txt"}   (o "snapshot": "dicc.snap")
+#   {"id": 8, "op": "estado"}
+#
+# Respuesta: {"id": ..., "ok": true, "resultado": ...} o {"id": ..., "ok": false, "error": "..."}
+#
+# El árbol se carga una vez y se comparte entre todas las conexiones. "recargar" construye el
+# árbol nuevo en un hilo aparte y luego cambia la referencia (read-copy-update): cada petición
+# toma la referencia vigente al empezar, así que los lectores nunca esperan a la recarga.
+import argparse
+import asyncio
+import json
+
+from arbol_compacto import ArbolCompacto
+from main import (ArbolBST, calcular_suma_ascii, construir_arbol_desde_lista,
+                  leer_lista_desde_archivo_balanceado)
+from snapshot import cargar_snapshot
+
+LIMITE_LINEA = 16 * 1024 * 1024   # las peticiones por lote pueden ser largas
+
+
+# Carga el árbol desde un archivo balanceado o desde un snapshot (devuelve None si falla).
+# El índice de prefijos se ordena acá, en el hilo que carga, y no en el primer "prefijo",
+# que se atiende en el bucle de eventos y frenaría a todas las conexiones.
+def cargar_arbol(balanceado: str | None = None, snapshot: str | None = None) -> ArbolBST | ArbolCompacto | None:
+    if snapshot:
+        return cargar_snapshot(snapshot)
+    if balanceado:
+        lista = leer_lista_desde_archivo_balanceado(balanceado)
+        if lista:
+            arbol = construir_arbol_desde_lista(lista)
+            arbol.prefijos.preparar()
+            return arbol
+    return None
+
+
+# ---------- Serialización de resultados ----------
+# ArbolBST devuelve objetos nodo; ArbolCompacto, índices enteros.
+def _describir(arbol, nodo) -> dict:
+    if nodo is None:
+        return {"encontrado": False}
+    if isinstance(arbol, ArbolCompacto):
+        return {"encontrado": True, "palabra": arbol.palabra(nodo),
+                "suma_ascii": arbol.suma[nodo], "significado": arbol.significado(nodo)}
+    return {"encontrado": True, "palabra": nodo.palabra,
+            "suma_ascii": nodo.suma_ascii, "significado": nodo.significado}
+
+
+def _op_buscar(arbol, pet: dict):
+    palabra = pet["palabra"]
+    nodo = arbol.buscar(palabra)
+    res = _describir(arbol, nodo)
+    if pet.get("con_camino") and nodo is not None:
+        res["camino"] = arbol.camino_a(nodo)
+    return res
+
+
+def _op_lote(arbol, pet: dict):
+    con_caminos = bool(pet.get("con_caminos"))
+    resultados = []
+    for nodo, profundidad, camino in arbol.buscar_lote(pet["palabras"], con_caminos):
+        res = _describir(arbol, nodo)
+        if nodo is not None:
+            res["profundidad"] = profundidad
+            if con_caminos:
+                res["camino"] = camino
+        resultados.append(res)
+    return resultados
+
+
+def _op_dls(arbol, pet: dict):
+    palabra = pet["palabra"]
+    nodo, recorrido, camino = arbol.dls(calcular_suma_ascii(palabra), int(pet["limite"]), palabra)
+    res = _describir(arbol, nodo)
+    res["recorrido"] = recorrido
+    res["camino"] = camino
+    return res
+
+
+def _op_iddfs(arbol, pet: dict):
+    palabra = pet["palabra"]
+    limite_max = pet.get("limite_max")
+    nodo, recorrido, camino = arbol.iddfs(
+        suma_objetivo=calcular_suma_ascii(palabra),
+        limite_inicial=int(pet.get("limite_inicial", 0)),
+        paso=int(pet.get("paso", 1)),
+        limite_max=None if limite_max is None else int(limite_max),
+        palabra_objetivo=palabra,
+        acumular_recorridos=bool(pet.get("acumular", False)),
+    )
+    res = _describir(arbol, nodo)
+    res["recorrido"] = recorrido
+    res["camino"] = camino
+    return res
+
+
+def _op_prefijo(arbol, pet: dict):
+    if not isinstance(arbol, ArbolBST):
+        raise ValueError("el árbol cargado (snapshot) no tiene índice de prefijos")
+    maximo = int(pet.get("max", 20))
+    res = []
+    for nodo in arbol.con_prefijo(pet["prefijo"]):
+        if len(res) >= maximo:
+            break
+        res.append(_describir(arbol, nodo))
+    return res
+
+
+def _op_rango(arbol, pet: dict):
+    if not isinstance(arbol, ArbolBST):
+        raise ValueError("el árbol cargado (snapshot) no admite consultas por rango")
+    maximo = int(pet.get("max", 100))
+    res = []
+    for nodo in arbol.rango_suma(int(pet["suma_min"]), int(pet["suma_max"])):
+        if len(res) >= maximo:
+            break
+        res.append(_describir(arbol, nodo))
+    return res
+
+
+# Operaciones rápidas: se atienden en el propio bucle de eventos (el índice de prefijos ya
+# viene ordenado desde cargar_arbol).
+_OPS_RAPIDAS = {"buscar": _op_buscar, "prefijo": _op_prefijo, "rango": _op_rango}
+# Operaciones que pueden recorrer mucho árbol: van a un hilo para no frenar al resto.
+_OPS_PESADAS = {"lote": _op_lote, "dls": _op_dls, "iddfs": _op_iddfs}
+
+
+class ServidorDiccionario:
+
+    def __init__(self, arbol: ArbolBST | ArbolCompacto):
+        self.arbol = arbol
+        self.generacion = 1          # se incrementa en cada recarga
+        self._lock_recarga = asyncio.Lock()
+
+    async def _recargar(self, pet: dict):
+        async with self._lock_recarga:
+            nuevo = await asyncio.to_thread(cargar_arbol, pet.get("balanceado"), pet.get("snapshot"))
+            if nuevo is None:
+                raise ValueError("no se pudo cargar el árbol nuevo")
+            # cambio atómico de referencia: las peticiones en curso siguen con el árbol anterior
+            self.arbol = nuevo
+            self.generacion += 1
+        return {"generacion": self.generacion, "nodos": _contar_nodos(nuevo), "altura": nuevo.altura()}
+
+    async def atender(self, pet: dict):
+        op = pet.get("op")
+        arbol = self.arbol           # referencia tomada una sola vez por petición
+        if op in _OPS_RAPIDAS:
+            return _OPS_RAPIDAS[op](arbol, pet)
+        if op in _OPS_PESADAS:
+            return await asyncio.to_thread(_OPS_PESADAS[op], arbol, pet)
+        if op == "recargar":
+            return await self._recargar(pet)
+        if op == "estado":
+            return {"generacion": self.generacion, "nodos": _contar_nodos(arbol), "altura": arbol.altura()}
+        raise ValueError(f"operación desconocida: {op!r}")
+
+    async def _conexion(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                pet_id = None
+                # cualquier error de una petición (datos inválidos, OverflowError en int(), un
+                # resultado que no se puede serializar...) vuelve como respuesta de error y la
+                # conexión sigue atendiendo
+                try:
+                    pet = json.loads(linea)
+                    if not isinstance(pet, dict):
+                        raise TypeError("la petición debe ser un objeto JSON")
+                    pet_id = pet.get("id")
+                    resp = {"id": pet_id, "ok": True, "resultado": await self.atender(pet)}
+                    datos = json.dumps(resp, ensure_ascii=False)
+                except Exception as e:
+                    resp = {"id": pet_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+                    datos = json.dumps(resp, ensure_ascii=False)
+                writer.write(datos.encode('utf-8') + b"\n")
+                await writer.drain()
+        except (OSError, ValueError):
+            # OSError: el cliente cortó la conexión (ConnectionResetError, BrokenPipeError...)
+            # ValueError: línea más larga que LIMITE_LINEA
+            pass
+        finally:
+            writer.close()
+
+    async def servir(self, host: str = "127.0.0.1", puerto: int = 8765, unix: str | None = None) -> None:
+        if unix:
+            servidor = await asyncio.start_unix_server(self._conexion, path=unix, limit=LIMITE_LINEA)
+            print(f"Servidor escuchando en {unix}")
+        else:
+            servidor = await asyncio.start_server(self._conexion, host, puerto, limit=LIMITE_LINEA)
+            print(f"Servidor escuchando en {host}:{puerto}")
+        async with servidor:
+            await servidor.serve_forever()
+
+
+# Cantidad de nodos: ArbolCompacto define len(); ArbolBST lleva la cuenta en su índice hash.
+def _contar_nodos(arbol) -> int:
+    return len(arbol) if isinstance(arbol, ArbolCompacto) else len(arbol.indice)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor de consultas del diccionario (JSON por línea).")
+    origen = parser.add_mutually_exclusive_group(required=True)
+    origen.add_argument("--balanceado", help="archivo BALANCEADO (palabra : significado)")
+    origen.add_argument("--snapshot", help="snapshot binario generado con snapshot.guardar_snapshot")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (en lugar de TCP)")
+    args = parser.parse_args()
+
+    arbol = cargar_arbol(args.balanceado, args.snapshot)
+    if arbol is None:
+        print("No se pudo cargar el árbol.")
+        return
+    try:
+        asyncio.run(ServidorDiccionario(arbol).servir(args.host, args.puerto, args.unix))
+    except KeyboardInterrupt:
+        print("Servidor detenido.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# snapshot.py
+# Guarda el árbol ya construido en un archivo binario versionado y lo vuelve a abrir
+# con mmap: el proceso no relee el texto fuente ni reconstruye nodos, y varios
+# procesos que cargan el mismo snapshot comparten las mismas páginas de memoria.
+#
+# Formato (little-endian):
+#   cabecera  : MAGIA, versión, n_nodos, n_cadenas, raíz, altura, largo del texto,
+#               sha256 del texto fuente y crc32 del resto del archivo
+#   arreglos  : inicios del pool de cadenas ((n_cadenas + 1) × int64, alineado a 8 bytes)
+#               suma, izq, der, padre, id_palabra, id_norm, id_significado (n × int32)
+#   texto     : pool de cadenas UTF-8
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from arbol_compacto import ArbolCompacto
+from main import ArbolBST
+
+MAGIA = b'DICCBST\0'
+VERSION = 2      # 2: inicios del pool en int64 (en la versión 1 eran int32)
+_CABECERA = struct.Struct('<8sHHIIiiQ32sI')
+_CAMPOS = ('suma', 'izq', 'der', 'padre', 'id_palabra', 'id_norm', 'id_significado')
+_SIN_HASH = b'\0' * 32
+
+
+# Hash del archivo de texto fuente, para detectar snapshots desactualizados.
+# Devuelve None si el archivo no existe.
+def hash_fuente(ruta: str) -> bytes | None:
+    h = hashlib.sha256()
+    try:
+        with open(ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(1 << 20), b''):
+                h.update(bloque)
+    except FileNotFoundError:
+        return None
+    return h.digest()
+
+
+def _en_little_endian(arreglo) -> bytes | memoryview:
+    if sys.byteorder == 'little':
+        return memoryview(arreglo).cast('B')
+    copia = array(memoryview(arreglo).format, arreglo)
+    copia.byteswap()
+    return copia.tobytes()
+
+
+# Escribe el snapshot. Acepta ArbolBST/ArbolAVL (se convierte) o ArbolCompacto.
+# Si se indica archivo_fuente, su hash queda en la cabecera (si no existe, se avisa y el
+# snapshot se guarda sin hash: al cargarlo con archivo_fuente se va a rechazar).
+def guardar_snapshot(arbol: ArbolBST | ArbolCompacto, ruta: str, archivo_fuente: str | None = None) -> None:
+    if not isinstance(arbol, ArbolCompacto):
+        arbol = ArbolCompacto.desde_arbol(arbol)
+
+    desp = arbol._desp_texto
+    n_cadenas = len(arbol.inicios) - 1
+    bloques = [_en_little_endian(arbol.inicios)]
+    bloques += [_en_little_endian(getattr(arbol, campo)) for campo in _CAMPOS]
+    bloques.append(arbol.texto[desp:desp + arbol.inicios[n_cadenas]])
+
+    crc = 0
+    for b in bloques:
+        crc = zlib.crc32(b, crc)
+    hash_txt = _SIN_HASH
+    if archivo_fuente:
+        hash_txt = hash_fuente(archivo_fuente)
+        if hash_txt is None:
+            print(f"No se encontró el archivo fuente {archivo_fuente}: el snapshot se guarda sin hash.")
+            hash_txt = _SIN_HASH
+    cabecera = _CABECERA.pack(MAGIA, VERSION, 0, len(arbol), n_cadenas, arbol.raiz,
+                              arbol.altura(), arbol.inicios[n_cadenas], hash_txt, crc)
+
+    # se escribe a un temporal y se renombra: quien esté cargando nunca ve un archivo a medias
+    tmp = ruta + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(cabecera)
+        for b in bloques:
+            f.write(b)
+    os.replace(tmp, ruta)
+
+
+# Abre el snapshot con mmap (solo lectura) y devuelve un ArbolCompacto que lee de él
+# (marcado solo_lectura: para insertar hay que pedir arbol.editable()).
+# Si se pasa archivo_fuente, se compara su hash con el guardado y un snapshot viejo se rechaza;
+# si el archivo fuente no existe, tampoco se puede verificar y el snapshot se rechaza.
+# Como el resto del programa, informa el problema y devuelve None.
+def cargar_snapshot(ruta: str, archivo_fuente: str | None = None,
+                    verificar_checksum: bool = True) -> ArbolCompacto | None:
+    try:
+        with open(ruta, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        print(f"No se encontró el snapshot: {ruta}")
+        return None
+    except ValueError:
+        print(f"Snapshot vacío: {ruta}")
+        return None
+
+    if len(mm) < _CABECERA.size:
+        print(f"Snapshot inválido (muy corto): {ruta}")
+        return None
+    magia, version, _, n, n_cadenas, raiz, altura, largo_texto, hash_txt, crc = \
+        _CABECERA.unpack_from(mm, 0)
+    if magia != MAGIA:
+        print(f"No es un snapshot de diccionario: {ruta}")
+        return None
+    if version != VERSION:
+        print(f"Versión de snapshot no soportada: {version} (se esperaba {VERSION})")
+        return None
+    fin = _CABECERA.size + 4 * len(_CAMPOS) * n + 8 * (n_cadenas + 1) + largo_texto
+    if len(mm) != fin:
+        print(f"Snapshot truncado o corrupto: {ruta}")
+        return None
+    if verificar_checksum and zlib.crc32(memoryview(mm)[_CABECERA.size:]) != crc:
+        print(f"Checksum incorrecto en el snapshot: {ruta}")
+        return None
+    if archivo_fuente is not None:
+        actual = hash_fuente(archivo_fuente)
+        if actual is None:
+            print(f"No se encontró el archivo fuente {archivo_fuente}: no se puede verificar el snapshot.")
+            return None
+        if hash_txt != actual:
+            print(f"Snapshot desactualizado: {archivo_fuente} cambió desde que se generó.")
+            return None
+
+    arbol = ArbolCompacto()
+    vista = memoryview(mm)
+    desp = _CABECERA.size
+    campos = [('inicios', n_cadenas + 1, 'q')] + [(c, n, 'i') for c in _CAMPOS]
+    for campo, cantidad, tipo in campos:
+        largo = cantidad * struct.calcsize(tipo)
+        datos = vista[desp:desp + largo].cast(tipo)
+        if sys.byteorder != 'little':
+            # en big-endian no se puede usar el mapeo tal cual: se copia e invierte
+            datos = array(tipo, datos)
+            datos.byteswap()
+        setattr(arbol, campo, datos)
+        desp += largo
+    arbol.texto = mm
+    arbol._desp_texto = desp
+    arbol.raiz = raiz
+    arbol._altura = altura
+    arbol._ids_cadena = None
+    arbol.solo_lectura = True
+    return arbol
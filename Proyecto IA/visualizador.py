@@ -2,55 +2,140 @@
 import tkinter as tk
 from tkinter import ttk
 import threading
-
-# ---------- Utilidades para medir el árbol ----------
-def _altura(nodo):
-    if nodo is None:
-        return 0
-    return 1 + max(_altura(nodo.izquierda), _altura(nodo.derecha))
-
-def _contar_nodos(nodo):
-    if nodo is None:
-        return 0
-    return 1 + _contar_nodos(nodo.izquierda) + _contar_nodos(nodo.derecha)
-
-# In-order para posicionar por columnas (x) y niveles (y)
-def _asignar_posiciones_inorder(nodo, nivel, dx, dy, margen_x, margen_y, col_ref, posiciones):
-    if nodo is None:
-        return
-    _asignar_posiciones_inorder(nodo.izquierda, nivel + 1, dx, dy, margen_x, margen_y, col_ref, posiciones)
-    x = margen_x + col_ref[0] * dx
-    y = margen_y + nivel * dy
-    posiciones[nodo] = (x, y)
-    col_ref[0] += 1
-    _asignar_posiciones_inorder(nodo.derecha, nivel + 1, dx, dy, margen_x, margen_y, col_ref, posiciones)
-
-def _formatear_etiqueta(nodo):
-    # Mostrar palabra(s) y valor: si es lista, mostramos primeras 2…
-    if isinstance(nodo.palabra, list):
-        if len(nodo.palabra) <= 2:
-            palabras = ", ".join(nodo.palabra)
-        else:
-            palabras = ", ".join(nodo.palabra[:2]) + "…"
-    else:
-        palabras = str(nodo.palabra)
-    # antes: return f"{palabras}\n{nodo.valor}"
-    return f"{palabras}\n{nodo.suma_ascii}"
+from array import array
+from bisect import bisect_left, bisect_right
+
+from layout_arbol import _asignar_posiciones_inorder, _formatear_etiqueta
+
+# ---------- Índice espacial del layout ----------
+# En el layout in-order la y depende solo del nivel y, dentro de un nivel, la x crece con el
+# orden in-order. Por eso el índice es una fila por nivel con las x ordenadas: una consulta
+# por rectángulo es un bisect por cada nivel que cae en el rango vertical.
+# Para el nivel de detalle, cada nodo guarda además la extensión de su subárbol:
+# [x_ini, x_fin] (primer y último nodo in-order), cantidad de nodos y niveles por debajo.
+class IndiceEspacial:
+
+    def __init__(self, raiz, dx, dy, margen_x, margen_y):
+        self.dx, self.dy = dx, dy
+        self.margen_x, self.margen_y = margen_x, margen_y
+
+        posiciones = {}
+        _asignar_posiciones_inorder(raiz, 0, dx, dy, margen_x, margen_y, [0], posiciones)
+        self.posiciones = posiciones
+
+        # filas por nivel, ya ordenadas por x porque 'posiciones' está en orden in-order
+        filas = []
+        for nodo, (_, y) in posiciones.items():
+            nivel = round((y - margen_y) / dy)
+            while len(filas) <= nivel:
+                filas.append([])
+            filas[nivel].append(nodo)
+
+        # padre de cada nodo (para dibujar la arista que entra a un nodo visible)
+        self.padre = {}
+        for nodo in posiciones:
+            if nodo.izquierda:
+                self.padre[nodo.izquierda] = nodo
+            if nodo.derecha:
+                self.padre[nodo.derecha] = nodo
+
+        # extensión de cada subárbol, de los niveles más profundos hacia la raíz
+        x_ini, x_fin, tam, bajo = {}, {}, {}, {}
+        for fila in reversed(filas):
+            for nodo in fila:
+                x = posiciones[nodo][0]
+                iz, de = nodo.izquierda, nodo.derecha
+                x_ini[nodo] = x_ini[iz] if iz else x
+                x_fin[nodo] = x_fin[de] if de else x
+                tam[nodo] = 1 + (tam[iz] if iz else 0) + (tam[de] if de else 0)
+                bajo[nodo] = 1 + max(bajo[iz] if iz else -1, bajo[de] if de else -1)
+
+        self.nodos = filas
+        self.xs = [array('d', (posiciones[n][0] for n in fila)) for fila in filas]
+        self.x_ini = [array('d', (x_ini[n] for n in fila)) for fila in filas]
+        self.x_fin = [array('d', (x_fin[n] for n in fila)) for fila in filas]
+        self.tam = [array('q', (tam[n] for n in fila)) for fila in filas]
+        self.bajo = [array('i', (bajo[n] for n in fila)) for fila in filas]
+        # separación mínima entre nodos vecinos de cada nivel (define el nivel de detalle)
+        self.separacion = [
+            min((b - a for a, b in zip(xs, xs[1:])), default=float('inf')) for xs in self.xs
+        ]
+
+        self.ancho = max((x for x, _ in posiciones.values()), default=0) + margen_x + dx
+        self.alto = margen_y + len(filas) * dy
+
+    def __len__(self):
+        return len(self.posiciones)
+
+    def nivel_de(self, y):
+        return round((y - self.margen_y) / self.dy)
+
+    def _niveles_en(self, y0, y1):
+        desde = max(0, int((y0 - self.margen_y) // self.dy))
+        hasta = min(len(self.nodos) - 1, int((y1 - self.margen_y) // self.dy) + 1)
+        return range(desde, hasta + 1)
+
+    # Nodos cuyo centro cae en [x0, x1] × [y0, y1], nivel por nivel: (nodo, x, y).
+    # Con vecinos=True se agrega, en cada nivel, el nodo inmediato a cada lado del rango:
+    # una arista que cruza la zona sin tener extremos en ella siempre sale de uno de esos.
+    def visibles(self, x0, y0, x1, y1, hasta_nivel=None, vecinos=False):
+        for nivel in self._niveles_en(y0, y1):
+            if hasta_nivel is not None and nivel >= hasta_nivel:
+                break
+            y = self.margen_y + nivel * self.dy
+            if y < y0 or y > y1:
+                continue
+            xs, nodos = self.xs[nivel], self.nodos[nivel]
+            desde, hasta = bisect_left(xs, x0), bisect_right(xs, x1)
+            if vecinos:
+                desde, hasta = max(0, desde - 1), min(len(xs), hasta + 1)
+            for i in range(desde, hasta):
+                yield nodos[i], xs[i], y
+
+    # Subárboles que cuelgan del 'nivel' y cuya extensión horizontal toca [x0, x1]:
+    # (nodo, x_ini, x_fin, y, cantidad de nodos, niveles por debajo).
+    # Los subárboles de un mismo nivel son disjuntos y están ordenados, así que x_fin también.
+    def bloques(self, nivel, x0, x1):
+        if not 0 <= nivel < len(self.nodos):
+            return
+        y = self.margen_y + nivel * self.dy
+        ini, fin, nodos = self.x_ini[nivel], self.x_fin[nivel], self.nodos[nivel]
+        for i in range(bisect_left(fin, x0), len(nodos)):
+            if ini[i] > x1:
+                break
+            yield nodos[i], ini[i], fin[i], y, self.tam[nivel][i], self.bajo[nivel][i]
+
+    # Primer nivel que, a esta escala, deja a sus nodos a menos de 'umbral_px' píxeles:
+    # desde ahí hacia abajo los subárboles se dibujan agregados.
+    def nivel_de_corte(self, escala, umbral_px):
+        for nivel, sep in enumerate(self.separacion):
+            if sep * escala < umbral_px:
+                return nivel
+        return len(self.nodos)
 
 
 # ---------- Ventana con Canvas y barras de desplazamiento ----------
-def _crear_canvas_scrollable(root, width, height):
+# al_desplazar: se llama cada vez que cambia la parte visible (scroll, zoom o redimensión).
+def _crear_canvas_scrollable(root, width, height, al_desplazar=None):
     frame = ttk.Frame(root)
     frame.pack(fill="both", expand=True)
 
     hscroll = ttk.Scrollbar(frame, orient="horizontal")
     vscroll = ttk.Scrollbar(frame, orient="vertical")
+    def _con_aviso(barra):
+        if al_desplazar is None:
+            return barra.set
+        def _set(primero, ultimo):
+            barra.set(primero, ultimo)
+            al_desplazar()
+        return _set
+
     canvas = tk.Canvas(
         frame,
         bg="#0b1020",
         scrollregion=(0, 0, width, height),
-        xscrollcommand=hscroll.set,
-        yscrollcommand=vscroll.set,
+        xscrollcommand=_con_aviso(hscroll),
+        yscrollcommand=_con_aviso(vscroll),
         highlightthickness=0
     )
     hscroll.config(command=canvas.xview)
@@ -63,39 +148,180 @@ def _crear_canvas_scrollable(root, width, height):
     frame.columnconfigure(0, weight=1)
     return canvas
 
-# ---------- Dibujo ----------
-def _dibujar_arista(canvas, x1, y1, x2, y2):
-    canvas.create_line(x1, y1, x2, y2, width=2, fill="#a0b4ff")
-
-def _dibujar_nodo(canvas, x, y, etiqueta):
-    rx, ry = 38, 24  # radio x/y del óvalo
-    canvas.create_oval(x - rx, y - ry, x + rx, y + ry, fill="#233a7a", outline="#cce1ff", width=2)
-    canvas.create_text(x, y, text=etiqueta, font=("Arial", 10, "bold"), fill="#ffffff", justify="center")
-
-def _dibujar_arbol(canvas, raiz, posiciones):
-    # Primero aristas
-    for nodo, (x, y) in posiciones.items():
-        if nodo.izquierda:
-            xi, yi = posiciones[nodo.izquierda]
-            _dibujar_arista(canvas, x, y + 22, xi, yi - 22)
-        if nodo.derecha:
-            xd, yd = posiciones[nodo.derecha]
-            _dibujar_arista(canvas, x, y + 22, xd, yd - 22)
-    # Luego nodos
-    for nodo, (x, y) in posiciones.items():
-        _dibujar_nodo(canvas, x, y, _formatear_etiqueta(nodo))
+# ---------- Dibujo virtualizado ----------
+# Solo existen ítems del Canvas para lo que cae en la zona visible (más un margen).
+# Los ítems se reciclan: en cada redibujo se reubican con coords/itemconfigure y los que
+# sobran se ocultan, así que la cantidad de ítems no crece con el tamaño del árbol.
+COLOR_ARISTA = "#a0b4ff"
+COLOR_NODO = "#233a7a"
+COLOR_BORDE = "#cce1ff"
+COLOR_BLOQUE = "#1a2a57"
+RX, RY = 38, 24           # radio x/y del óvalo (a escala 1)
+MARGEN_VISIBLE_PX = 200   # margen alrededor de la ventana que también se dibuja
+UMBRAL_DETALLE_PX = 24    # separación mínima en pantalla para dibujar nodos sueltos
+UMBRAL_NIVEL_PX = 8       # con niveles más bajos que esto se limita cuántos se detallan
+TAM_FUENTE = 10
+TAM_FUENTE_MIN = 6        # por debajo no se dibujan etiquetas
+
+
+class VistaVirtual:
+
+    def __init__(self, canvas, indice):
+        self.canvas = canvas
+        self.indice = indice
+        self.escala = 1.0
+        self._libres = {"arista": [], "ovalo": [], "texto": [], "bloque": [], "bloque_texto": []}
+        self._usados = {tipo: 0 for tipo in self._libres}
+        self._pendiente = False
+        self._nuevos = False
+
+    # ---- reciclado de ítems ----
+    def _item(self, tipo):
+        lista = self._libres[tipo]
+        i = self._usados[tipo]
+        self._usados[tipo] = i + 1
+        if i < len(lista):
+            return lista[i]
+        c = self.canvas
+        if tipo == "arista":
+            item = c.create_line(0, 0, 0, 0, width=2, fill=COLOR_ARISTA, tags=(tipo,))
+        elif tipo == "ovalo":
+            item = c.create_oval(0, 0, 0, 0, fill=COLOR_NODO, outline=COLOR_BORDE, width=2, tags=(tipo,))
+        elif tipo == "bloque":
+            item = c.create_rectangle(0, 0, 0, 0, fill=COLOR_BLOQUE, outline=COLOR_ARISTA, tags=(tipo,))
+        else:
+            item = c.create_text(0, 0, fill="#ffffff", justify="center", tags=(tipo,))
+        lista.append(item)
+        self._nuevos = True
+        return item
+
+    def _arista(self, x1, y1, x2, y2):
+        e = self.escala
+        item = self._item("arista")
+        self.canvas.coords(item, x1 * e, (y1 + RY - 2) * e, x2 * e, (y2 - RY + 2) * e)
+        self.canvas.itemconfigure(item, state="normal")
+
+    def _nodo(self, nodo, x, y, fuente):
+        e, c = self.escala, self.canvas
+        item = self._item("ovalo")
+        c.coords(item, (x - RX) * e, (y - RY) * e, (x + RX) * e, (y + RY) * e)
+        c.itemconfigure(item, state="normal")
+        if fuente:
+            item = self._item("texto")
+            c.coords(item, x * e, y * e)
+            c.itemconfigure(item, text=_formatear_etiqueta(nodo), font=fuente, state="normal")
+
+    def _bloque(self, x_ini, x_fin, y, cantidad, niveles, fuente):
+        e, c = self.escala, self.canvas
+        y_fin = y + niveles * self.indice.dy
+        item = self._item("bloque")
+        c.coords(item, (x_ini - RX) * e, (y - RY) * e, (x_fin + RX) * e, (y_fin + RY) * e)
+        c.itemconfigure(item, state="normal")
+        # la etiqueta solo si el bloque tiene lugar para ella
+        if fuente and (x_fin - x_ini + 2 * RX) * e >= 60:
+            item = self._item("bloque_texto")
+            c.coords(item, (x_ini + x_fin) / 2 * e, (y + y_fin) / 2 * e)
+            c.itemconfigure(item, text=f"{cantidad} nodos", font=fuente, state="normal")
+
+    # Zona visible en coordenadas del layout (escala 1), con margen.
+    def _zona_visible(self):
+        c, e = self.canvas, self.escala
+        ancho = max(c.winfo_width(), 1)
+        alto = max(c.winfo_height(), 1)
+        m = MARGEN_VISIBLE_PX
+        return ((c.canvasx(0) - m) / e, (c.canvasy(0) - m) / e,
+                (c.canvasx(ancho) + m) / e, (c.canvasy(alto) + m) / e)
+
+    def redibujar(self):
+        self._pendiente = False
+        indice, e = self.indice, self.escala
+        if not indice.nodos:
+            return
+        for tipo in self._usados:
+            self._usados[tipo] = 0
+        x0, y0, x1, y1 = self._zona_visible()
+
+        tam = int(TAM_FUENTE * e)
+        fuente = ("Arial", tam, "bold") if tam >= TAM_FUENTE_MIN else None
+
+        # nivel de detalle: desde 'corte' los subárboles se agregan en bloques
+        # (y, para árboles muy altos, a lo sumo una pantalla de niveles de UMBRAL_NIVEL_PX)
+        corte = indice.nivel_de_corte(e, UMBRAL_DETALLE_PX)
+        max_niveles = self.canvas.winfo_height() // UMBRAL_NIVEL_PX + 1
+        corte = min(corte, max(0, indice.nivel_de(y0)) + max_niveles)
+
+        posiciones, padre = indice.posiciones, indice.padre
+        visibles = list(indice.visibles(x0, y0, x1, y1, hasta_nivel=corte, vecinos=True))
+        dibujados = {nodo for nodo, _, _ in visibles}
+
+        # aristas primero (quedan debajo de los nodos)
+        for nodo, x, y in visibles:
+            for hijo in (nodo.izquierda, nodo.derecha):
+                if hijo:
+                    xh, yh = posiciones[hijo]
+                    self._arista(x, y, xh, yh)
+            p = padre.get(nodo)
+            if p is not None and p not in dibujados:
+                xp, yp = posiciones[p]
+                self._arista(xp, yp, x, y)
+        for nodo, x, y in visibles:
+            self._nodo(nodo, x, y, fuente)
+
+        if corte < len(indice.nodos) and y1 >= indice.margen_y + corte * indice.dy - RY:
+            for nodo, x_ini, x_fin, y, cantidad, niveles in indice.bloques(corte, x0, x1):
+                if corte > 0 and padre.get(nodo) not in dibujados:
+                    xp, yp = posiciones[padre[nodo]]
+                    self._arista(xp, yp, posiciones[nodo][0], y)
+                self._bloque(x_ini, x_fin, y, cantidad, niveles, fuente)
+
+        # ocultar lo que sobró del redibujo anterior
+        for tipo, lista in self._libres.items():
+            for item in lista[self._usados[tipo]:]:
+                self.canvas.itemconfigure(item, state="hidden")
+        if self._nuevos:
+            # los ítems recién creados quedan arriba: se restablece el orden de capas
+            self.canvas.tag_lower("arista")
+            self.canvas.tag_raise("ovalo")
+            self.canvas.tag_raise("bloque")
+            self.canvas.tag_raise("texto")
+            self.canvas.tag_raise("bloque_texto")
+            self._nuevos = False
+
+    # Agrupa varios avisos de scroll en un solo redibujo.
+    def programar_redibujo(self, *_):
+        if not self._pendiente:
+            self._pendiente = True
+            self.canvas.after_idle(self.redibujar)
+
+    def actualizar_scrollregion(self):
+        e = self.escala
+        self.canvas.configure(scrollregion=(0, 0, self.indice.ancho * e, self.indice.alto * e))
+
+    # Cambia la escala manteniendo fijo el punto del layout que está bajo el puntero.
+    def zoom(self, factor, px, py):
+        c = self.canvas
+        wx = c.canvasx(px) / self.escala
+        wy = c.canvasy(py) / self.escala
+        self.escala *= factor
+        self.actualizar_scrollregion()
+        ancho = self.indice.ancho * self.escala
+        alto = self.indice.alto * self.escala
+        c.xview_moveto(max(0.0, wx * self.escala - px) / ancho)
+        c.yview_moveto(max(0.0, wy * self.escala - py) / alto)
+        self.programar_redibujo()
 
 # ---------- Zoom helpers ----------
-def _configurar_zoom(canvas, root):
+def _configurar_zoom(canvas, root, vista, zoom_min=0.25):
     """
     Agrega soporte de zoom con Ctrl + rueda del mouse.
     - Windows/macOS: <Control-MouseWheel> con event.delta (+/-120).
     - Linux (X11): <Control-Button-4> (acerca), <Control-Button-5> (aleja).
     El zoom se hace alrededor de la posición del puntero del mouse.
+    No escala ítems ya dibujados: cambia la escala de la vista virtual y esta redibuja
+    solo lo visible (con nivel de detalle según la escala).
     """
 
     # Parámetros de zoom
-    zoom_min = 0.25
     zoom_max = 3.5
     zoom_step_in = 1.1   # factor al acercar
     zoom_step_out = 1/zoom_step_in
@@ -108,24 +334,7 @@ def _configurar_zoom(canvas, root):
         if new_scale < zoom_min or new_scale > zoom_max:
             return
 
-        # Coordenadas del mouse en el sistema del canvas
-        x = canvas.canvasx(event.x)
-        y = canvas.canvasy(event.y)
-
-        # Escalar todo alrededor del puntero
-        canvas.scale("all", x, y, factor, factor)
-
-        # Actualizar bbox/scrollregion
-        bbox = canvas.bbox("all")
-        if bbox:
-            canvas.configure(scrollregion=bbox)
-
-        # Ajustar vista para mantener el punto del puntero “anclado”
-        # Convertimos a fracciones del scrollregion:
-        # (esto da una experiencia más estable al hacer zoom)
-        vx = (x - canvas.xview()[0] * (bbox[2] - bbox[0])) / (bbox[2] - bbox[0])
-        vy = (y - canvas.yview()[0] * (bbox[3] - bbox[1])) / (bbox[3] - bbox[1])
-        # No movemos explicitamente, tk se encarga bastante bien al escalar sobre el puntero.
+        vista.zoom(factor, event.x, event.y)
 
         state["scale"] = new_scale
 
@@ -174,39 +383,36 @@ def mostrar_arbol(arbol, titulo="Árbol BST (visualización)"):
         return
 
     # Parámetros de layout
-    altura = _altura(arbol.raiz)
     dx = 110   # separación horizontal entre columnas
     dy = 100   # separación vertical entre niveles
     margen_x = 60
     margen_y = 50
 
-    # Calcular posiciones por in-order (x por columna, y por nivel)
-    posiciones = {}
-    _asignar_posiciones_inorder(arbol.raiz, 0, dx, dy, margen_x, margen_y, [0], posiciones)
-
-    # Tamaño base del canvas según posiciones
-    max_x = max((pos[0] for pos in posiciones.values()), default=0)
-    width = max(900, int(max_x + margen_x + dx))
-    height = max(600, int(margen_y + (altura + 1) * dy))
+    # Layout in-order (x por columna, y por nivel) guardado en un índice espacial
+    indice = IndiceEspacial(arbol.raiz, dx, dy, margen_x, margen_y)
 
     root = tk.Tk()
     root.title(titulo)
     root.geometry("1000x700")
 
-    canvas = _crear_canvas_scrollable(root, width, height)
-    _dibujar_arbol(canvas, arbol.raiz, posiciones)
+    vista = None
+    def _al_desplazar():
+        if vista is not None:
+            vista.programar_redibujo()
 
-    # Ajustar scrollregion exacto al contenido
-    bbox = canvas.bbox("all")
-    if bbox:
-        canvas.configure(scrollregion=bbox)
+    canvas = _crear_canvas_scrollable(root, max(900, indice.ancho), max(600, indice.alto), _al_desplazar)
+    vista = VistaVirtual(canvas, indice)
+    vista.actualizar_scrollregion()
+    canvas.bind("<Configure>", vista.programar_redibujo)
 
-    # Configurar zoom con Ctrl + rueda
-    _configurar_zoom(canvas, root)
+    # Configurar zoom con Ctrl + rueda; alejando se puede llegar a ver el árbol entero
+    zoom_min = min(0.25, 1000 / max(indice.ancho, 1), 700 / max(indice.alto, 1))
+    _configurar_zoom(canvas, root, vista, zoom_min=zoom_min)
 
     # Centrar vista al inicio (opcional)
     canvas.xview_moveto(0.0)
     canvas.yview_moveto(0.0)
+    vista.programar_redibujo()
 
     root.mainloop()
 
@@ -0,0 +1,137 @@
+# anchura.py
+# Búsqueda en anchura por niveles sobre GrafoCSR (grafo_csr.py).
+#
+# busqueda_anchura del cuaderno saca un nodo por vez y encola todos sus hijos aunque ya
+# estén visitados. Acá se expande un nivel entero por vez y con NumPy:
+#   - se juntan las listas de vecinos de toda la frontera en un solo arreglo,
+#   - se descartan los ya vistos y los repetidos (queda la primera aparición),
+#   - lo que sobrevive es la frontera siguiente, y su padre se anota en un arreglo.
+# Quedarse con la primera aparición da el mismo orden de visita que la cola del cuaderno.
+#
+# Las dos funciones devuelven (camino, recorrido): el camino de inicio a fin (None si no
+# hay) y los nodos en el orden en que se expandieron, como busqueda_anchura.
+# Con medicion (instrumentacion.Medicion) registran expandidos, generados y pico_frontera,
+# y emiten un evento por nivel: ('nivel', profundidad, tamaño_de_la_frontera).
+#
+#   g = GrafoCSR.desde_dict(arbol)
+#   camino, recorrido = busqueda_anchura_niveles(g, 'A', 'H')
+#   camino, recorrido = busqueda_bidireccional_niveles(g, 'A', 'H')
+import numpy as np
+
+from grafo_csr import GrafoCSR
+
+SIN_VISITAR = -2     # en los arreglos de padres; la raíz de cada búsqueda tiene -1
+
+
+# Expande toda la frontera: devuelve los vecinos no visitados (sin repetir, en orden de
+# primera aparición) y anota su padre.
+def _expandir(indptr: np.ndarray, indices: np.ndarray, frontera: np.ndarray, padre: np.ndarray) -> np.ndarray:
+    ini = indptr[frontera]
+    largos = indptr[frontera + 1] - ini
+    total = int(largos.sum())
+    if total == 0:
+        return frontera[:0]
+    # posición de cada arista de la frontera dentro de 'indices', sin bucle en Python:
+    # arange(total) más el desplazamiento del tramo al que pertenece
+    desplazamiento = np.repeat(ini - (np.cumsum(largos) - largos), largos)
+    candidatos = indices[desplazamiento + np.arange(total)]
+    padres = np.repeat(frontera, largos)
+
+    libres = padre[candidatos] == SIN_VISITAR
+    candidatos, padres = candidatos[libres], padres[libres]
+    _, primero = np.unique(candidatos, return_index=True)
+    primero.sort()
+    nuevos = candidatos[primero]
+    padre[nuevos] = padres[primero]
+    return nuevos
+
+
+def _subir(padre: np.ndarray, nodo: int) -> list[int]:
+    camino = []
+    while nodo != -1:
+        camino.append(nodo)
+        nodo = int(padre[nodo])
+    return camino
+
+
+# BFS nivel por nivel. El recorrido coincide con busqueda_anchura del cuaderno (y con
+# busqueda_anchura_csr): termina en 'fin' o cuando no quedan nodos alcanzables.
+def busqueda_anchura_niveles(g: GrafoCSR, inicio, fin, medicion=None):
+    evento = medicion.evento if medicion is not None else None
+    origen, meta = g.id(inicio), g.id(fin)
+    padre = np.full(g.n, SIN_VISITAR, dtype=np.int32)
+    padre[origen] = -1
+    frontera = np.array([origen], dtype=np.int32)
+    niveles = []
+    camino = None
+    generados = pico = 1
+    while len(frontera):
+        if evento is not None:
+            evento('nivel', len(niveles), len(frontera))
+        encontrado = np.flatnonzero(frontera == meta)
+        if len(encontrado):
+            niveles.append(frontera[:encontrado[0] + 1])
+            camino = g.nombres_de(_subir(padre, meta)[::-1])
+            break
+        niveles.append(frontera)
+        frontera = _expandir(g.indptr, g.indices, frontera, padre)
+        generados += len(frontera)
+        if len(frontera) > pico:
+            pico = len(frontera)
+    recorrido = np.concatenate(niveles)
+    if medicion is not None:
+        medicion.registrar(expandidos=len(recorrido), generados=generados, pico_frontera=pico)
+    return camino, g.nombres_de(recorrido)
+
+
+# BFS bidireccional: desde 'inicio' por las aristas de g y desde 'fin' por el índice
+# inverso (g.transpuesto()), así también sirve en grafos dirigidos. En cada paso se
+# expande el lado con la frontera más chica. Cuando un nivel toca nodos del otro lado se
+# elige el encuentro con menor distancia total, así que el camino es de largo mínimo.
+# Para muchas consultas sobre el mismo grafo conviene pasar 'inverso' ya armado.
+# El recorrido son los niveles expandidos en orden, alternando lados (en los eventos, los
+# niveles del lado de 'fin' van con profundidad negativa).
+def busqueda_bidireccional_niveles(g: GrafoCSR, inicio, fin, inverso: GrafoCSR | None = None,
+                                   medicion=None):
+    evento = medicion.evento if medicion is not None else None
+    origen, meta = g.id(inicio), g.id(fin)
+    if origen == meta:
+        return [inicio], [inicio]
+    if inverso is None:
+        inverso = g.transpuesto()
+
+    # por lado: [grafo, padre, distancia, frontera, nivel]
+    lados = []
+    for grafo, raiz in ((g, origen), (inverso, meta)):
+        padre = np.full(g.n, SIN_VISITAR, dtype=np.int32)
+        distancia = np.full(g.n, -1, dtype=np.int32)
+        padre[raiz] = -1
+        distancia[raiz] = 0
+        lados.append([grafo, padre, distancia, np.array([raiz], dtype=np.int32), 0])
+    ida, vuelta = lados
+
+    expandidos = []
+    camino = None
+    generados, pico = 2, 2
+    while len(ida[3]) and len(vuelta[3]):
+        propio, otro = (ida, vuelta) if len(ida[3]) <= len(vuelta[3]) else (vuelta, ida)
+        grafo, padre, distancia, frontera, nivel = propio
+        if evento is not None:
+            evento('nivel', nivel if propio is ida else -nivel, len(frontera))
+        expandidos.append(frontera)
+        nuevos = _expandir(grafo.indptr, grafo.indices, frontera, padre)
+        distancia[nuevos] = nivel + 1
+        propio[3], propio[4] = nuevos, nivel + 1
+        generados += len(nuevos)
+        if len(ida[3]) + len(vuelta[3]) > pico:
+            pico = len(ida[3]) + len(vuelta[3])
+
+        encuentros = nuevos[otro[2][nuevos] >= 0]
+        if len(encuentros):
+            medio = int(encuentros[np.argmin(otro[2][encuentros])])
+            camino = g.nombres_de(_subir(ida[1], medio)[::-1] + _subir(vuelta[1], medio)[1:])
+            break
+    recorrido = np.concatenate(expandidos) if expandidos else np.zeros(0, dtype=np.int32)
+    if medicion is not None:
+        medicion.registrar(expandidos=len(recorrido), generados=generados, pico_frontera=pico)
+    return camino, g.nombres_de(recorrido)
@@ -0,0 +1,900 @@
+# benchmark_busquedas.py
+# Banco de pruebas reproducible: arma grafos sintéticos, un árbol de diccionario y registros
+# de consultas a partir de una semilla, corre las búsquedas sobre ellos y escribe los
+# resultados en JSON. Cada --suite mide una parte del proyecto:
+#
+#   busquedas   todas las búsquedas, con una instrumentacion.Medicion por algoritmo
+#   indices     latencia de ArbolBST.con_prefijo y rango_suma
+#   cache       iddfs con traza sobre un registro Zipf, con y sin CacheBusquedas
+#   iddfs       iddfs clásico contra iddfs_incremental en un árbol alto
+#   traza       tiempo y pico de memoria de dls con cada modo de traza
+#   inferencia  MotorInferencia contra el 'inferir' de inferencia.ipynb hasta el punto fijo
+#   anchura     BFS del lab 1 contra las versiones CSR, por niveles y bidireccional
+#   dijkstra    costo uniforme del lab 1 contra Dijkstra con heap y con cubetas
+#   memoria     bytes por palabra: nodos con __dict__, con __slots__ y ArbolCompacto
+#   lote        buscar_lote de ArbolBST y ArbolCompacto contra dls en un bucle
+#   exportar    LayoutArbol y exportar_arbol a SVG y PNG en árboles de 10^3 a --palabras
+#   hacia_atras cierre hacia adelante contra consultas de ConsultaHaciaAtras en frío y con tabla
+#   landmarks   A* y voraz en la grilla con h = 0, Manhattan y ALT con 4, 8 y 16 landmarks
+#
+#   python benchmark_busquedas.py --semilla 0 --salida resultados.json
+#   python benchmark_busquedas.py --lado 300 --solo 'grilla/' --memoria
+#   python benchmark_busquedas.py --eventos eventos.jsonl      # además, el paso a paso
+#   python benchmark_busquedas.py --suite indices --palabras 1000000
+#   python benchmark_busquedas.py --suite cache --palabras 5000 --muestras 2000
+#   python benchmark_busquedas.py --suite iddfs --muestras 200
+#   python benchmark_busquedas.py --suite traza --palabras 200000
+#   python benchmark_busquedas.py --suite inferencia --grupos 1000
+#   python benchmark_busquedas.py --suite anchura --nodos 1000000
+#   python benchmark_busquedas.py --suite dijkstra --nodos 1000000
+#   python benchmark_busquedas.py --suite memoria --palabras 200000
+#   python benchmark_busquedas.py --suite lote --palabras 100000 --muestras 100000
+#   python benchmark_busquedas.py --suite exportar --palabras 1000000
+#   python benchmark_busquedas.py --suite hacia_atras --grupos 1000 --muestras 4000
+#   python benchmark_busquedas.py --suite landmarks --lado 300 --consultas 10
+#
+# Con la misma semilla y parámetros los contadores, los picos y el 'resumen' de cada
+# algoritmo son idénticos entre corridas: solo cambian los tiempos. Para seguir regresiones
+# alcanza con comparar esos campos entre dos archivos.
+import argparse
+import ast
+import gc
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Proyecto IA'))
+
+from anchura import busqueda_anchura_niveles, busqueda_bidireccional_niveles
+from arbol_compacto import ArbolCompacto
+from costo_uniforme import Dijkstra
+from exportar_arbol import exportar_arbol
+from grafo_csr import (GrafoCSR, busqueda_a_estrella_csr, busqueda_anchura_csr,
+                       busqueda_bidireccional_csr, busqueda_costo_uniforme_csr,
+                       busqueda_profundidad_csr, busqueda_profundidad_limitada_csr,
+                       sma_estrella_csr, voraz_primero_mejor_csr)
+from inferencia import BaseHechos, ConsultaHaciaAtras, MotorInferencia, RedRete
+from instrumentacion import Medicion
+from landmarks import LandmarksALT
+from layout_arbol import LayoutArbol
+from main import (TRAZA_CONTAR, TRAZA_LISTA, TRAZA_NINGUNA, ArbolBST, NodoBST,
+                  calcular_suma_ascii)
+from memoria_acotada import a_estrella_ponderada, ida_estrella, sma_estrella_acotada
+
+LETRAS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+# ---------- Datos sintéticos ----------
+# Grilla lado x lado con 4 vecinos y pesos enteros 1..9 (distintos en cada sentido).
+def grilla(lado: int, rng: np.random.Generator) -> GrafoCSR:
+    n = lado * lado
+    u = np.arange(n)
+    x, y = u % lado, u // lado
+    origen, destino = [], []
+    for borde, paso in ((x < lado - 1, 1), (x > 0, -1), (y < lado - 1, lado), (y > 0, -lado)):
+        origen.append(u[borde])
+        destino.append(u[borde] + paso)
+    origen, destino = np.concatenate(origen), np.concatenate(destino)
+    return GrafoCSR.desde_aristas(n, origen, destino, rng.integers(1, 10, len(origen)).astype(np.float64))
+
+
+# Grafo dirigido al azar: 'grado' aristas salientes por nodo, pesos enteros 1..9.
+def aleatorio(n: int, grado: int, rng: np.random.Generator) -> GrafoCSR:
+    origen = np.repeat(np.arange(n), grado)
+    destino = rng.integers(0, n, n * grado)
+    return GrafoCSR.desde_aristas(n, origen, destino, rng.integers(1, 10, n * grado).astype(np.float64))
+
+
+# Manhattan es admisible en la grilla porque ningún peso es menor que 1.
+def manhattan(lado: int):
+    def para(objetivo: int):
+        ox, oy = objetivo % lado, objetivo // lado
+        return lambda v: abs(v % lado - ox) + abs(v // lado - oy)
+    return para
+
+
+# Tuplas (suma_ascii, palabra_norm, 'palabra : significado') ordenadas, como las que
+# consume ArbolBST.desde_ordenada. Las palabras son minúsculas, así que palabra_norm = palabra.
+def diccionario(cantidad: int, rng: np.random.Generator) -> list[tuple[int, str, str]]:
+    palabras = set()
+    while len(palabras) < cantidad:
+        largo = int(rng.integers(3, 11))
+        palabras.add(''.join(LETRAS[i] for i in rng.integers(0, 26, largo)))
+    tuplas = [(calcular_suma_ascii(p), p, f"{p} : significado de {p}") for p in palabras]
+    tuplas.sort(key=lambda t: (t[0], t[1]))
+    return tuplas
+
+
+# Consultas (inicio, objetivo) al azar sobre los ids de un grafo.
+def consultas_grafo(g: GrafoCSR, cantidad: int, rng: np.random.Generator) -> list[tuple[int, int]]:
+    return [tuple(par) for par in rng.integers(0, g.n, (cantidad, 2)).tolist()]
+
+
+# Consultas por palabra: la mayoría existen; una de cada 'ausentes' no está en el árbol.
+def consultas_palabras(tuplas: list, cantidad: int, rng: np.random.Generator,
+                       ausentes: int = 10) -> list[str]:
+    consultas = []
+    for i in range(cantidad):
+        if i % ausentes == ausentes - 1:
+            consultas.append('zz' + ''.join(LETRAS[j] for j in rng.integers(0, 26, 6)))
+        else:
+            consultas.append(tuplas[int(rng.integers(len(tuplas)))][1])
+    return consultas
+
+
+# Funciones de los cuadernos del curso, para comparar contra la versión original: de cada
+# nombre se toma la primera definición (la del enunciado), con los import de su celda.
+def desde_cuaderno(ruta: str, *nombres: str) -> dict:
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), ruta), encoding='utf-8') as f:
+        celdas = json.load(f)['cells']
+    espacio, faltan = {}, set(nombres)
+    for celda in celdas:
+        if celda['cell_type'] != 'code' or not faltan:
+            continue
+        try:
+            arbol = ast.parse(''.join(celda['source']))
+        except SyntaxError:
+            continue
+        imports = [n for n in arbol.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+        for nodo in arbol.body:
+            if isinstance(nodo, ast.FunctionDef) and nodo.name in faltan:
+                exec(compile(ast.Module(imports + [nodo], type_ignores=[]), ruta, 'exec'), espacio)
+                faltan.discard(nodo.name)
+    if faltan:
+        raise LookupError(f"{ruta}: no se encontró {', '.join(sorted(faltan))}")
+    return {nombre: espacio[nombre] for nombre in nombres}
+
+
+# ---------- Casos ----------
+# Cada caso es (nombre, consultas, correr): correr(consulta, medicion) devuelve un
+# número para el resumen (costo, largo del camino o, en anchura_csr y profundidad_csr, largo
+# del recorrido) o None si no hubo solución.
+def _largo(resultado):
+    return None if resultado is None else len(resultado)
+
+
+def _costo(resultado):
+    if resultado is None or resultado[0] is None:
+        return None
+    return resultado[1]
+
+
+def _llega(fin):
+    return lambda recorrido: len(recorrido) if recorrido and recorrido[-1] == fin else None
+
+
+def armar_casos(args, medicion_construccion: Medicion) -> tuple[dict, list]:
+    rng = np.random.default_rng(args.semilla)
+    conjuntos, casos = {}, []
+
+    with medicion_construccion.fase('grilla'):
+        g = grilla(args.lado, rng)
+        consultas = consultas_grafo(g, args.consultas, rng)
+    h_grilla = manhattan(args.lado)
+    conjuntos['grilla'] = dict(nodos=g.n, aristas=g.m, consultas=len(consultas))
+    with medicion_construccion.fase('aleatorio'):
+        r = aleatorio(args.nodos, args.grado, rng)
+        consultas_r = consultas_grafo(r, args.consultas, rng)
+    conjuntos['aleatorio'] = dict(nodos=r.n, aristas=r.m, consultas=len(consultas_r))
+    with medicion_construccion.fase('landmarks'):
+        alt = LandmarksALT.preparar(r, k=args.landmarks, semilla=args.semilla, procesos=1)
+    with medicion_construccion.fase('chica'):
+        c = grilla(args.lado_chico, rng)
+        consultas_c = consultas_grafo(c, args.consultas, rng)
+    h_chica = manhattan(args.lado_chico)
+    conjuntos['chica'] = dict(nodos=c.n, aristas=c.m, consultas=len(consultas_c))
+    with medicion_construccion.fase('diccionario'):
+        tuplas = diccionario(args.palabras, rng)
+        arbol = ArbolBST.desde_ordenada(tuplas)
+        palabras = consultas_palabras(tuplas, args.consultas, rng)
+    conjuntos['diccionario'] = dict(palabras=len(tuplas), altura=arbol.altura(),
+                                    consultas=len(palabras))
+
+    casos += _no_informadas('grilla', g, consultas) + _no_informadas('aleatorio', r, consultas_r)
+    casos.append(('grilla/bidireccional_csr', consultas,
+                  lambda par, m: _largo(busqueda_bidireccional_csr(g, *par, medicion=m))))
+    # heurística Manhattan en la grilla, ALT en el grafo al azar
+    casos += _informadas('grilla', g, consultas, h_grilla)
+    casos += _informadas('aleatorio', r, consultas_r, alt.heuristica)
+
+    # búsquedas que solo escalan en la grilla chica
+    casos += [
+        ('chica/profundidad_limitada_csr', consultas_c,
+         lambda par, m: _largo(busqueda_profundidad_limitada_csr(c, *par, 2 * args.lado_chico, medicion=m))),
+        ('chica/ida_estrella', consultas_c,
+         lambda par, m: _costo(ida_estrella(c, *par, h_chica(par[1]), medicion=m))),
+        ('chica/sma_estrella_acotada', consultas_c,
+         lambda par, m: _costo(sma_estrella_acotada(c, *par, h_chica(par[1]), memoria_max=c.n // 4, medicion=m))),
+    ]
+
+    # árbol de diccionario (Proyecto IA/main.py)
+    altura = arbol.altura()
+    casos += [
+        ('diccionario/dls', palabras,
+         lambda p, m: _dls(arbol, p, altura, m)),
+        ('diccionario/iddfs', palabras,
+         lambda p, m: _iddfs(arbol, p, m)),
+    ]
+    return conjuntos, casos
+
+
+# lab 1, anchura y costo_uniforme sobre un grafo grande.
+def _no_informadas(nombre: str, g: GrafoCSR, pares: list) -> list:
+    inverso = g.transpuesto()
+
+    def dijkstra(motor: Dijkstra):
+        def correr(par, m):
+            motor.medicion = m
+            return _costo(motor.camino(*par))
+        return correr
+
+    return [
+        (f'{nombre}/anchura_csr', pares,
+         lambda par, m: _llega(par[1])(busqueda_anchura_csr(g, *par, medicion=m))),
+        (f'{nombre}/anchura_niveles', pares,
+         lambda par, m: _largo(busqueda_anchura_niveles(g, *par, medicion=m)[0])),
+        (f'{nombre}/bidireccional_niveles', pares,
+         lambda par, m: _largo(busqueda_bidireccional_niveles(g, *par, inverso, medicion=m)[0])),
+        (f'{nombre}/profundidad_csr', pares,
+         lambda par, m: _llega(par[1])(busqueda_profundidad_csr(g, *par, medicion=m))),
+        (f'{nombre}/costo_uniforme_csr', pares,
+         lambda par, m: _costo(busqueda_costo_uniforme_csr(g, *par, medicion=m))),
+        (f'{nombre}/dijkstra_heap', pares, dijkstra(Dijkstra(g, 'heap'))),
+        (f'{nombre}/dijkstra_cubetas', pares, dijkstra(Dijkstra(g, 'cubetas'))),
+    ]
+
+
+# lab 2 y memoria_acotada; 'h' recibe el objetivo y devuelve la heurística h(id).
+def _informadas(nombre: str, g: GrafoCSR, pares: list, h) -> list:
+    return [
+        (f'{nombre}/voraz_csr', pares,
+         lambda par, m: _largo(voraz_primero_mejor_csr(g, *par, h(par[1]), medicion=m))),
+        (f'{nombre}/a_estrella_csr', pares,
+         lambda par, m: _costo(busqueda_a_estrella_csr(g, *par, h(par[1]), medicion=m))),
+        (f'{nombre}/a_estrella_ponderada', pares,
+         lambda par, m: _costo(a_estrella_ponderada(g, *par, h(par[1]), medicion=m))),
+        (f'{nombre}/sma_estrella_csr', pares,
+         lambda par, m: _costo(sma_estrella_csr(g, *par, h(par[1]), medicion=m))),
+    ]
+
+
+def _dls(arbol: ArbolBST, palabra: str, limite: int, m: Medicion):
+    nodo, _, camino = arbol.dls(calcular_suma_ascii(palabra), limite, palabra, traza=m.traza())
+    return len(camino) if nodo is not None else None
+
+
+def _iddfs(arbol: ArbolBST, palabra: str, m: Medicion):
+    nodo, _, camino = arbol.iddfs(calcular_suma_ascii(palabra), 0, 1, None, palabra, traza=m.traza())
+    return len(camino) if nodo is not None else None
+
+
+# ---------- Suite 'busquedas' ----------
+def suite_busquedas(args) -> dict:
+    flujo = open(args.eventos, 'w', encoding='utf-8') if args.eventos else None
+    try:
+        construccion = Medicion(memoria=args.memoria)
+        conjuntos, casos = armar_casos(args, construccion)
+        filtro = re.compile(args.solo) if args.solo else None
+        resultados = {}
+        for nombre, consultas, correr_consulta in casos:
+            if filtro is not None and not filtro.search(nombre):
+                continue
+            eventos = None
+            if flujo is not None:
+                eventos = lambda tipo, nodo, valor, alg=nombre: flujo.write(
+                    json.dumps([alg, tipo, nodo, valor], ensure_ascii=False) + "\n")
+            m = Medicion(eventos=eventos, memoria=args.memoria)
+            resueltas, total = 0, 0.0
+            with m.fase('busqueda'):
+                for consulta in consultas:
+                    valor = correr_consulta(consulta, m)
+                    if valor is not None:
+                        resueltas += 1
+                        total += valor
+            resultado = m.como_dict()
+            resultado['resumen'] = {'consultas': len(consultas), 'resueltas': resueltas,
+                                    'total': round(total, 6)}
+            resultados[nombre] = resultado
+            if args.progreso:
+                print(f"{nombre:>36}: {resultado['fases']['busqueda']['segundos']:.3f} s",
+                      file=sys.stderr)
+    finally:
+        if flujo is not None:
+            flujo.close()
+
+    return {
+        'parametros': _parametros(args, 'lado', 'nodos', 'grado', 'lado_chico', 'palabras',
+                                  'consultas', 'landmarks'),
+        'conjuntos': conjuntos,
+        'construccion': construccion.como_dict()['fases'],
+        'resultados': resultados,
+    }
+
+
+# ---------- Latencias ----------
+def _parametros(args, *claves) -> dict:
+    return {clave: getattr(args, clave) for clave in claves}
+
+
+def _latencias(segundos: list[float]) -> dict:
+    orden = sorted(segundos)
+    p99 = orden[min(len(orden) - 1, int(0.99 * len(orden)))]
+    return {'p50_us': round(orden[len(orden) // 2] * 1e6, 1), 'p99_us': round(p99 * 1e6, 1)}
+
+
+# Latencia de hacer(consulta) para cada consulta; 'resultados' es el promedio de len(hacer(...)).
+def _medir_latencias(consultas: list, hacer) -> dict:
+    reloj = time.perf_counter
+    tiempos, total = [], 0
+    for consulta in consultas:
+        t0 = reloj()
+        total += len(hacer(consulta))
+        tiempos.append(reloj() - t0)
+    return dict(_latencias(tiempos), resultados=round(total / len(consultas), 2))
+
+
+# ---------- Suite 'indices' ----------
+# Índice de prefijos y rangos por suma ASCII de ArbolBST. La primera consulta de prefijo
+# después de la carga masiva ordena el índice entero (se mide aparte), y después de cada
+# inserción la siguiente consulta incorpora la alta pendiente.
+def suite_indices(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    arbol = ArbolBST.desde_ordenada(tuplas)
+    elegidas = [tuplas[i] for i in rng.integers(0, len(tuplas), args.muestras).tolist()]
+    prefijos = [palabra[:3] for _, palabra, _ in elegidas]
+    sumas = [suma for suma, _, _ in elegidas]
+
+    resultados = {}
+    t0 = time.perf_counter()
+    arbol.prefijos.preparar()
+    resultados['prefijo_primera_consulta_s'] = round(time.perf_counter() - t0, 6)
+    resultados['prefijo_primeros_10'] = _medir_latencias(
+        prefijos, lambda p: list(islice(arbol.con_prefijo(p), 10)))
+    resultados['prefijo_todos'] = _medir_latencias(prefijos, lambda p: list(arbol.con_prefijo(p)))
+    resultados['rango_primeros_10'] = _medir_latencias(
+        sumas, lambda s: list(islice(arbol.rango_suma(s, s + 50), 10)))
+    resultados['rango_una_suma'] = _medir_latencias(sumas, lambda s: list(arbol.rango_suma(s, s)))
+
+    def insertar_y_consultar(prefijo):
+        palabra = prefijo + 'zzzz'
+        arbol.insertar(calcular_suma_ascii(palabra), palabra, 'nueva')
+        return list(islice(arbol.con_prefijo(prefijo), 10))
+    resultados['prefijo_tras_insertar'] = _medir_latencias(prefijos[:100], insertar_y_consultar)
+    return {'parametros': _parametros(args, 'palabras', 'muestras'), 'resultados': resultados}
+
+
+# ---------- Suite 'cache' ----------
+# Registro de consultas con popularidad Zipf: la palabra en el puesto k (orden al azar) sale
+# con probabilidad proporcional a 1 / k**s.
+def registro_zipf(tuplas: list, cantidad: int, rng: np.random.Generator, s: float = 1.1) -> list[str]:
+    pesos = 1.0 / np.arange(1, len(tuplas) + 1) ** s
+    orden = rng.permutation(len(tuplas))
+    return [tuplas[i][1] for i in orden[rng.choice(len(tuplas), cantidad, p=pesos / pesos.sum())]]
+
+
+# iddfs(acumular_recorridos=True) sobre el mismo registro: sin caché y con CacheBusquedas de
+# distinta capacidad, con el recorrido guardado tal cual o comprimido. Cada configuración
+# usa un árbol nuevo, así la caché empieza vacía.
+def suite_cache(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    registro = registro_zipf(tuplas, args.muestras, rng)
+    configuraciones = {'sin_cache': None, 'cap100': (100, False), 'cap1000': (1000, False),
+                       'cap1000_comprimida': (1000, True)}
+    resultados = {}
+    for nombre, config in configuraciones.items():
+        arbol = ArbolBST.desde_ordenada(tuplas)
+        cache = arbol.activar_cache(config[0], comprimir_recorridos=config[1]) if config else None
+        t0 = time.perf_counter()
+        for palabra in registro:
+            arbol.iddfs(calcular_suma_ascii(palabra), 0, 1, None, palabra, acumular_recorridos=True)
+        resultados[nombre] = {'segundos': round(time.perf_counter() - t0, 6)}
+        if cache is not None:
+            estadisticas = cache.estadisticas()
+            resultados[nombre].update(aciertos=estadisticas['aciertos'], expulsiones=estadisticas['expulsiones'],
+                                      tasa_aciertos=round(estadisticas['tasa_aciertos'], 4))
+        if args.progreso:
+            print(f"{nombre:>20}: {resultados[nombre]['segundos']:.2f} s", file=sys.stderr)
+    return {'parametros': _parametros(args, 'palabras', 'muestras'), 'resultados': resultados}
+
+
+# ---------- Suite 'iddfs' ----------
+# Árbol armado con inserciones en orden al azar (como el que queda tras muchas altas
+# sueltas): es mucho más alto que el balanceado de desde_ordenada, y ahí se nota repetir
+# los niveles de arriba en cada límite.
+def arbol_insertado(tuplas: list, rng: np.random.Generator) -> ArbolBST:
+    arbol = ArbolBST()
+    for i in rng.permutation(len(tuplas)).tolist():
+        arbol.insertar(*tuplas[i])
+    return arbol
+
+
+# iddfs clásico (un dls por límite) contra iddfs_incremental (una sola pasada), con y sin
+# acumular_recorridos. El recorrido perezoso del incremental se consume entero para que
+# ambos hagan el mismo trabajo. 'coinciden' compara nodo, camino y recorrido en las primeras
+# 'comparar' consultas (guardar todos los recorridos acumulados no entra en memoria).
+def suite_iddfs(args, comparar: int = 20) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    arbol = arbol_insertado(tuplas, rng)
+    palabras = consultas_palabras(tuplas, args.muestras, rng)
+    busquedas = {'clasico': arbol.iddfs, 'incremental': arbol.iddfs_incremental}
+
+    resultados = {}
+    for acumular in (False, True):
+        resultado = {}
+        for nombre, buscar in busquedas.items():
+            t0 = time.perf_counter()
+            for palabra in palabras:
+                _, recorrido, _ = buscar(calcular_suma_ascii(palabra), 0, 1, None, palabra, acumular)
+                sum(1 for _ in recorrido)
+            resultado[f'{nombre}_ms_por_consulta'] = round((time.perf_counter() - t0) / len(palabras) * 1e3, 3)
+        coinciden = True
+        for palabra in palabras[:comparar]:
+            a, b = (buscar(calcular_suma_ascii(palabra), 0, 1, None, palabra, acumular)
+                    for buscar in busquedas.values())
+            coinciden = coinciden and a[0] is b[0] and a[2] == b[2] and list(a[1]) == list(b[1])
+        resultado['coinciden'] = coinciden
+        resultados[f'acumular_{acumular}'.lower()] = resultado
+        if args.progreso:
+            print(f"acumular={acumular}: {resultado}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'palabras', 'muestras'),
+            'conjunto': {'palabras': len(tuplas), 'altura': arbol.altura()},
+            'resultados': resultados}
+
+
+# ---------- Suite 'traza' ----------
+# Costo de cada modo de traza en un dls que no encuentra nada y recorre el árbol entero, en
+# ArbolBST y en ArbolCompacto. El tiempo se toma sin tracemalloc; el pico de memoria, en una
+# segunda corrida con tracemalloc activo.
+def suite_traza(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    arbol = ArbolBST.desde_ordenada(tuplas)
+    arboles = {'bst': arbol, 'compacto': ArbolCompacto.desde_arbol(arbol)}
+    modos = {'lista': TRAZA_LISTA, 'contar': TRAZA_CONTAR, 'ninguna': TRAZA_NINGUNA,
+             'funcion': lambda palabra, suma, nivel: None}
+    altura = arbol.altura()
+
+    resultados = {}
+    for nombre, buscado in arboles.items():
+        for modo, traza in modos.items():
+            t0 = time.perf_counter()
+            buscado.dls(10 ** 9, altura, 'zzz', traza)
+            segundos = time.perf_counter() - t0
+            tracemalloc.start()
+            buscado.dls(10 ** 9, altura, 'zzz', traza)
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            resultados[f'{nombre}/{modo}'] = {'ms': round(segundos * 1e3, 3), 'pico_kib': round(pico / 1024, 1)}
+            if args.progreso:
+                print(f"{nombre + '/' + modo:>20}: {resultados[nombre + '/' + modo]}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'palabras'),
+            'conjunto': {'palabras': len(tuplas), 'altura': altura},
+            'resultados': resultados}
+
+
+# ---------- Suite 'inferencia' ----------
+# Base de conocimiento sintética: cada grupo tiene 'predicados' predicados unidos por reglas
+# que forman un árbol al azar (cada uno se deduce de alguno anterior) y 'elementos' hechos
+# sobre la raíz. Las reglas se mezclan, así que el encadenamiento cruza varias pasadas.
+def base_conocimiento(grupos: int, elementos: int, rng: np.random.Generator,
+                      predicados: int = 11) -> tuple[dict, list]:
+    hechos, reglas = {}, []
+    for g in range(grupos):
+        nombres = [f'G{g}P{i}' for i in range(predicados)]
+        reglas += [(nombres[int(rng.integers(i))], nombres[i]) for i in range(1, predicados)]
+        hechos[nombres[0]] = [f'e{g}_{k}' for k in range(elementos)]
+    return hechos, [reglas[i] for i in rng.permutation(len(reglas)).tolist()]
+
+
+# MotorInferencia (semi-ingenua, hasta el punto fijo) contra el 'inferir' del cuaderno
+# repetido hasta que no derive nada nuevo.
+def suite_inferencia(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    hechos, reglas = base_conocimiento(args.grupos, args.elementos, rng)
+    inferir_cuaderno = desde_cuaderno('inferencia.ipynb', 'inferir')['inferir']
+
+    t0 = time.perf_counter()
+    motor = MotorInferencia(reglas)
+    conclusiones = motor.inferir(BaseHechos(hechos))
+    semi_ingenua = time.perf_counter() - t0
+
+    copia = {predicado: list(elementos) for predicado, elementos in hechos.items()}
+    t0 = time.perf_counter()
+    pasadas, derivadas = 0, 0
+    while True:
+        nuevas = inferir_cuaderno(copia, reglas)
+        pasadas += 1
+        if not nuevas:
+            break
+        derivadas += len(nuevas)
+    cuaderno = time.perf_counter() - t0
+
+    resultados = {
+        'semi_ingenua': {'segundos': round(semi_ingenua, 6), 'rondas': motor.rondas,
+                         'derivados': len(conclusiones)},
+        'cuaderno_punto_fijo': {'segundos': round(cuaderno, 6), 'pasadas': pasadas,
+                                'derivados': derivadas},
+    }
+    if args.progreso:
+        print(resultados, file=sys.stderr)
+    return {'parametros': _parametros(args, 'grupos', 'elementos'),
+            'conjunto': {'hechos': sum(map(len, hechos.values())), 'reglas': len(reglas)},
+            'resultados': resultados}
+
+
+# ---------- Suite 'anchura' ----------
+# Árbol al azar: el padre del nodo i es uno cualquiera de los anteriores.
+def arbol_aleatorio(n: int, rng: np.random.Generator) -> GrafoCSR:
+    hijos = np.arange(1, n)
+    return GrafoCSR.desde_aristas(n, (rng.random(n - 1) * hijos).astype(np.int64), hijos)
+
+
+def _cronometrar(funcion, *argumentos):
+    t0 = time.perf_counter()
+    resultado = funcion(*argumentos)
+    return round(time.perf_counter() - t0, 6), resultado
+
+
+# BFS desde 0 hasta el nodo alcanzable más lejano: la busqueda_anchura del lab 1 sobre el
+# diccionario, busqueda_anchura_csr, busqueda_anchura_niveles y la bidireccional (el índice
+# inverso que necesita se mide aparte). Los grafos no tienen pesos y rondan --nodos nodos.
+def suite_anchura(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    busqueda_anchura = desde_cuaderno(os.path.join('lab 1', 'laboratorio1.ipynb'),
+                                      'busqueda_anchura')['busqueda_anchura']
+    lado = int(args.nodos ** 0.5)
+    grafos = {
+        'arbol': arbol_aleatorio(args.nodos, rng),
+        'grilla': grilla(lado, rng),
+        'aleatorio': aleatorio(args.nodos, args.grado, rng),
+    }
+    resultados = {}
+    for nombre, g in grafos.items():
+        g = GrafoCSR(g.indptr, g.indices)
+        # un objetivo que no existe recorre todo lo alcanzable; el último visitado es el más lejano
+        meta = busqueda_anchura_csr(g, 0, -1)[-1]
+        como_dict = g.como_dict()
+        resultado = {'nodos': g.n, 'aristas': g.m, 'meta': meta}
+        resultado['cuaderno_s'], recorrido = _cronometrar(busqueda_anchura, como_dict, 0, meta)
+        resultado['csr_s'], recorrido_csr = _cronometrar(busqueda_anchura_csr, g, 0, meta)
+        resultado['niveles_s'], (camino, recorrido_niveles) = _cronometrar(busqueda_anchura_niveles, g, 0, meta)
+        resultado['transpuesto_s'], inverso = _cronometrar(g.transpuesto)
+        resultado['bidireccional_s'], (camino_bi, expandidos) = _cronometrar(
+            busqueda_bidireccional_niveles, g, 0, meta, inverso)
+        resultado.update(profundidad=len(camino) - 1, visitados=len(recorrido),
+                         expandidos_bidireccional=len(expandidos),
+                         coinciden=recorrido == recorrido_csr == recorrido_niveles
+                         and len(camino) == len(camino_bi))
+        resultados[nombre] = resultado
+        if args.progreso:
+            print(f"{nombre:>10}: {resultado}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'nodos', 'grado'), 'resultados': resultados}
+
+
+# ---------- Suite 'dijkstra' ----------
+# busqueda_costo_uniforme del lab 1 contra Dijkstra con heap y con cubetas, desde 0 hasta el
+# nodo más caro de alcanzar: en una grilla con pesos 1..9 y en un grafo al azar con pesos
+# 1..100. Después, 'objetivos' destinos al azar en una sola corrida de varios() contra una
+# corrida de camino() por destino.
+def suite_dijkstra(args, objetivos: int = 10) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    busqueda_costo_uniforme = desde_cuaderno(os.path.join('lab 1', 'laboratorio1.ipynb'),
+                                             'busqueda_costo_uniforme')['busqueda_costo_uniforme']
+    r = aleatorio(args.nodos, args.grado, rng)
+    grafos = {
+        'grilla': grilla(int(args.nodos ** 0.5), rng),
+        'aleatorio': GrafoCSR(r.indptr, r.indices, rng.integers(1, 101, r.m).astype(np.float64)),
+    }
+    resultados = {}
+    for nombre, g in grafos.items():
+        distancias = Dijkstra(g, 'auto').distancias(0)
+        meta = int(np.argmax(np.where(np.isinf(distancias), -1, distancias)))
+        costo = float(distancias[meta])
+        resultado = {'nodos': g.n, 'aristas': g.m, 'meta': meta, 'costo': costo}
+        resultado['cuaderno_s'], (_, costo_cuaderno) = _cronometrar(
+            busqueda_costo_uniforme, g.como_dict(), 0, meta)
+        coinciden = costo_cuaderno == costo
+        for cola in ('heap', 'cubetas'):
+            motor = Dijkstra(g, cola)
+            coinciden = coinciden and motor.camino(0, meta)[1] == costo
+            resultado[cola] = motor.estadisticas()
+        resultado['coinciden'] = coinciden
+
+        destinos = rng.integers(0, g.n, objetivos).tolist()
+        motor = Dijkstra(g, 'auto')
+        motor.varios(0, destinos)
+        resultado['varios_s'] = round(motor.segundos, 6)
+        resultado['camino_por_destino_s'], _ = _cronometrar(
+            lambda: [motor.camino(0, destino) for destino in destinos])
+        resultados[nombre] = resultado
+        if args.progreso:
+            print(f"{nombre:>10}: {resultado}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'nodos', 'grado'), 'resultados': resultados}
+
+
+# ---------- Suite 'memoria' ----------
+# Nodo como era antes de __slots__: mismos campos, pero cada instancia lleva su __dict__.
+class NodoConDict:
+    __init__ = NodoBST.__init__
+
+
+class ArbolConDict(ArbolBST):
+    clase_nodo = NodoConDict
+
+
+# Bytes por palabra (texto incluido) que quedan asignados después de construir el mismo
+# diccionario con nodos con __dict__, con __slots__ (NodoBST) y como ArbolCompacto.
+def suite_memoria(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    construcciones = {'nodo_dict': ArbolConDict.desde_ordenada, 'nodo_slots': ArbolBST.desde_ordenada,
+                      'compacto': ArbolCompacto.desde_ordenada}
+    resultados = {}
+    for nombre, construir in construcciones.items():
+        gc.collect()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        arbol = construir(tuplas)
+        segundos = time.perf_counter() - t0
+        actual = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        resultados[nombre] = {'bytes_por_palabra': round(actual / len(tuplas), 1),
+                              'segundos_construccion': round(segundos, 6)}
+        del arbol
+        if args.progreso:
+            print(f"{nombre:>12}: {resultados[nombre]}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'palabras'), 'resultados': resultados}
+
+
+# ---------- Suite 'lote' ----------
+# buscar_lote (con y sin caminos) de ArbolBST y de ArbolCompacto contra dls(limite=altura)
+# en un bucle, sobre el mismo árbol y el mismo lote de --muestras palabras. El bucle de dls
+# se corre sobre las primeras 'muestra_dls' palabras y se extrapola al lote entero; la
+# muestra también sirve para comprobar que los nodos encontrados coinciden.
+def suite_lote(args, muestra_dls: int = 200) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    arbol = ArbolBST.desde_ordenada(tuplas)
+    compacto = ArbolCompacto.desde_arbol(arbol)
+    lote = consultas_palabras(tuplas, args.muestras, rng)
+    altura = arbol.altura()
+
+    resultados = {}
+    for nombre, buscar, con_caminos in (('lote', arbol.buscar_lote, False),
+                                        ('lote_con_caminos', arbol.buscar_lote, True),
+                                        ('compacto_lote', compacto.buscar_lote, False),
+                                        ('compacto_lote_con_caminos', compacto.buscar_lote, True)):
+        segundos, encontrados = _cronometrar(buscar, lote, con_caminos)
+        resultados[nombre] = {'segundos': segundos,
+                              'encontradas': sum(nodo is not None for nodo, _, _ in encontrados)}
+        if nombre == 'lote':
+            por_lote = encontrados
+
+    muestra = lote[:muestra_dls]
+    t0 = time.perf_counter()
+    por_dls = [arbol.dls(calcular_suma_ascii(palabra), altura, palabra)[0] for palabra in muestra]
+    segundos = time.perf_counter() - t0
+    resultados['dls_bucle'] = {
+        'muestra': len(muestra),
+        'ms_por_consulta': round(segundos / len(muestra) * 1e3, 3),
+        'segundos_estimados_lote': round(segundos / len(muestra) * len(lote), 1),
+        'coinciden': all(a is b for a, (b, _, _) in zip(por_dls, por_lote)),
+    }
+    if args.progreso:
+        print(resultados, file=sys.stderr)
+    return {'parametros': _parametros(args, 'palabras', 'muestras'),
+            'conjunto': {'palabras': len(tuplas), 'altura': altura},
+            'resultados': resultados}
+
+
+# ---------- Suite 'exportar' ----------
+# Layout y exportación (exportar_arbol) a .svg y .png de árboles balanceados de 10^3 nodos
+# hasta --palabras, de a potencias de 10. Los árboles chicos usan una de cada k palabras del
+# diccionario más grande, así todos salen del mismo sorteo.
+def suite_exportar(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    tuplas = diccionario(args.palabras, rng)
+    tamanos = [10 ** k for k in range(3, len(str(args.palabras))) if 10 ** k <= args.palabras]
+    resultados = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in tamanos:
+            arbol = ArbolBST.desde_ordenada(tuplas[::len(tuplas) // n][:n])
+            segundos, layout = _cronometrar(LayoutArbol, arbol.raiz)
+            resultado = {'layout_s': segundos, 'imagen': f'{layout.ancho}x{layout.alto}',
+                         'nivel_corte': layout.nivel_corte}
+            for extension in ('.svg', '.png'):
+                ruta = os.path.join(tmp, 'arbol' + extension)
+                segundos, exportado = _cronometrar(exportar_arbol, arbol, ruta)
+                resultado[extension[1:]] = {'segundos': segundos, 'bytes': os.path.getsize(ruta),
+                                            'elementos': exportado.elementos}
+            resultados[str(n)] = resultado
+            if args.progreso:
+                print(f"{n:>10}: {resultado}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'palabras'), 'resultados': resultados}
+
+
+# ---------- Suite 'hacia_atras' ----------
+# Base con reglas conjuntivas: 'reglas' reglas de 1 a 3 antecedentes tomados de los primeros
+# 2/3 de los predicados, con consecuentes en los últimos 2/3, y 'hechos' hechos al azar
+# sobre los antecedentes posibles.
+def base_conjuntiva(rng: np.random.Generator, predicados: int = 300, reglas: int = 2000,
+                    elementos: int = 5000, hechos: int = 100_000) -> tuple[dict, list]:
+    nombres = [f'P{i}' for i in range(predicados)]
+    antecedentes, consecuentes = nombres[:2 * predicados // 3], nombres[predicados // 3:]
+    lista = []
+    for _ in range(reglas):
+        k = int(rng.choice((1, 2, 2, 3)))
+        elegidos = tuple(antecedentes[i] for i in rng.choice(len(antecedentes), k, replace=False))
+        lista.append((elegidos if k > 1 else elegidos[0], consecuentes[int(rng.integers(len(consecuentes)))]))
+    base = {}
+    for p, e in zip(rng.integers(0, len(antecedentes), hechos).tolist(), rng.integers(0, elementos, hechos).tolist()):
+        base.setdefault(antecedentes[p], {})[f'e{e}'] = None
+    return {p: list(es) for p, es in base.items()}, lista
+
+
+# Cierre completo hacia adelante (MotorInferencia, o RedRete si hay conjunciones) contra
+# consultas de ConsultaHaciaAtras: en frío (tabla vacía en cada consulta) y con la tabla ya
+# llena por una pasada anterior. Sobre la base de árboles de reglas de la suite 'inferencia'
+# (--grupos × --elementos) y sobre base_conjuntiva, con --muestras metas (predicado, elemento);
+# las respuestas se comparan con el cierre.
+def suite_hacia_atras(args) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    predicados = 11
+    hechos, reglas = base_conocimiento(args.grupos, args.elementos, rng, predicados)
+    # mitad con un elemento del mismo grupo (casi siempre verdaderas), mitad de cualquiera
+    metas = []
+    for i in range(args.muestras):
+        g, p = int(rng.integers(args.grupos)), int(rng.integers(predicados))
+        grupo = g if i % 2 == 0 else int(rng.integers(args.grupos))
+        metas.append((f'G{g}P{p}', f'e{grupo}_{int(rng.integers(args.elementos))}'))
+    bases = {'arboles': (hechos, reglas, metas)}
+
+    hechos, reglas = base_conjuntiva(rng)
+    predicados_c = sorted({c for _, c in reglas} | set(hechos))
+    metas = [(predicados_c[int(rng.integers(len(predicados_c)))], f'e{int(rng.integers(5000))}')
+             for _ in range(args.muestras)]
+    bases['conjuntiva'] = (hechos, reglas, metas)
+
+    resultados = {}
+    for nombre, (hechos, reglas, metas) in bases.items():
+        t0 = time.perf_counter()
+        if any(not isinstance(antecedente, str) for antecedente, _ in reglas):
+            red = RedRete(reglas)
+            red.cargar(hechos)
+            cierre = red.base
+        else:
+            cierre = BaseHechos(hechos)
+            MotorInferencia(reglas).inferir(cierre)
+        segundos_cierre = time.perf_counter() - t0
+
+        consulta = ConsultaHaciaAtras(hechos, reglas)
+        t0 = time.perf_counter()
+        respuestas = []
+        for predicado, elemento in metas:
+            consulta.invalidar()
+            respuestas.append(consulta.consultar(predicado, elemento))
+        en_frio = time.perf_counter() - t0
+        for predicado, elemento in metas:
+            consulta.consultar(predicado, elemento)
+        t0 = time.perf_counter()
+        for predicado, elemento in metas:
+            consulta.consultar(predicado, elemento)
+        con_tabla = time.perf_counter() - t0
+
+        resultados[nombre] = {
+            'hechos': sum(map(len, hechos.values())), 'reglas': len(reglas),
+            'cierre_s': round(segundos_cierre, 6),
+            'en_frio_us': round(en_frio / len(metas) * 1e6, 2),
+            'con_tabla_us': round(con_tabla / len(metas) * 1e6, 2),
+            'verdaderas': sum(respuestas),
+            'coinciden': respuestas == [cierre.contiene(p, e) for p, e in metas],
+        }
+        if args.progreso:
+            print(f"{nombre:>12}: {resultados[nombre]}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'grupos', 'elementos', 'muestras'), 'resultados': resultados}
+
+
+# ---------- Suite 'landmarks' ----------
+def _costo_camino(g: GrafoCSR, camino: list) -> float:
+    total = 0.0
+    for u, v in zip(camino, camino[1:]):
+        ini = g.indptr[u]
+        total += float(g.pesos[ini + np.flatnonzero(g.indices[ini:g.indptr[u + 1]] == v)[0]])
+    return total
+
+
+# A* y voraz sobre la grilla de --lado con h = 0, Manhattan (la heurística escrita a mano) y
+# ALT con 'ks' landmarks, sobre las mismas --consultas: expansiones, costo total de los
+# caminos y tiempo de cada búsqueda, más el tiempo de preparación de cada tabla ALT.
+def suite_landmarks(args, ks: tuple = (4, 8, 16)) -> dict:
+    rng = np.random.default_rng(args.semilla)
+    g = grilla(args.lado, rng)
+    pares = consultas_grafo(g, args.consultas, rng)
+    heuristicas = {'h0': (lambda objetivo: lambda v: 0, None), 'manhattan': (manhattan(args.lado), None)}
+    for k in ks:
+        segundos, alt = _cronometrar(lambda: LandmarksALT.preparar(g, k=k, semilla=args.semilla, procesos=1))
+        heuristicas[f'alt_k{k}'] = (alt.heuristica, segundos)
+
+    resultados = {}
+    for nombre, (para, preparacion) in heuristicas.items():
+        resultado = {} if preparacion is None else {'preparacion_s': preparacion}
+        for algoritmo, buscar, costo in (
+                ('a_estrella', busqueda_a_estrella_csr, lambda r: r[1] if r[0] is not None else 0.0),
+                ('voraz', voraz_primero_mejor_csr, lambda r: _costo_camino(g, r) if r else 0.0)):
+            m = Medicion()
+            total = 0.0
+            with m.fase('busqueda'):
+                for inicio, fin in pares:
+                    total += costo(buscar(g, inicio, fin, para(fin), medicion=m))
+            resultado[algoritmo] = {'expandidos': m.contadores['expandidos'], 'costo_total': round(total, 6),
+                                    'segundos': round(m.fases['busqueda']['segundos'], 6)}
+        resultados[nombre] = resultado
+        if args.progreso:
+            print(f"{nombre:>10}: {resultado}", file=sys.stderr)
+    return {'parametros': _parametros(args, 'lado', 'consultas'),
+            'conjunto': {'nodos': g.n, 'aristas': g.m}, 'resultados': resultados}
+
+
+SUITES = {'busquedas': suite_busquedas, 'indices': suite_indices, 'cache': suite_cache,
+          'iddfs': suite_iddfs, 'traza': suite_traza, 'inferencia': suite_inferencia,
+          'anchura': suite_anchura, 'dijkstra': suite_dijkstra, 'memoria': suite_memoria,
+          'lote': suite_lote, 'exportar': suite_exportar, 'hacia_atras': suite_hacia_atras,
+          'landmarks': suite_landmarks}
+
+
+# ---------- Corrida ----------
+def correr(args) -> dict:
+    informe = {
+        'suite': args.suite,
+        'semilla': args.semilla,
+        'entorno': {'python': platform.python_version(), 'numpy': np.__version__,
+                    'plataforma': platform.platform(), 'fecha': time.strftime('%Y-%m-%dT%H:%M:%S')},
+    }
+    informe.update(SUITES[args.suite](args))
+    return informe
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Banco de pruebas de las búsquedas (salida JSON).")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="busquedas", help="qué medir")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla de grafos, árbol y consultas")
+    parser.add_argument("--lado", type=int, default=200, help="lado de la grilla grande")
+    parser.add_argument("--nodos", type=int, default=50_000, help="nodos del grafo al azar")
+    parser.add_argument("--grado", type=int, default=4, help="aristas salientes por nodo del grafo al azar")
+    parser.add_argument("--lado-chico", type=int, default=12,
+                        help="lado de la grilla para IDA*, SMA* acotado y DLS")
+    parser.add_argument("--palabras", type=int, default=50_000, help="palabras del árbol de diccionario")
+    parser.add_argument("--consultas", type=int, default=20, help="consultas por conjunto")
+    parser.add_argument("--landmarks", type=int, default=4, help="landmarks ALT del grafo al azar")
+    parser.add_argument("--grupos", type=int, default=100, help="grupos de predicados de la base de inferencia")
+    parser.add_argument("--elementos", type=int, default=100, help="hechos iniciales por grupo")
+    parser.add_argument("--muestras", type=int, default=1000, help="consultas por medición de latencia")
+    parser.add_argument("--solo", help="expresión regular: solo los algoritmos cuyo nombre coincide")
+    parser.add_argument("--memoria", action="store_true",
+                        help="medir el pico de memoria por fase con tracemalloc (más lento)")
+    parser.add_argument("--eventos", help="archivo JSON lines con el paso a paso de cada búsqueda")
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument("--progreso", action="store_true", help="mostrar cada algoritmo en stderr")
+    args = parser.parse_args()
+
+    informe = json.dumps(correr(args), ensure_ascii=False, indent=2)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(informe + "\n")
+    else:
+        print(informe)
+
+
+if __name__ == "__main__":
+    main()
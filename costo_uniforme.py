@@ -0,0 +1,199 @@
+# costo_uniforme.py
+# Costo uniforme / Dijkstra sobre GrafoCSR (grafo_csr.py), para grafos grandes con pesos.
+#
+# Diferencias con busqueda_costo_uniforme del cuaderno:
+#   - tabla de mejor costo: solo se encola (y se cambia el padre) cuando el costo mejora,
+#     así el camino devuelto es el del costo devuelto y la cola no crece sin límite;
+#   - sin decrease-key: una entrada cuyo costo ya fue superado queda en la cola y se
+#     descarta al sacarla (se cuenta en 'obsoletas');
+#   - con pesos enteros chicos se puede usar una cola de cubetas (algoritmo de Dial) en lugar
+#     del heap; cola='auto' la elige solo cuando conviene;
+#   - varios objetivos en una sola corrida, o todas las distancias desde un origen.
+#
+#   d = Dijkstra(GrafoCSR.desde_dict(grafo_peso))
+#   camino, costo = d.camino('A', 'F')
+#   d.varios('A', ['D', 'F'])       # {'D': (camino, costo), 'F': (camino, costo)}
+#   d.distancias('A')               # arreglo por id, inf si no se alcanza
+#   d.estadisticas()                # empujes, extracciones, obsoletas, asentados, pico_cola, segundos
+#
+# Con medicion (instrumentacion.Medicion) cada corrida registra también expandidos,
+# generados, obsoletas y pico_frontera, y emite ('expandir', nodo, costo) por nodo asentado.
+import heapq
+import time
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+
+COLAS = ('heap', 'cubetas', 'auto')
+# Peso máximo admitido por la cola de cubetas. El anillo se recorre de a una unidad de costo,
+# así que el trabajo crece con la distancia máxima (hasta n * peso máximo) y no con la
+# cantidad de nodos: con pesos grandes casi todas las cubetas visitadas están vacías.
+MAX_PESO_CUBETAS = 256
+
+
+class Dijkstra:
+    """
+    Motor de costo uniforme reutilizable sobre un GrafoCSR. cola='cubetas' exige pesos
+    enteros no negativos y C <= MAX_PESO_CUBETAS: usa C + 1 cubetas circulares (C = peso
+    máximo), cada empuje y extracción es O(1) y avanzar entre cubetas cuesta una vuelta por
+    unidad de costo. cola='auto' usa cubetas si los pesos lo permiten y el heap si no.
+    """
+
+    def __init__(self, g: GrafoCSR, cola: str = 'heap', medicion=None):
+        if g.pesos is None:
+            raise ValueError("El grafo no tiene pesos")
+        if cola not in COLAS:
+            raise ValueError(f"Cola desconocida: {cola!r} (use {' o '.join(COLAS)})")
+        if len(g.pesos) and g.pesos.min() < 0:
+            raise ValueError("Dijkstra no admite pesos negativos")
+        enteros = np.array_equal(g.pesos, np.floor(g.pesos))
+        maximo = g.pesos.max() if len(g.pesos) else 0
+        if cola == 'auto':
+            cola = 'cubetas' if enteros and maximo <= MAX_PESO_CUBETAS else 'heap'
+        self.g = g
+        self.cola = cola
+        self.medicion = medicion
+        if cola == 'cubetas':
+            if not enteros:
+                raise ValueError("La cola de cubetas necesita pesos enteros")
+            if maximo > MAX_PESO_CUBETAS:
+                raise ValueError(f"La cola de cubetas admite pesos hasta {MAX_PESO_CUBETAS} "
+                                 f"(el máximo es {maximo:g}); use cola='heap' o 'auto'")
+            self._pes = memoryview(g.pesos.astype(np.int64))
+            self._ancho = int(maximo) + 1
+        else:
+            self._pes = g._pes
+        self._reiniciar_contadores()
+
+    def _reiniciar_contadores(self) -> None:
+        self.empujes = 0
+        self.extracciones = 0
+        self.obsoletas = 0       # entradas sacadas cuyo costo ya no era el mejor
+        self.asentados = 0       # nodos con costo definitivo
+        self.pico_cola = 0
+        self.segundos = 0.0
+
+    def estadisticas(self) -> dict:
+        return {"cola": self.cola, "empujes": self.empujes, "extracciones": self.extracciones,
+                "obsoletas": self.obsoletas, "asentados": self.asentados,
+                "pico_cola": self.pico_cola, "segundos": round(self.segundos, 6)}
+
+    # ---------- Núcleo ----------
+    # Asienta nodos desde 'origen' hasta asentar todos los de 'objetivos' (o todos los
+    # alcanzables si es None). Devuelve las tablas (mejor, padre) indexadas por id.
+    def _resolver(self, origen: int, objetivos: set | None):
+        self._reiniciar_contadores()
+        t0 = time.perf_counter()
+        mejor = [float('inf')] * self.g.n
+        padre = [-1] * self.g.n
+        mejor[origen] = 0
+        pendientes = set(objetivos) if objetivos is not None else None
+        if self.cola == 'heap':
+            self._con_heap(origen, mejor, padre, pendientes)
+        else:
+            self._con_cubetas(origen, mejor, padre, pendientes)
+        self.segundos = time.perf_counter() - t0
+        if self.medicion is not None:
+            self.medicion.registrar(expandidos=self.asentados, generados=self.empujes,
+                                    obsoletas=self.obsoletas, pico_frontera=self.pico_cola)
+        return mejor, padre
+
+    def _con_heap(self, origen, mejor, padre, pendientes) -> None:
+        ptr, ind, pes = self.g._ptr, self.g._ind, self._pes
+        heappush, heappop = heapq.heappush, heapq.heappop
+        evento = self.medicion.evento if self.medicion is not None else None
+        nombres = self.g.nombres
+        cola = [(0, origen)]
+        empujes, extracciones, obsoletas, asentados, pico = 1, 0, 0, 0, 1
+        while cola:
+            if len(cola) > pico:
+                pico = len(cola)
+            costo, nodo = heappop(cola)
+            extracciones += 1
+            if costo > mejor[nodo]:
+                obsoletas += 1
+                continue
+            asentados += 1
+            if evento is not None:
+                evento('expandir', nombres[nodo], costo)
+            if pendientes is not None:
+                pendientes.discard(nodo)
+                if not pendientes:
+                    break
+            for k in range(ptr[nodo], ptr[nodo + 1]):
+                vecino = ind[k]
+                nuevo = costo + pes[k]
+                if nuevo < mejor[vecino]:
+                    mejor[vecino] = nuevo
+                    padre[vecino] = nodo
+                    heappush(cola, (nuevo, vecino))
+                    empujes += 1
+        self.empujes, self.extracciones = empujes, extracciones
+        self.obsoletas, self.asentados, self.pico_cola = obsoletas, asentados, pico
+
+    # Algoritmo de Dial: la cubeta costo % ancho tiene los nodos con ese costo. Como ningún
+    # peso supera ancho - 1, las entradas vivas siempre caben en una vuelta del anillo.
+    def _con_cubetas(self, origen, mejor, padre, pendientes) -> None:
+        ptr, ind, pes = self.g._ptr, self.g._ind, self._pes
+        ancho = self._ancho
+        cubetas = [[] for _ in range(ancho)]
+        cubetas[0].append(origen)
+        evento = self.medicion.evento if self.medicion is not None else None
+        nombres = self.g.nombres
+        en_cola = 1
+        actual = 0
+        empujes, extracciones, obsoletas, asentados, pico = 1, 0, 0, 0, 1
+        while en_cola:
+            cubeta = cubetas[actual % ancho]
+            if not cubeta:
+                actual += 1
+                continue
+            if en_cola > pico:
+                pico = en_cola
+            nodo = cubeta.pop()
+            en_cola -= 1
+            extracciones += 1
+            if actual > mejor[nodo]:
+                obsoletas += 1
+                continue
+            asentados += 1
+            if evento is not None:
+                evento('expandir', nombres[nodo], actual)
+            if pendientes is not None:
+                pendientes.discard(nodo)
+                if not pendientes:
+                    break
+            for k in range(ptr[nodo], ptr[nodo + 1]):
+                vecino = ind[k]
+                nuevo = actual + pes[k]
+                if nuevo < mejor[vecino]:
+                    mejor[vecino] = nuevo
+                    padre[vecino] = nodo
+                    cubetas[nuevo % ancho].append(vecino)
+                    en_cola += 1
+                    empujes += 1
+        self.empujes, self.extracciones = empujes, extracciones
+        self.obsoletas, self.asentados, self.pico_cola = obsoletas, asentados, pico
+
+    # ---------- Consultas ----------
+    # Como busqueda_costo_uniforme: (camino, costo), o None si no se alcanza el objetivo.
+    def camino(self, inicio, objetivo):
+        meta = self.g.id(objetivo)
+        mejor, padre = self._resolver(self.g.id(inicio), {meta})
+        if mejor[meta] == float('inf'):
+            return None
+        return self.g._camino(padre, meta), mejor[meta]
+
+    # Varios objetivos en una corrida: se corta cuando el último quedó asentado.
+    # Devuelve {objetivo: (camino, costo) o None}.
+    def varios(self, inicio, objetivos) -> dict:
+        ids = {objetivo: self.g.id(objetivo) for objetivo in objetivos}
+        mejor, padre = self._resolver(self.g.id(inicio), set(ids.values()))
+        return {objetivo: None if mejor[i] == float('inf') else (self.g._camino(padre, i), mejor[i])
+                for objetivo, i in ids.items()}
+
+    # Distancia mínima desde 'inicio' a cada nodo (arreglo por id, inf si no se alcanza).
+    def distancias(self, inicio) -> np.ndarray:
+        mejor, _ = self._resolver(self.g.id(inicio), None)
+        return np.array(mejor, dtype=np.float64)
@@ -0,0 +1,460 @@
+# grafo_csr.py
+# Grafo compacto (CSR: compressed sparse row) para las búsquedas de "lab 1" y "lab 2".
+#
+# Los cuadernos usan diccionarios de listas con nombres de nodo:
+#   arbol      = {'A': ['B', 'C'], ...}                 (sin pesos)
+#   grafo_peso = {'A': [('B', 1), ('C', 4)], ...}       (con pesos)
+# GrafoCSR.desde_dict los convierte a ids enteros y tres arreglos NumPy:
+#   indptr[u] .. indptr[u + 1]   rango de las aristas que salen de u
+#   indices[k]                   destino de la arista k
+#   pesos[k]                     peso de la arista k (None si el grafo no tiene pesos)
+# más los mapas nombre -> id (dict) e id -> nombre (lista).
+#
+# Cada búsqueda de los cuadernos tiene aquí su variante *_csr: recibe el GrafoCSR y los
+# nombres de inicio/objetivo, y devuelve lo mismo que la original (nombres, no ids).
+# Los bucles recorren memoryviews de los arreglos: leer un elemento da un int de Python
+# sin crear escalares de NumPy, y la expansión de un nodo es un rebanado sin tuplas.
+import heapq
+from collections import deque
+
+import numpy as np
+
+
+class GrafoCSR:
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, pesos: np.ndarray | None = None,
+                 nombres: list | None = None):
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int32)
+        self.pesos = None if pesos is None else np.ascontiguousarray(pesos, dtype=np.float64)
+        self.n = len(self.indptr) - 1
+        # sin nombres, cada nodo se llama por su id
+        self.nombres = nombres if nombres is not None else range(self.n)
+        self.ids = {nombre: i for i, nombre in enumerate(nombres)} if nombres is not None else None
+        # vistas para los bucles en Python (ver comentario del módulo)
+        self._ptr = memoryview(self.indptr)
+        self._ind = memoryview(self.indices)
+        self._pes = memoryview(self.pesos) if self.pesos is not None else None
+
+    # ---------- Construcción ----------
+    # Acepta las dos formas de los cuadernos. Los ids siguen el orden de aparición (primero
+    # las claves, después los vecinos que no son clave) y cada lista de vecinos conserva
+    # su orden, así que los recorridos visitan en el mismo orden que con el diccionario.
+    @classmethod
+    def desde_dict(cls, grafo: dict) -> 'GrafoCSR':
+        ids = {}
+        nombres = []
+        for nodo in grafo:
+            ids[nodo] = len(nombres)
+            nombres.append(nodo)
+
+        con_pesos = any(lista and isinstance(lista[0], (tuple, list)) for lista in grafo.values())
+        indptr = np.zeros(len(nombres) + 1, dtype=np.int64)
+        destinos = []
+        pesos = [] if con_pesos else None
+        for nodo, lista in grafo.items():
+            indptr[ids[nodo] + 1] = len(lista)
+            for arista in lista:
+                vecino = arista[0] if con_pesos else arista
+                if vecino not in ids:
+                    ids[vecino] = len(nombres)
+                    nombres.append(vecino)
+                destinos.append(ids[vecino])
+                if con_pesos:
+                    pesos.append(arista[1])
+
+        # los nodos que solo aparecen como vecinos no tienen aristas
+        indptr = np.concatenate([indptr, np.zeros(len(nombres) + 1 - len(indptr), dtype=np.int64)])
+        np.cumsum(indptr, out=indptr)
+        return cls(indptr, np.array(destinos, dtype=np.int32),
+                   None if pesos is None else np.array(pesos, dtype=np.float64), nombres)
+
+    # Desde arreglos de aristas (origen[k] -> destino[k]); pensado para grafos sintéticos
+    # grandes, sin pasar por diccionarios. El orden entre aristas del mismo origen se conserva.
+    @classmethod
+    def desde_aristas(cls, n: int, origen, destino, pesos=None, nombres: list | None = None) -> 'GrafoCSR':
+        origen = np.asarray(origen, dtype=np.int64)
+        orden = np.argsort(origen, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origen, minlength=n), out=indptr[1:])
+        return cls(indptr, np.asarray(destino)[orden],
+                   None if pesos is None else np.asarray(pesos)[orden], nombres)
+
+    # Índice inverso: las mismas aristas dadas vuelta (v -> u por cada u -> v), con los mismos
+    # ids y nombres. Lo necesitan las búsquedas que avanzan desde el objetivo hacia atrás.
+    def transpuesto(self) -> 'GrafoCSR':
+        origen = np.repeat(np.arange(self.n, dtype=np.int32), np.diff(self.indptr))
+        return GrafoCSR.desde_aristas(self.n, self.indices, origen, self.pesos,
+                                      self.nombres if self.ids is not None else None)
+
+    # Vuelve al formato de los cuadernos (útil para comparar resultados).
+    def como_dict(self) -> dict:
+        grafo = {}
+        for u in range(self.n):
+            ini, fin = self._ptr[u], self._ptr[u + 1]
+            vecinos = [self.nombres[v] for v in self._ind[ini:fin]]
+            if self.pesos is not None:
+                vecinos = list(zip(vecinos, self.pesos[ini:fin].tolist()))
+            grafo[self.nombres[u]] = vecinos
+        return grafo
+
+    # ---------- Consultas ----------
+    @property
+    def m(self) -> int:
+        return len(self.indices)
+
+    def id(self, nombre) -> int:
+        return self.ids[nombre] if self.ids is not None else int(nombre)
+
+    def nombre(self, i: int):
+        return self.nombres[i]
+
+    # Nombres de un arreglo de ids (sin nombres, los ids como ints de Python).
+    def nombres_de(self, ids) -> list:
+        if self.ids is None:
+            return np.asarray(ids).tolist()
+        nombres = self.nombres
+        return [nombres[i] for i in np.asarray(ids).tolist()]
+
+    def vecinos(self, u: int) -> np.ndarray:
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def pesos_de(self, u: int) -> np.ndarray:
+        return self.pesos[self.indptr[u]:self.indptr[u + 1]]
+
+    # Bytes de los arreglos (sin contar los nombres).
+    def memoria_bytes(self) -> int:
+        total = self.indptr.nbytes + self.indices.nbytes
+        return total + (self.pesos.nbytes if self.pesos is not None else 0)
+
+    def _camino(self, padre, nodo: int) -> list:
+        camino = []
+        while nodo != -1:
+            camino.append(self.nombres[nodo])
+            nodo = padre[nodo]
+        camino.reverse()
+        return camino
+
+    # h de las búsquedas informadas: dict nombre -> valor (como en los cuadernos) o una función
+    # h(id). El dict se pasa a un arreglo por id una sola vez.
+    def heuristica(self, h):
+        if callable(h):
+            return h
+        valores = memoryview(np.array([h[nombre] for nombre in self.nombres], dtype=np.float64))
+        return valores.__getitem__
+
+
+# ---------- Búsquedas no informadas (lab 1) ----------
+# Todas las búsquedas de este módulo aceptan 'medicion' (instrumentacion.Medicion): al
+# terminar registran expandidos,
+# generados y pico_frontera, y si la medición tiene flujo de eventos emiten
+# ('expandir', nodo, valor) por cada nodo expandido (valor: tamaño de la frontera o costo).
+
+# El orden de visita es el mismo que el de busqueda_anchura del cuaderno: el primer
+# encolado de cada nodo decide su turno, así que marcar al encolar no cambia el recorrido
+# y evita llenar la cola de duplicados.
+def busqueda_anchura_csr(g: GrafoCSR, inicio, fin, medicion=None) -> list:
+    ptr, ind = g._ptr, g._ind
+    evento = medicion.evento if medicion is not None else None
+    origen, meta = g.id(inicio), g.id(fin)
+    encolado = bytearray(g.n)
+    encolado[origen] = 1
+    cola = deque([origen])
+    recorrido = []
+    pico = 1
+    while cola:
+        nodo = cola.popleft()
+        recorrido.append(g.nombres[nodo])
+        if evento is not None:
+            evento('expandir', g.nombres[nodo], len(cola))
+        if nodo == meta:
+            break
+        for vecino in ind[ptr[nodo]:ptr[nodo + 1]]:
+            if not encolado[vecino]:
+                encolado[vecino] = 1
+                cola.append(vecino)
+        if len(cola) > pico:
+            pico = len(cola)
+    if medicion is not None:
+        medicion.registrar(expandidos=len(recorrido), generados=len(recorrido) + len(cola),
+                           pico_frontera=pico)
+    return recorrido
+
+
+# En profundidad sí importan los duplicados (el último apilado gana), así que se
+# conserva la pila del cuaderno y solo 'visitados' pasa a ser un bytearray.
+def busqueda_profundidad_csr(g: GrafoCSR, inicio, fin, medicion=None) -> list:
+    ptr, ind = g._ptr, g._ind
+    evento = medicion.evento if medicion is not None else None
+    meta = g.id(fin)
+    visitados = bytearray(g.n)
+    pila = [g.id(inicio)]
+    recorrido = []
+    generados = pico = 1
+    while pila:
+        nodo = pila.pop()
+        if not visitados[nodo]:
+            visitados[nodo] = 1
+            recorrido.append(g.nombres[nodo])
+            if evento is not None:
+                evento('expandir', g.nombres[nodo], len(pila))
+            if nodo == meta:
+                break
+            vecinos = ind[ptr[nodo]:ptr[nodo + 1]]
+            pila.extend(reversed(vecinos))
+            generados += len(vecinos)
+            if len(pila) > pico:
+                pico = len(pila)
+    if medicion is not None:
+        medicion.registrar(expandidos=len(recorrido), generados=generados, pico_frontera=pico)
+    return recorrido
+
+
+# Misma exploración que la versión recursiva del cuaderno (visitados compartido entre ramas),
+# con una pila de marcos [nodo, límite, próxima arista]: la pila es el camino actual.
+def busqueda_profundidad_limitada_csr(g: GrafoCSR, inicio, objetivo, limite: int,
+                                      medicion=None) -> list | None:
+    ptr, ind = g._ptr, g._ind
+    evento = medicion.evento if medicion is not None else None
+    meta = g.id(objetivo)
+    visitados = bytearray(g.n)
+    origen = g.id(inicio)
+    visitados[origen] = 1
+    resultado = None
+    expandidos = generados = pico = 1
+    if origen == meta:
+        resultado = [inicio]
+        pila = []
+    elif limite <= 0:
+        pila = []
+    else:
+        pila = [[origen, limite, ptr[origen]]]
+        if evento is not None:
+            evento('expandir', inicio, 1)
+    while pila:
+        marco = pila[-1]
+        nodo, lim, k = marco
+        fin = ptr[nodo + 1]
+        while k < fin and visitados[ind[k]]:
+            k += 1
+        if k == fin:
+            pila.pop()
+            continue
+        marco[2] = k + 1
+        vecino = ind[k]
+        visitados[vecino] = 1
+        generados += 1
+        if vecino == meta:
+            resultado = [g.nombres[m[0]] for m in pila] + [g.nombres[vecino]]
+            break
+        if lim - 1 > 0:
+            pila.append([vecino, lim - 1, ptr[vecino]])
+            expandidos += 1
+            if evento is not None:
+                evento('expandir', g.nombres[vecino], len(pila))
+            if len(pila) > pico:
+                pico = len(pila)
+    if medicion is not None:
+        medicion.registrar(expandidos=expandidos, generados=generados, pico_frontera=pico)
+    return resultado
+
+
+# Costo uniforme con tabla de mejor costo: solo se encola (y se cambia el padre) cuando
+# el costo mejora, así el camino devuelto siempre corresponde al costo devuelto.
+def busqueda_costo_uniforme_csr(g: GrafoCSR, inicio, objetivo, medicion=None):
+    ptr, ind, pes = g._ptr, g._ind, g._pes
+    evento = medicion.evento if medicion is not None else None
+    origen, meta = g.id(inicio), g.id(objetivo)
+    inf = float('inf')
+    mejor = [inf] * g.n
+    padre = [-1] * g.n
+    cerrado = bytearray(g.n)
+    mejor[origen] = 0
+    cola = [(0, origen)]
+    resultado = None
+    expandidos, generados, pico = 0, 1, 1
+    while cola:
+        costo, nodo = heapq.heappop(cola)
+        if cerrado[nodo]:
+            continue
+        if nodo == meta:
+            resultado = g._camino(padre, nodo), costo
+            break
+        cerrado[nodo] = 1
+        expandidos += 1
+        if evento is not None:
+            evento('expandir', g.nombres[nodo], costo)
+        for k in range(ptr[nodo], ptr[nodo + 1]):
+            vecino = ind[k]
+            nuevo = costo + pes[k]
+            if nuevo < mejor[vecino]:
+                mejor[vecino] = nuevo
+                padre[vecino] = nodo
+                heapq.heappush(cola, (nuevo, vecino))
+                generados += 1
+        if len(cola) > pico:
+            pico = len(cola)
+    if medicion is not None:
+        medicion.registrar(expandidos=expandidos, generados=generados, pico_frontera=pico)
+    return resultado
+
+
+# Igual que el cuaderno: se alterna una expansión por lado usando la misma adyacencia
+# en los dos sentidos (pensado para grafos no dirigidos).
+def busqueda_bidireccional_csr(g: GrafoCSR, inicio, objetivo, medicion=None) -> list | None:
+    if inicio == objetivo:
+        return [inicio]
+    ptr, ind = g._ptr, g._ind
+    evento = medicion.evento if medicion is not None else None
+    a, b = g.id(inicio), g.id(objetivo)
+    padre_ida = {a: -1}
+    padre_vuelta = {b: -1}
+    cola_ida, cola_vuelta = deque([a]), deque([b])
+    resultado = None
+    expandidos, pico = 0, 2
+
+    def _encuentro(nodo):
+        ida = g._camino(padre_ida, nodo)
+        vuelta = g._camino(padre_vuelta, nodo)
+        return ida + vuelta[-2::-1]
+
+    while cola_ida and cola_vuelta and resultado is None:
+        for cola, propios, otros in ((cola_ida, padre_ida, padre_vuelta),
+                                     (cola_vuelta, padre_vuelta, padre_ida)):
+            nodo = cola.popleft()
+            expandidos += 1
+            if evento is not None:
+                evento('expandir', g.nombres[nodo], len(cola))
+            for vecino in ind[ptr[nodo]:ptr[nodo + 1]]:
+                if vecino not in propios:
+                    propios[vecino] = nodo
+                    cola.append(vecino)
+                if vecino in otros:
+                    resultado = _encuentro(vecino)
+                    break
+            if resultado is not None:
+                break
+        if len(cola_ida) + len(cola_vuelta) > pico:
+            pico = len(cola_ida) + len(cola_vuelta)
+    if medicion is not None:
+        medicion.registrar(expandidos=expandidos, generados=len(padre_ida) + len(padre_vuelta),
+                           pico_frontera=pico)
+    return resultado
+
+
+# ---------- Búsquedas informadas (lab 2) ----------
+# h: dict nombre -> valor como en el cuaderno, o función h(id) (ver GrafoCSR.heuristica).
+def voraz_primero_mejor_csr(g: GrafoCSR, inicio, objetivo, h, medicion=None) -> list | None:
+    ptr, ind = g._ptr, g._ind
+    evento = medicion.evento if medicion is not None else None
+    h = g.heuristica(h)
+    origen, meta = g.id(inicio), g.id(objetivo)
+    visitados = bytearray(g.n)
+    padre = [-1] * g.n
+    cola = [(h(origen), origen)]
+    resultado = None
+    expandidos, generados, pico = 0, 1, 1
+    while cola:
+        valor, nodo = heapq.heappop(cola)
+        if nodo == meta:
+            resultado = g._camino(padre, nodo)
+            break
+        if visitados[nodo]:
+            continue
+        visitados[nodo] = 1
+        expandidos += 1
+        if evento is not None:
+            evento('expandir', g.nombres[nodo], valor)
+        for vecino in ind[ptr[nodo]:ptr[nodo + 1]]:
+            if not visitados[vecino]:
+                heapq.heappush(cola, (h(vecino), vecino))
+                padre[vecino] = nodo
+                generados += 1
+        if len(cola) > pico:
+            pico = len(cola)
+    if medicion is not None:
+        medicion.registrar(expandidos=expandidos, generados=generados, pico_frontera=pico)
+    return resultado
+
+
+# A* con tabla de mejor g (como busqueda_costo_uniforme_csr): el padre solo cambia cuando
+# el costo mejora, así que el camino y su costo siempre coinciden. Una entrada cuyo g ya
+# fue superado se descarta al sacarla; si una heurística admisible pero no consistente
+# hace que un nodo ya expandido aparezca con un g mejor, se vuelve a abrir y se expande
+# de nuevo (como a_estrella_ponderada), así el costo devuelto es el óptimo.
+def busqueda_a_estrella_csr(g: GrafoCSR, inicio, objetivo, h, medicion=None):
+    ptr, ind, pes = g._ptr, g._ind, g._pes
+    evento = medicion.evento if medicion is not None else None
+    h = g.heuristica(h)
+    origen, meta = g.id(inicio), g.id(objetivo)
+    inf = float('inf')
+    mejor = [inf] * g.n
+    padre = [-1] * g.n
+    mejor[origen] = 0
+    cola = [(h(origen), 0, origen)]
+    resultado = None, inf
+    expandidos, generados, pico = 0, 1, 1
+    while cola:
+        f, costo, nodo = heapq.heappop(cola)
+        if costo > mejor[nodo]:
+            continue
+        if nodo == meta:
+            resultado = g._camino(padre, nodo), costo
+            break
+        expandidos += 1
+        if evento is not None:
+            evento('expandir', g.nombres[nodo], f)
+        for k in range(ptr[nodo], ptr[nodo + 1]):
+            vecino = ind[k]
+            nuevo = costo + pes[k]
+            if nuevo < mejor[vecino]:
+                mejor[vecino] = nuevo
+                padre[vecino] = nodo
+                heapq.heappush(cola, (nuevo + h(vecino), nuevo, vecino))
+                generados += 1
+        if len(cola) > pico:
+            pico = len(cola)
+    if medicion is not None:
+        medicion.registrar(expandidos=expandidos, generados=generados, pico_frontera=pico)
+    return resultado
+
+
+# Misma poda que sma_estrella del cuaderno: de cada expansión solo entran a la cola los
+# 'memoria_max' hijos de menor f. El padre viaja en la entrada de la cola y se fija al
+# expandir: en el cuaderno se pisaba también el de nodos ya visitados y podía formar ciclos.
+def sma_estrella_csr(g: GrafoCSR, inicio, objetivo, h, memoria_max: int = 3, medicion=None):
+    ptr, ind, pes = g._ptr, g._ind, g._pes
+    evento = medicion.evento if medicion is not None else None
+    h = g.heuristica(h)
+    origen, meta = g.id(inicio), g.id(objetivo)
+    visitados = bytearray(g.n)
+    padre = [-1] * g.n
+    cola = [(h(origen), 0, origen, -1)]
+    resultado = None, float('inf')
+    expandidos, generados, pico = 0, 1, 1
+    while cola:
+        f, costo, nodo, desde = heapq.heappop(cola)
+        if nodo == meta:
+            padre[nodo] = desde
+            resultado = g._camino(padre, nodo), costo
+            break
+        if visitados[nodo]:
+            continue
+        visitados[nodo] = 1
+        padre[nodo] = desde
+        expandidos += 1
+        if evento is not None:
+            evento('expandir', g.nombres[nodo], f)
+        hijos = []
+        for k in range(ptr[nodo], ptr[nodo + 1]):
+            vecino = ind[k]
+            nuevo = costo + pes[k]
+            hijos.append((nuevo + h(vecino), nuevo, vecino, nodo))
+        for hijo in sorted(hijos)[:memoria_max]:
+            heapq.heappush(cola, hijo)
+            generados += 1
+        if len(cola) > pico:
+            pico = len(cola)
+    if medicion is not None:
+        medicion.registrar(expandidos=expandidos, generados=generados, pico_frontera=pico)
+    return resultado
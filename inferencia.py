@@ -0,0 +1,393 @@
+# inferencia.py
+# Motor de encadenamiento hacia adelante para las bases de inferencia.ipynb.
+#
+# Mismos formatos que el cuaderno:
+#   hechos = {'EsHumano': ['Socrates', 'Tesla'], ...}      predicado -> elementos
+#   reglas = [('EsHumano', 'EsMortal'), ...]                (antecedente, consecuente)
+#
+# Diferencias con el 'inferir' del cuaderno:
+#   - los hechos se guardan como predicado -> conjunto (dict ordenado), así que
+#     preguntar si un elemento ya está es O(1) en lugar de recorrer una lista;
+#   - las reglas se indexan por antecedente;
+#   - se llega al punto fijo: si una regla produce el antecedente de otra, también se aplica,
+#     y cada ronda solo procesa los hechos nuevos de la ronda anterior (evaluación semi-ingenua).
+#
+# Reglas con varios antecedentes (conjunción sobre el mismo elemento):
+#   reglas = [(('EsEstudiante', 'EsHumano'), 'Aprueba'), ('EsHumano', 'EsMortal')]
+# se resuelven con RedRete, que además admite afirmar/retractar hechos de a uno.
+#
+# Para preguntar por un solo hecho sin derivar todo ("¿Socrates es EsMortal?") está
+# ConsultaHaciaAtras: encadenamiento hacia atrás con tabla de sub-objetivos.
+from collections import deque
+from itertools import islice
+
+
+# predicado -> elementos, con pertenencia O(1) y orden de inserción estable
+# (un dict con valores None hace de "conjunto ordenado").
+class BaseHechos:
+
+    def __init__(self, hechos: dict[str, list] | None = None):
+        self.por_predicado: dict[str, dict] = {}
+        if hechos:
+            for predicado, elementos in hechos.items():
+                self.por_predicado[predicado] = dict.fromkeys(elementos)
+
+    def agregar(self, predicado: str, elemento) -> bool:
+        conjunto = self.por_predicado.get(predicado)
+        if conjunto is None:
+            conjunto = self.por_predicado[predicado] = {}
+        elif elemento in conjunto:
+            return False
+        conjunto[elemento] = None
+        return True
+
+    def contiene(self, predicado: str, elemento) -> bool:
+        conjunto = self.por_predicado.get(predicado)
+        return conjunto is not None and elemento in conjunto
+
+    def elementos(self, predicado: str):
+        return self.por_predicado.get(predicado, {}).keys()
+
+    def __len__(self):
+        return sum(len(c) for c in self.por_predicado.values())
+
+    # Vuelve al formato del cuaderno (predicado -> lista).
+    def como_dict(self) -> dict[str, list]:
+        return {predicado: list(conjunto) for predicado, conjunto in self.por_predicado.items()}
+
+
+class MotorInferencia:
+
+    def __init__(self, reglas: list[tuple[str, str]]):
+        self.reglas = list(reglas)
+        # antecedente -> consecuentes, sin repetir y en el orden de la lista de reglas
+        self.por_antecedente: dict[str, list[str]] = {}
+        for antecedente, consecuente in self.reglas:
+            consecuentes = self.por_antecedente.setdefault(antecedente, [])
+            if consecuente not in consecuentes:
+                consecuentes.append(consecuente)
+        self.rondas = 0
+
+    # Aplica las reglas hasta el punto fijo y devuelve las conclusiones nuevas
+    # ('<elemento> es <consecuente>') en el orden en que se derivaron.
+    #
+    # La primera ronda recorre las reglas en orden, como el cuaderno, así que con reglas
+    # que no se encadenan las conclusiones salen en el mismo orden que con 'inferir' original.
+    # Las rondas siguientes solo miran el delta: los hechos derivados en la ronda anterior.
+    def inferir(self, base: BaseHechos) -> list[str]:
+        conclusiones = []
+        delta: dict[str, list] = {}
+
+        for antecedente, consecuente in self.reglas:
+            conjunto = base.por_predicado.get(antecedente)
+            if not conjunto:
+                continue
+            # copia: si antecedente == consecuente el conjunto cambiaría durante el recorrido
+            for elem in list(conjunto):
+                if base.agregar(consecuente, elem):
+                    delta.setdefault(consecuente, []).append(elem)
+                    conclusiones.append(f'{elem} es {consecuente}')
+        self.rondas = 1
+
+        while delta:
+            nuevo: dict[str, list] = {}
+            for predicado, elementos in delta.items():
+                for consecuente in self.por_antecedente.get(predicado, ()):
+                    for elem in elementos:
+                        if base.agregar(consecuente, elem):
+                            nuevo.setdefault(consecuente, []).append(elem)
+                            conclusiones.append(f'{elem} es {consecuente}')
+            delta = nuevo
+            self.rondas += 1
+        return conclusiones
+
+
+# ---------- Red Rete (reglas con conjunciones) ----------
+# Una regla (antecedente, consecuente) o ((a1, a2, ...), consecuente) pasa a (tupla, consecuente),
+# sin antecedentes repetidos y respetando su orden.
+def _normalizar_regla(regla) -> tuple[tuple[str, ...], str]:
+    antecedente, consecuente = regla
+    if isinstance(antecedente, str):
+        return (antecedente,), consecuente
+    return tuple(dict.fromkeys(antecedente)), consecuente
+
+
+# Nodo beta: elementos que cumplen todas las condiciones de un prefijo de antecedentes.
+# 'condicion' es la última del prefijo y 'padre' el nodo del prefijo sin ella (None si es
+# la primera). Reglas con el mismo prefijo comparten nodos.
+class _NodoBeta:
+    __slots__ = ('condicion', 'padre', 'memoria', 'hijos', 'consecuentes')
+
+    def __init__(self, condicion: str, padre: '_NodoBeta | None'):
+        self.condicion = condicion
+        self.padre = padre
+        self.memoria: set = set()
+        self.hijos: list[_NodoBeta] = []
+        self.consecuentes: list[str] = []   # reglas que terminan en este prefijo
+
+
+class RedRete:
+    """
+    Red de coincidencias estilo Rete para reglas conjuntivas sobre un mismo elemento.
+    - Memorias alfa: los hechos por predicado (una BaseHechos).
+    - Memorias beta: un nodo por prefijo de antecedentes, con los elementos que ya cumplen
+      ese prefijo; se conservan entre inserciones, así que afirmar un hecho solo toca los
+      nodos cuya condición es ese predicado y las coincidencias que cambian.
+    - Retractar usa "borrar y re-derivar": se borra todo lo que dependía del hecho y luego se
+      restaura lo que sigue teniendo otra derivación (sirve también con reglas cíclicas).
+    Solo se retractan hechos afirmados; los derivados desaparecen cuando pierden su soporte.
+    """
+
+    def __init__(self, reglas: list[tuple]):
+        self.base = BaseHechos()
+        self.afirmados: set[tuple[str, object]] = set()
+        self._nodos: dict[tuple[str, ...], _NodoBeta] = {}
+        self.por_condicion: dict[str, list[_NodoBeta]] = {}   # activación por la derecha
+        self.productores: dict[str, list[_NodoBeta]] = {}     # consecuente -> nodos finales
+        for regla in reglas:
+            antecedentes, consecuente = _normalizar_regla(regla)
+            nodo = self._nodo(antecedentes)
+            if consecuente not in nodo.consecuentes:
+                nodo.consecuentes.append(consecuente)
+                self.productores.setdefault(consecuente, []).append(nodo)
+
+    def _nodo(self, prefijo: tuple[str, ...]) -> _NodoBeta:
+        nodo = self._nodos.get(prefijo)
+        if nodo is None:
+            padre = self._nodo(prefijo[:-1]) if len(prefijo) > 1 else None
+            nodo = self._nodos[prefijo] = _NodoBeta(prefijo[-1], padre)
+            if padre is not None:
+                padre.hijos.append(nodo)
+            self.por_condicion.setdefault(prefijo[-1], []).append(nodo)
+        return nodo
+
+    # Procesa la agenda de hechos por agregar (predicado, elemento, es_derivado) y devuelve
+    # las conclusiones nuevas. Sin recursión: las cadenas largas de reglas no agotan la pila.
+    def _propagar(self, agenda: deque) -> list[str]:
+        conclusiones = []
+        base = self.base
+        while agenda:
+            predicado, elem, derivado = agenda.popleft()
+            if not base.agregar(predicado, elem):
+                continue
+            if derivado:
+                conclusiones.append(f'{elem} es {predicado}')
+            pila = [n for n in self.por_condicion.get(predicado, ())
+                    if n.padre is None or elem in n.padre.memoria]
+            while pila:
+                nodo = pila.pop()
+                if elem in nodo.memoria:
+                    continue
+                nodo.memoria.add(elem)
+                for consecuente in nodo.consecuentes:
+                    agenda.append((consecuente, elem, True))
+                for hijo in nodo.hijos:
+                    if base.contiene(hijo.condicion, elem):
+                        pila.append(hijo)
+        return conclusiones
+
+    # Carga un diccionario de hechos (formato del cuaderno) y devuelve lo derivado.
+    def cargar(self, hechos: dict[str, list]) -> list[str]:
+        agenda = deque()
+        for predicado, elementos in hechos.items():
+            for elem in elementos:
+                self.afirmados.add((predicado, elem))
+                agenda.append((predicado, elem, False))
+        return self._propagar(agenda)
+
+    def afirmar(self, predicado: str, elemento) -> list[str]:
+        self.afirmados.add((predicado, elemento))
+        return self._propagar(deque([(predicado, elemento, False)]))
+
+    # Devuelve los hechos que dejaron de valer ('<elemento> es <predicado>'), incluido el
+    # propio si no tenía otra derivación.
+    def retractar(self, predicado: str, elemento) -> list[str]:
+        if (predicado, elemento) not in self.afirmados:
+            return []
+        self.afirmados.discard((predicado, elemento))
+        base = self.base
+
+        # 1) borrar en cascada todo lo que se apoyaba (directa o indirectamente) en el hecho
+        borrados = []
+        pendientes = deque([(predicado, elemento)])
+        while pendientes:
+            pred, elem = pendientes.popleft()
+            conjunto = base.por_predicado.get(pred)
+            if conjunto is None or elem not in conjunto:
+                continue
+            del conjunto[elem]
+            borrados.append((pred, elem))
+            pila = [n for n in self.por_condicion.get(pred, ()) if elem in n.memoria]
+            while pila:
+                nodo = pila.pop()
+                if elem not in nodo.memoria:
+                    continue
+                nodo.memoria.discard(elem)
+                for consecuente in nodo.consecuentes:
+                    if (consecuente, elem) not in self.afirmados:
+                        pendientes.append((consecuente, elem))
+                pila.extend(h for h in nodo.hijos if elem in h.memoria)
+
+        # 2) re-derivar lo borrado que todavía tiene una regla completa o fue afirmado
+        agenda = deque()
+        for pred, elem in borrados:
+            if (pred, elem) in self.afirmados or \
+                    any(elem in n.memoria for n in self.productores.get(pred, ())):
+                agenda.append((pred, elem, False))
+        self._propagar(agenda)
+        return [f'{elem} es {pred}' for pred, elem in borrados if not base.contiene(pred, elem)]
+
+    def contiene(self, predicado: str, elemento) -> bool:
+        return self.base.contiene(predicado, elemento)
+
+
+# ---------- Encadenamiento hacia atrás ----------
+class ConsultaHaciaAtras:
+    """
+    Responde '¿elemento es predicado?' mirando solo las reglas que pueden llevar a esa meta.
+    1) Hacia atrás desde la meta se juntan los sub-objetivos (predicado, elemento) relevantes;
+       los que ya son hechos o ya están en la tabla no se expanden.
+    2) Sobre esos sub-objetivos se propaga hacia adelante contando antecedentes pendientes por
+       regla (cada regla se mira una vez por antecedente: tiempo lineal en las reglas relevantes).
+    Cada sub-objetivo resuelto (verdadero o falso) queda en la tabla, así que las sub-pruebas
+    compartidas se calculan una sola vez, también entre consultas. Las reglas cíclicas terminan
+    porque cada sub-objetivo se visita una sola vez.
+    Si los hechos cambian hay que llamar a invalidar().
+    """
+
+    def __init__(self, hechos: dict[str, list] | BaseHechos, reglas: list[tuple]):
+        self.base = hechos if isinstance(hechos, BaseHechos) else BaseHechos(hechos)
+        self.por_consecuente: dict[str, list[tuple[str, ...]]] = {}
+        for regla in reglas:
+            antecedentes, consecuente = _normalizar_regla(regla)
+            self.por_consecuente.setdefault(consecuente, []).append(antecedentes)
+        self.tabla: dict[tuple[str, object], bool] = {}
+        # por qué es verdadero cada sub-objetivo: antecedentes de la regla usada (None = hecho)
+        self.justificacion: dict[tuple[str, object], tuple[str, ...] | None] = {}
+
+    def invalidar(self) -> None:
+        self.tabla.clear()
+        self.justificacion.clear()
+
+    def _verdadero(self, meta: tuple[str, object], antecedentes) -> None:
+        self.tabla[meta] = True
+        self.justificacion[meta] = antecedentes
+
+    def _resolver(self, predicado: str, elemento) -> bool:
+        tabla = self.tabla
+        if (predicado, elemento) in tabla:
+            return tabla[(predicado, elemento)]
+
+        # 1) sub-objetivos relevantes que todavía no tienen respuesta
+        abiertos = {}
+        pila = [predicado]
+        while pila:
+            pred = pila.pop()
+            meta = (pred, elemento)
+            if pred in abiertos or meta in tabla:
+                continue
+            if self.base.contiene(pred, elemento):
+                self._verdadero(meta, None)
+                continue
+            abiertos[pred] = None
+            for antecedentes in self.por_consecuente.get(pred, ()):
+                pila.extend(antecedentes)
+
+        # 2) propagación hacia adelante sobre las reglas de los sub-objetivos abiertos
+        pendientes = []      # por regla: antecedentes que faltan probar
+        reglas = []          # por regla: (consecuente, antecedentes)
+        esperan: dict[str, list[int]] = {}
+        listos = []
+        for pred in abiertos:
+            for antecedentes in self.por_consecuente.get(pred, ()):
+                valores = [tabla.get((a, elemento)) for a in antecedentes]
+                if False in valores:
+                    continue        # un antecedente ya es falso: la regla nunca se completa
+                i = len(reglas)
+                faltan = 0
+                for a, valor in zip(antecedentes, valores):
+                    if valor is None:
+                        faltan += 1
+                        esperan.setdefault(a, []).append(i)
+                if faltan == 0:
+                    listos.append((pred, antecedentes))
+                reglas.append((pred, antecedentes))
+                pendientes.append(faltan)
+
+        while listos:
+            pred, antecedentes = listos.pop()
+            meta = (pred, elemento)
+            if meta in tabla:
+                continue
+            self._verdadero(meta, antecedentes)
+            for i in esperan.get(pred, ()):
+                pendientes[i] -= 1
+                if pendientes[i] == 0:
+                    listos.append(reglas[i])
+
+        # lo que no se pudo probar es falso (se exploraron todas sus reglas)
+        for pred in abiertos:
+            tabla.setdefault((pred, elemento), False)
+        return tabla[(predicado, elemento)]
+
+    # Con traza=True devuelve (resultado, líneas de la prueba). En la prueba, cada hecho
+    # derivado muestra la regla usada y debajo sus premisas; una sub-prueba que ya apareció
+    # no se repite.
+    def consultar(self, predicado: str, elemento, traza: bool = False):
+        resultado = self._resolver(predicado, elemento)
+        if not traza:
+            return resultado
+        return resultado, self.prueba(predicado, elemento) if resultado else []
+
+    def prueba(self, predicado: str, elemento) -> list[str]:
+        if not self._resolver(predicado, elemento):
+            return []
+        lineas = []
+        vistos = set()
+        pila = [(predicado, 0)]
+        while pila:
+            pred, nivel = pila.pop()
+            sangria = '  ' * nivel
+            antecedentes = self.justificacion[(pred, elemento)]
+            if antecedentes is None:
+                lineas.append(f'{sangria}{elemento} es {pred}  (hecho)')
+            elif pred in vistos:
+                lineas.append(f'{sangria}{elemento} es {pred}  (ya probado)')
+            else:
+                vistos.add(pred)
+                lineas.append(f'{sangria}{elemento} es {pred}  <- {" y ".join(antecedentes)}')
+                pila.extend((a, nivel + 1) for a in reversed(antecedentes))
+        return lineas
+
+
+# Consulta única hacia atrás con los formatos del cuaderno.
+def consultar_hacia_atras(hechos: dict[str, list], reglas: list[tuple], hecho: str, elemento,
+                          traza: bool = False):
+    return ConsultaHaciaAtras(hechos, reglas).consultar(hecho, elemento, traza)
+
+
+# Reemplazo directo del 'inferir' del cuaderno: mismo argumento 'hechos' (predicado -> lista),
+# que también queda actualizado en el lugar, y misma lista de conclusiones.
+# Si alguna regla tiene varios antecedentes se usa la red Rete en lugar del motor semi-ingenuo.
+def inferir(hechos: dict[str, list], reglas: list[tuple]) -> list[str]:
+    if any(not isinstance(antecedente, str) for antecedente, _ in reglas):
+        red = RedRete(reglas)
+        previos = {predicado: len(dict.fromkeys(elementos)) for predicado, elementos in hechos.items()}
+        conclusiones = red.cargar(hechos)
+        base = red.base
+    else:
+        base = BaseHechos(hechos)
+        previos = {predicado: len(conjunto) for predicado, conjunto in base.por_predicado.items()}
+        conclusiones = MotorInferencia(reglas).inferir(base)
+    # lo nuevo de cada predicado es lo que quedó después de los elementos que ya tenía
+    for predicado, conjunto in base.por_predicado.items():
+        n = previos.get(predicado, 0)
+        if len(conjunto) > n:
+            hechos.setdefault(predicado, []).extend(islice(conjunto, n, None))
+    return conclusiones
+
+
+def consultar(hechos: dict[str, list] | BaseHechos, hecho: str, elemento) -> bool:
+    if isinstance(hechos, BaseHechos):
+        return hechos.contiene(hecho, elemento)
+    return elemento in hechos.get(hecho, [])
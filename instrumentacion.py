@@ -0,0 +1,83 @@
+# instrumentacion.py
+# Medición común para las búsquedas (grafo_csr, anchura, costo_uniforme, memoria_acotada y
+# dls/iddfs de Proyecto IA/main.py), en lugar de los print paso a paso de los cuadernos.
+#
+#   m = Medicion()                               # solo contadores
+#   with m.fase('busqueda'):
+#       busqueda_costo_uniforme_csr(g, 'A', 'F', medicion=m)
+#   m.como_dict()   # {'contadores': {'expandidos': .., 'generados': ..},
+#                   #  'picos': {'pico_frontera': ..}, 'fases': {'busqueda': {'segundos': ..}}}
+#
+#   m = Medicion(eventos=print)                  # además, un evento por paso: (tipo, nodo, valor)
+#
+# Las búsquedas cuentan en variables locales y entregan los totales al terminar; sin
+# medicion (None) no hacen nada más. El flujo de eventos sale de 'medicion.evento', que es
+# None si no se pidió: el bucle solo paga un 'if evento is not None'.
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Medicion:
+
+    def __init__(self, eventos=None, memoria: bool = False):
+        self.contadores: dict[str, int] = {}
+        self.picos: dict[str, int] = {}
+        self.fases: dict[str, dict] = {}
+        self.memoria = memoria       # medir asignaciones por fase con tracemalloc (lento)
+        # eventos: None (desactivado), una lista (se agregan tuplas) o una función f(tipo, nodo, valor)
+        if eventos is None:
+            self.evento = None
+        elif isinstance(eventos, list):
+            self.evento = lambda tipo, nodo, valor: eventos.append((tipo, nodo, valor))
+        else:
+            self.evento = eventos
+
+    # Suma contadores; los que empiezan con 'pico_' se quedan con el máximo.
+    def registrar(self, **valores) -> None:
+        for nombre, valor in valores.items():
+            if nombre.startswith('pico_'):
+                if valor > self.picos.get(nombre, 0):
+                    self.picos[nombre] = valor
+            else:
+                self.contadores[nombre] = self.contadores.get(nombre, 0) + valor
+
+    # Tiempo (y, con memoria=True, pico de bytes asignados) de un bloque. Las fases con el
+    # mismo nombre se acumulan.
+    @contextmanager
+    def fase(self, nombre: str):
+        propio = self.memoria and not tracemalloc.is_tracing()
+        if propio:
+            tracemalloc.start()
+        if self.memoria:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield self
+        finally:
+            datos = self.fases.setdefault(nombre, {'veces': 0, 'segundos': 0.0})
+            datos['veces'] += 1
+            datos['segundos'] += time.perf_counter() - t0
+            if self.memoria:
+                pico = tracemalloc.get_traced_memory()[1] - base
+                datos['bytes_pico'] = max(datos.get('bytes_pico', 0), pico)
+                if propio:
+                    tracemalloc.stop()
+
+    # Función para el parámetro 'traza' de dls/iddfs (main.py): cuenta las visitas y, si hay
+    # flujo de eventos, emite ('visitar', palabra, nivel). Para solo contar conviene más
+    # TRAZA_CONTAR, que no llama a nada por nodo.
+    def traza(self):
+        contadores, evento = self.contadores, self.evento
+
+        def visitar(palabra, suma, nivel, *_):
+            contadores['visitados'] = contadores.get('visitados', 0) + 1
+            if evento is not None:
+                evento('visitar', palabra, nivel)
+        return visitar
+
+    def como_dict(self) -> dict:
+        fases = {nombre: dict(datos, segundos=round(datos['segundos'], 6))
+                 for nombre, datos in self.fases.items()}
+        return {'contadores': dict(self.contadores), 'picos': dict(self.picos), 'fases': fases}
@@ -0,0 +1,157 @@
+# landmarks.py
+# Heurísticas ALT (A*, landmarks y desigualdad triangular) para las búsquedas de "lab 2".
+#
+# En lugar de escribir a mano un dict 'heuristica' con un valor por nodo, se eligen k nodos
+# "landmark" L y se guardan las distancias d(L, v) y d(v, L) a todos los nodos. Para un
+# objetivo t, por la desigualdad triangular:
+#   d(v, t) >= d(L, t) - d(L, v)      y      d(v, t) >= d(v, L) - d(t, L)
+# así que el máximo de esas cotas sobre todos los L es una heurística admisible.
+#
+#   lm = LandmarksALT.preparar(g, k=8)             # g = GrafoCSR.desde_dict(grafo)
+#   lm.guardar('grafo.alt')                        # después: LandmarksALT.cargar(g, 'grafo.alt')
+#   h = lm.heuristica('F')
+#   busqueda_a_estrella(grafo, 'A', 'F', h)        # cuaderno: usa h[nombre]
+#   busqueda_a_estrella_csr(g, 'A', 'F', h)        # grafo_csr: usa h(id)
+#
+# Cada Dijkstra de preparación es independiente, así que se reparten en un pool de procesos.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from costo_uniforme import Dijkstra
+from grafo_csr import GrafoCSR
+
+SELECCIONES = ('lejanos', 'aleatoria')
+
+# ---------- Trabajadores del pool ----------
+# Cada proceso recibe los arreglos del grafo una sola vez (initializer) y después solo ids.
+_grafo_trabajador: dict = {}
+
+
+def _iniciar_trabajador(indptr, indices, pesos) -> None:
+    g = GrafoCSR(indptr, indices, pesos)
+    _grafo_trabajador['directo'] = g
+    _grafo_trabajador['inverso'] = g.transpuesto()
+
+
+def _distancias_trabajador(landmark: int, inverso: bool) -> np.ndarray:
+    return _distancias(_grafo_trabajador['inverso' if inverso else 'directo'], landmark)
+
+
+# cola='auto': cubetas con pesos enteros chicos, heap en cualquier otro caso.
+def _distancias(g: GrafoCSR, landmark: int) -> np.ndarray:
+    return Dijkstra(g, 'auto').distancias(g.nombres[landmark])
+
+
+class LandmarksALT:
+    """
+    Tabla de distancias de k landmarks: fila v = [d(L0, v) .. d(Lk-1, v), d(v, L0) .. d(v, Lk-1)].
+    Una fila por nodo para que la cota de un nodo lea memoria contigua.
+    """
+
+    def __init__(self, g: GrafoCSR, landmarks: np.ndarray, tabla: np.ndarray):
+        self.g = g
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.k = len(self.landmarks)
+        self.tabla = tabla
+
+    # ---------- Preparación ----------
+    # seleccion='lejanos': cada landmark nuevo es el nodo alcanzable más lejos de los ya
+    # elegidos (las d(L, v) se calculan en orden, hacen falta para elegir el siguiente) y
+    # solo las d(v, L) van al pool. 'aleatoria': k nodos al azar y todo va al pool.
+    @classmethod
+    def preparar(cls, g: GrafoCSR, k: int = 8, seleccion: str = 'lejanos', semilla: int = 0,
+                 procesos: int | None = None) -> 'LandmarksALT':
+        if g.pesos is None:
+            raise ValueError("El grafo no tiene pesos")
+        if seleccion not in SELECCIONES:
+            raise ValueError(f"Selección desconocida: {seleccion!r} (use {' o '.join(SELECCIONES)})")
+        k = min(k, g.n)
+        procesos = procesos or os.cpu_count() or 1
+        rng = np.random.default_rng(semilla)
+        tabla = np.empty((g.n, 2 * k), dtype=np.float64)
+
+        if seleccion == 'lejanos':
+            landmarks = [int(rng.integers(g.n))]
+            cercania = np.full(g.n, np.inf)      # distancia al landmark más cercano
+            for i in range(k):
+                tabla[:, i] = _distancias(g, landmarks[i])
+                np.minimum(cercania, tabla[:, i], out=cercania)
+                if i + 1 < k:
+                    candidatos = np.where(np.isfinite(cercania), cercania, -1.0)
+                    candidatos[landmarks] = -1.0
+                    landmarks.append(int(np.argmax(candidatos)))
+            trabajos = [(i, landmarks[i], True) for i in range(k)]
+        else:
+            landmarks = rng.choice(g.n, size=k, replace=False).tolist()
+            trabajos = [(i, l, False) for i, l in enumerate(landmarks)]
+            trabajos += [(i, l, True) for i, l in enumerate(landmarks)]
+
+        if procesos <= 1 or len(trabajos) <= 1:
+            inverso = g.transpuesto()
+            for i, l, es_inverso in trabajos:
+                tabla[:, i + k if es_inverso else i] = _distancias(inverso if es_inverso else g, l)
+        else:
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                                     initargs=(g.indptr, g.indices, g.pesos)) as pool:
+                futuros = [(i, es_inverso, pool.submit(_distancias_trabajador, l, es_inverso))
+                           for i, l, es_inverso in trabajos]
+                for i, es_inverso, futuro in futuros:
+                    tabla[:, i + k if es_inverso else i] = futuro.result()
+        return cls(g, np.array(landmarks), tabla)
+
+    # ---------- Archivo ----------
+    # Formato: int64 [k, n], int64 landmarks[k], float64 tabla[n, 2k]. Al cargar, la tabla es
+    # un np.memmap de solo lectura: el sistema operativo trae a memoria solo las filas usadas.
+    def guardar(self, ruta: str) -> None:
+        tmp = ruta + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.array([self.k, self.g.n], dtype=np.int64).tofile(f)
+            self.landmarks.tofile(f)
+            np.ascontiguousarray(self.tabla, dtype=np.float64).tofile(f)
+        os.replace(tmp, ruta)
+
+    @classmethod
+    def cargar(cls, g: GrafoCSR, ruta: str) -> 'LandmarksALT':
+        k, n = np.fromfile(ruta, dtype=np.int64, count=2).tolist()
+        if n != g.n:
+            raise ValueError(f"La tabla es de un grafo con {n} nodos y este tiene {g.n}")
+        landmarks = np.fromfile(ruta, dtype=np.int64, count=k, offset=16)
+        tabla = np.memmap(ruta, dtype=np.float64, mode='r', offset=16 + 8 * k, shape=(n, 2 * k))
+        return cls(g, landmarks, tabla)
+
+    # ---------- Heurística ----------
+    def heuristica(self, objetivo) -> 'HeuristicaALT':
+        return HeuristicaALT(self, self.g.id(objetivo))
+
+
+class HeuristicaALT:
+    """
+    h(v) hacia un objetivo fijo, calculada a pedido y recordada. Sirve como 'heuristica' en
+    las dos formas: h[nombre] (cuadernos) y h(id) (búsquedas *_csr y memoria_acotada).
+    """
+
+    def __init__(self, alt: LandmarksALT, objetivo: int):
+        self.g = alt.g
+        self.tabla = alt.tabla
+        k = alt.k
+        fila = np.asarray(self.tabla[objetivo])
+        # cota_L = d(L, t) - d(L, v)  y  d(v, L) - d(t, L):  base + signo * fila_v
+        self._base = np.concatenate([fila[:k], -fila[k:]])
+        self._signo = np.concatenate([-np.ones(k), np.ones(k)])
+        self._valores: dict[int, float] = {}
+
+    def __call__(self, v: int) -> float:
+        valor = self._valores.get(v)
+        if valor is None:
+            # inf - inf da nan (ni L llega a v ni a t): esa cota no dice nada y fmax la ignora
+            with np.errstate(invalid='ignore'):
+                cotas = self._base + self._signo * self.tabla[v]
+            valor = float(np.fmax.reduce(cotas))
+            valor = valor if valor > 0 else 0.0
+            self._valores[v] = valor
+        return valor
+
+    def __getitem__(self, nombre) -> float:
+        return self(self.g.id(nombre))
@@ -0,0 +1,345 @@
+# memoria_acotada.py
+# Búsquedas informadas con memoria controlada sobre GrafoCSR (grafo_csr.py).
+#
+#   sma_estrella_acotada   SMA* de verdad: como mucho 'memoria_max' nodos del árbol de
+#                          búsqueda en memoria; al llenarse se olvida la peor hoja y su f
+#                          queda respaldada en el padre.
+#   ida_estrella           IDA*: profundización iterativa sobre f, solo guarda el camino actual.
+#   a_estrella_ponderada   A* con f = g + peso * h: con peso > 1 expande menos nodos y el
+#                          costo encontrado es a lo sumo peso veces el óptimo.
+#
+# Reciben lo mismo que las búsquedas de "lab 2" (inicio, objetivo y heuristica como dict
+# nombre -> valor o función h(id)) y devuelven (camino, costo), o (None, inf) si no hay
+# solución. El conjunto de cerrados es un bytearray por id y no un set de nombres.
+# Si se pasa 'estadisticas' (un dict), se completa con:
+#   expansiones, generados, pico_abierta, pico_cerrada, segundos, expansiones_por_segundo
+# y con 'medicion' (instrumentacion.Medicion) se registran expandidos, generados,
+# pico_frontera y pico_cerrados.
+import heapq
+import time
+
+from grafo_csr import GrafoCSR
+
+INF = float('inf')
+
+
+def _cerrar_estadisticas(estadisticas: dict | None, medicion, t0: float, expansiones: int,
+                         generados: int, pico_abierta: int, pico_cerrada: int, **extra) -> None:
+    if medicion is not None:
+        medicion.registrar(expandidos=expansiones, generados=generados, pico_frontera=pico_abierta,
+                           pico_cerrados=pico_cerrada)
+    if estadisticas is None:
+        return
+    segundos = time.perf_counter() - t0
+    estadisticas.update(expansiones=expansiones, generados=generados, pico_abierta=pico_abierta,
+                        pico_cerrada=pico_cerrada, segundos=round(segundos, 6),
+                        expansiones_por_segundo=round(expansiones / segundos) if segundos > 0 else 0,
+                        **extra)
+
+
+# ---------- A* ponderado ----------
+# Tabla de mejor g como busqueda_a_estrella_csr. Con peso > 1 la heurística deja de ser
+# consistente, así que un nodo ya expandido se vuelve a abrir si aparece un g mejor.
+def a_estrella_ponderada(g: GrafoCSR, inicio, objetivo, h, peso: float = 1.5,
+                         estadisticas: dict | None = None, medicion=None):
+    t0 = time.perf_counter()
+    ptr, ind, pes = g._ptr, g._ind, g._pes
+    h = g.heuristica(h)
+    origen, meta = g.id(inicio), g.id(objetivo)
+    mejor = [INF] * g.n
+    padre = [-1] * g.n
+    cerrado = bytearray(g.n)
+    cerrados = 0
+    mejor[origen] = 0
+    cola = [(peso * h(origen), 0, origen)]
+    expansiones, generados, pico_abierta = 0, 1, 1
+    resultado = None, INF
+    while cola:
+        _, costo, nodo = heapq.heappop(cola)
+        if costo > mejor[nodo]:
+            continue
+        if nodo == meta:
+            resultado = g._camino(padre, nodo), costo
+            break
+        if not cerrado[nodo]:
+            cerrado[nodo] = 1
+            cerrados += 1
+        expansiones += 1
+        for k in range(ptr[nodo], ptr[nodo + 1]):
+            vecino = ind[k]
+            nuevo = costo + pes[k]
+            if nuevo < mejor[vecino]:
+                mejor[vecino] = nuevo
+                padre[vecino] = nodo
+                heapq.heappush(cola, (nuevo + peso * h(vecino), nuevo, vecino))
+                generados += 1
+        if len(cola) > pico_abierta:
+            pico_abierta = len(cola)
+    _cerrar_estadisticas(estadisticas, medicion, t0, expansiones, generados, pico_abierta, cerrados)
+    return resultado
+
+
+# ---------- IDA* ----------
+# Cada iteración es una búsqueda en profundidad que corta donde f supera el umbral; el
+# umbral siguiente es la menor f que quedó afuera. La pila de marcos [nodo, g, próxima
+# arista] es el camino actual y en_camino evita ciclos sobre ese camino.
+def ida_estrella(g: GrafoCSR, inicio, objetivo, h, estadisticas: dict | None = None,
+                 medicion=None):
+    t0 = time.perf_counter()
+    ptr, ind, pes = g._ptr, g._ind, g._pes
+    h = g.heuristica(h)
+    origen, meta = g.id(inicio), g.id(objetivo)
+    en_camino = bytearray(g.n)
+    umbral = h(origen)
+    expansiones, generados, pico_abierta, iteraciones = 0, 1, 1, 0
+    resultado = None, INF
+    if origen == meta:
+        umbral = INF
+        resultado = [inicio], 0
+    while umbral < INF:
+        iteraciones += 1
+        siguiente = INF
+        pila = [[origen, 0, ptr[origen]]]
+        en_camino[origen] = 1
+        expansiones += 1
+        while pila:
+            marco = pila[-1]
+            nodo, costo, k = marco
+            if k == ptr[nodo + 1]:
+                en_camino[nodo] = 0
+                pila.pop()
+                continue
+            marco[2] = k + 1
+            vecino = ind[k]
+            if en_camino[vecino]:
+                continue
+            generados += 1
+            nuevo = costo + pes[k]
+            f = nuevo + h(vecino)
+            if f > umbral:
+                if f < siguiente:
+                    siguiente = f
+                continue
+            if vecino == meta:
+                resultado = [g.nombres[m[0]] for m in pila] + [g.nombres[vecino]], nuevo
+                break
+            en_camino[vecino] = 1
+            pila.append([vecino, nuevo, ptr[vecino]])
+            expansiones += 1
+            if len(pila) > pico_abierta:
+                pico_abierta = len(pila)
+        if resultado[0] is not None:
+            break
+        umbral = siguiente
+    _cerrar_estadisticas(estadisticas, medicion, t0, expansiones, generados, pico_abierta, 0,
+                         iteraciones=iteraciones)
+    return resultado
+
+
+# ---------- SMA* ----------
+# Búsqueda en árbol con a lo sumo 'memoria_max' nodos vivos (huecos reutilizables):
+#   - se elige el mejor abierto (menor f, el más profundo ante empate) y se genera un solo
+#     sucesor por vez; f(hijo) = max(f(padre), g + h) para que f no baje por el camino;
+#   - un sucesor que quedaría a profundidad memoria_max - 1 sin ser el objetivo no se genera:
+#     su camino ya no entra en memoria;
+#   - tampoco se genera un estado que ya está vivo con g y profundidad menores o iguales
+#     (detección de duplicados limitada a lo que hay en memoria; cubre también los ciclos);
+#   - con la memoria llena se olvida la peor hoja abierta (mayor f, la menos profunda): el
+#     padre guarda su f por arista en 'olvidados', vuelve a la frontera y, si la regenera,
+#     la hoja recupera ese f;
+#   - cuando un nodo ya pasó por todas sus aristas, su f es el menor entre sus hijos y los
+#     olvidados, y el cambio se propaga hacia la raíz.
+# Un nodo sale de la frontera cuando no le queda sucesor por generar. Una hoja sin sucesores
+# queda con f = inf, es la primera en olvidarse y el padre no la regenera.
+# Con memoria suficiente para el camino óptimo el resultado es óptimo; si no alcanza,
+# devuelve (None, inf).
+def sma_estrella_acotada(g: GrafoCSR, inicio, objetivo, h, memoria_max: int = 1000,
+                         estadisticas: dict | None = None, medicion=None):
+    if memoria_max < 1:
+        raise ValueError("memoria_max debe ser al menos 1")
+    t0 = time.perf_counter()
+    ptr, ind, pes = g._ptr, g._ind, g._pes
+    h = g.heuristica(h)
+    origen, meta = g.id(inicio), g.id(objetivo)
+
+    # un hueco por nodo del árbol de búsqueda; 'gen' cambia al reutilizarlo e invalida
+    # las entradas viejas de los heaps
+    M = memoria_max
+    estado = [0] * M
+    costo = [0] * M
+    f = [0.0] * M
+    padre = [-1] * M
+    arista = [-1] * M        # arista del padre que generó el nodo
+    prof = [0] * M
+    sig = [0] * M            # próxima arista a mirar al generar sucesores
+    hijos = [None] * M       # arista -> hueco, de los hijos en memoria
+    olvidados = [None] * M   # arista -> f respaldado, de los hijos olvidados
+    completo = bytearray(M)  # ya pasó por todas sus aristas al menos una vez
+    abierto = bytearray(M)
+    gen = [0] * M
+    mejor_vivo = {}          # estado -> hueco vivo con menor g para ese estado
+    libres = list(range(M - 1, -1, -1))
+    mejores = []             # (f, -prof, gen, hueco)   frontera
+    peores = []              # (-f, prof, gen, hueco)   hojas de la frontera
+    vivos = en_frontera = 0
+    expansiones = generados = olvidos = 0
+
+    def encolar(s):
+        heapq.heappush(mejores, (f[s], -prof[s], gen[s], s))
+        if not hijos[s]:
+            heapq.heappush(peores, (-f[s], prof[s], gen[s], s))
+
+    def abrir(s):
+        nonlocal en_frontera
+        if not abierto[s]:
+            abierto[s] = 1
+            en_frontera += 1
+        encolar(s)
+
+    def cerrar(s):
+        nonlocal en_frontera
+        if abierto[s]:
+            abierto[s] = 0
+            en_frontera -= 1
+
+    def crear(e, c, fv, p, k, d):
+        nonlocal vivos, generados
+        s = libres.pop()
+        gen[s] += 1
+        estado[s], costo[s], f[s], padre[s], arista[s], prof[s] = e, c, fv, p, k, d
+        sig[s] = ptr[e]
+        hijos[s] = {}
+        olvidados[s] = {}
+        completo[s] = 0
+        otro = mejor_vivo.get(e)
+        if otro is None or (costo[otro], prof[otro]) > (c, d):
+            mejor_vivo[e] = s
+        vivos += 1
+        generados += 1
+        abrir(s)
+        return s
+
+    def en_ancestros(s, e):
+        while s != -1:
+            if estado[s] == e:
+                return True
+            s = padre[s]
+        return False
+
+    # Próxima arista de 's' con un sucesor por generar, dando la vuelta desde 'sig';
+    # -1 si no queda ninguna. Las aristas dominadas por un duplicado vivo se descartan
+    # también de 'olvidados': ese camino ya está cubierto por otro más barato.
+    def pendiente(s):
+        ini, fin = ptr[estado[s]], ptr[estado[s] + 1]
+        k = sig[s]
+        hondo = prof[s] + 1 >= M - 1
+        for _ in range(fin - ini):
+            if k == fin:
+                k = ini
+                completo[s] = 1
+            v = ind[k]
+            if k not in hijos[s] and olvidados[s].get(k) != INF and (not hondo or v == meta):
+                otro = mejor_vivo.get(v)
+                if ((otro is None or costo[otro] > costo[s] + pes[k] or prof[otro] > prof[s] + 1)
+                        and not en_ancestros(s, v)):
+                    sig[s] = k
+                    return k
+                olvidados[s].pop(k, None)
+            k += 1
+        completo[s] = 1
+        return -1
+
+    def respaldar(s):
+        while s != -1 and completo[s]:
+            nuevo = min(min((f[c] for c in hijos[s].values()), default=INF),
+                        min(olvidados[s].values(), default=INF))
+            if nuevo == f[s]:
+                break
+            f[s] = nuevo
+            if abierto[s]:
+                encolar(s)
+            s = padre[s]
+
+    def olvidar_peor(b):
+        nonlocal vivos, olvidos
+        apartados = []
+        peor = -1
+        while peores:
+            entrada = heapq.heappop(peores)
+            menos_f, _, gn, s = entrada
+            if gn != gen[s] or not abierto[s] or hijos[s] or -menos_f != f[s]:
+                continue
+            if s == b:
+                apartados.append(entrada)
+                continue
+            peor = s
+            break
+        for entrada in apartados:
+            heapq.heappush(peores, entrada)
+        if peor == -1:
+            return False
+        p = padre[peor]
+        del hijos[p][arista[peor]]
+        olvidados[p][arista[peor]] = f[peor]
+        if mejor_vivo.get(estado[peor]) == peor:
+            del mejor_vivo[estado[peor]]
+        cerrar(peor)
+        gen[peor] += 1
+        hijos[peor] = olvidados[peor] = None
+        libres.append(peor)
+        vivos -= 1
+        olvidos += 1
+        abrir(p)
+        return True
+
+    resultado = None, INF
+    crear(origen, 0, h(origen), -1, -1, 0)
+    pico_abierta, pico_cerrada = 1, 0
+    while mejores:
+        fv, _, gn, b = mejores[0]
+        if gn != gen[b] or not abierto[b] or fv != f[b]:
+            heapq.heappop(mejores)
+            continue
+        if fv == INF:
+            break
+        if estado[b] == meta:
+            camino = []
+            s = b
+            while s != -1:
+                camino.append(g.nombres[estado[s]])
+                s = padre[s]
+            resultado = camino[::-1], costo[b]
+            break
+
+        k = pendiente(b)
+        if k == -1:
+            # sin sucesores por generar: sale de la frontera, o queda como hoja muerta
+            if hijos[b]:
+                cerrar(b)
+                respaldar(b)
+            else:
+                f[b] = INF
+                encolar(b)
+                respaldar(padre[b])
+            continue
+
+        expansiones += 1
+        if vivos == M and not olvidar_peor(b):
+            break
+        v = ind[k]
+        sig[b] = k + 1
+        c = costo[b] + pes[k]
+        fv = max(f[b], c + h(v), olvidados[b].pop(k, 0))
+        hijos[b][k] = crear(v, c, fv, b, k, prof[b] + 1)
+        if pendiente(b) == -1:
+            cerrar(b)
+        respaldar(b)
+
+        if en_frontera > pico_abierta:
+            pico_abierta = en_frontera
+        if vivos - en_frontera > pico_cerrada:
+            pico_cerrada = vivos - en_frontera
+
+    _cerrar_estadisticas(estadisticas, medicion, t0, expansiones, generados, pico_abierta,
+                         pico_cerrada, olvidos=olvidos)
+    return resultado
@@ -0,0 +1,8 @@
+# Los módulos de la raíz y los de "Proyecto IA" se importan por nombre, como en los scripts.
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for ruta in (RAIZ, os.path.join(RAIZ, 'Proyecto IA')):
+    if ruta not in sys.path:
+        sys.path.insert(0, ruta)
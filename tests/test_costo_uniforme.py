@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from costo_uniforme import MAX_PESO_CUBETAS, Dijkstra
+from grafo_csr import GrafoCSR
+
+
+def _cadena(n: int, peso: float) -> GrafoCSR:
+    return GrafoCSR.desde_aristas(n, np.arange(n - 1), np.arange(1, n), np.full(n - 1, peso))
+
+
+def test_cubetas_rechaza_pesos_grandes():
+    with pytest.raises(ValueError, match='cubetas'):
+        Dijkstra(_cadena(300, 1e5), 'cubetas')
+
+
+def test_auto_elige_la_cola():
+    assert Dijkstra(_cadena(10, MAX_PESO_CUBETAS), 'auto').cola == 'cubetas'
+    assert Dijkstra(_cadena(10, MAX_PESO_CUBETAS + 1), 'auto').cola == 'heap'
+    assert Dijkstra(_cadena(10, 1.5), 'auto').cola == 'heap'
+
+
+def test_colas_dan_las_mismas_distancias():
+    rng = np.random.default_rng(0)
+    n = 500
+    origen, destino = rng.integers(0, n, 3000), rng.integers(0, n, 3000)
+    g = GrafoCSR.desde_aristas(n, origen, destino, rng.integers(0, MAX_PESO_CUBETAS + 1, 3000).astype(float))
+    heap, cubetas = Dijkstra(g, 'heap').distancias(0), Dijkstra(g, 'cubetas').distancias(0)
+    assert np.array_equal(heap, cubetas)
+    assert Dijkstra(_cadena(300, 1e5), 'auto').distancias(0)[-1] == 299 * 1e5
@@ -0,0 +1,57 @@
+import io
+import struct
+import zlib
+
+import pytest
+
+import exportar_arbol
+from layout_arbol import LayoutArbol
+from main import ArbolBST
+
+
+def _arbol(n):
+    return ArbolBST.desde_ordenada(sorted((300 + i % 97, f'p{i:05d}', f'p{i:05d} : s') for i in range(n)))
+
+
+# Devuelve (ancho, alto, píxeles sin comprimir) de un PNG escrito por _escribir_png.
+def _leer_png(datos: bytes):
+    assert datos[:8] == b'\x89PNG\r\n\x1a\n'
+    i, idat, ancho, alto = 8, [], None, None
+    while i < len(datos):
+        largo, tipo = struct.unpack('>I4s', datos[i:i + 8])
+        cuerpo = datos[i + 8:i + 8 + largo]
+        assert struct.unpack('>I', datos[i + 8 + largo:i + 12 + largo])[0] == zlib.crc32(cuerpo, zlib.crc32(tipo))
+        if tipo == b'IHDR':
+            ancho, alto = struct.unpack('>II', cuerpo[:8])
+        elif tipo == b'IDAT':
+            idat.append(cuerpo)
+        i += 12 + largo
+    return ancho, alto, zlib.decompress(b''.join(idat))
+
+
+@pytest.mark.parametrize('n, ancho_max, alto_max', [(1, 8000, 4000), (40, 8000, 4000), (3000, 900, 300)])
+@pytest.mark.parametrize('filas', [1, 7, 64])
+def test_franjas_igual_que_imagen_entera(n, ancho_max, alto_max, filas):
+    layout = LayoutArbol(_arbol(n).raiz, ancho_max, alto_max)
+    entera, por_franjas = io.BytesIO(), io.BytesIO()
+    elementos = exportar_arbol._escribir_png(layout, entera, filas_por_franja=layout.alto)
+    assert exportar_arbol._escribir_png(layout, por_franjas, filas_por_franja=filas) == elementos
+
+    ancho, alto, px = _leer_png(entera.getvalue())
+    assert (ancho, alto) == (layout.ancho, layout.alto)
+    assert _leer_png(por_franjas.getvalue()) == (ancho, alto, px)
+    assert len(px) == alto * (1 + 3 * ancho)
+    # hay algo dibujado además del fondo
+    fondo = b'\x00' + bytes.fromhex(exportar_arbol.COLOR_FONDO[1:]) * ancho
+    assert any(px[y * len(fondo):(y + 1) * len(fondo)] != fondo for y in range(alto))
+
+
+def test_exportar_svg_y_png(tmp_path, capsys):
+    arbol = _arbol(200)
+    for extension in ('.svg', '.png'):
+        ruta = tmp_path / f'arbol{extension}'
+        layout = exportar_arbol.exportar_arbol(arbol, str(ruta), 2000, 1000)
+        assert layout is not None and layout.n == 200 and layout.elementos > 0
+        assert ruta.stat().st_size > 0
+    assert exportar_arbol.exportar_arbol(arbol, str(tmp_path / 'arbol.gif')) is None
+    assert 'no soportado' in capsys.readouterr().out
@@ -0,0 +1,43 @@
+import random
+
+from costo_uniforme import Dijkstra
+from grafo_csr import GrafoCSR, busqueda_a_estrella_csr
+
+
+def _costo_camino(grafo: dict, camino: list) -> float:
+    total = 0.0
+    for u, v in zip(camino, camino[1:]):
+        total += min(peso for vecino, peso in grafo[u] if vecino == v)
+    return total
+
+
+# h admisible pero no consistente: B se cierra primero por S -> B (5) y después aparece
+# por S -> A -> B (2). El camino devuelto tiene que costar lo que dice el costo.
+def test_a_estrella_reabre_nodos_cerrados():
+    grafo = {'S': [('B', 5), ('A', 1)], 'A': [('B', 1)], 'B': [('T', 10)], 'T': []}
+    h = {'S': 0, 'A': 9, 'B': 0, 'T': 0}
+    camino, costo = busqueda_a_estrella_csr(GrafoCSR.desde_dict(grafo), 'S', 'T', h)
+    assert camino == ['S', 'A', 'B', 'T']
+    assert costo == 12
+    assert _costo_camino(grafo, camino) == costo
+
+
+# Con h = fracción al azar de la distancia exacta (admisible, en general no consistente)
+# A* tiene que dar el costo óptimo y un camino con ese costo.
+def test_a_estrella_optimo_con_heuristica_inconsistente():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(2, 12)
+        grafo = {i: [(rng.randrange(n), rng.randint(1, 9)) for _ in range(rng.randint(0 if i else 1, 3))]
+                 for i in range(n)}
+        g = GrafoCSR.desde_dict(grafo)
+        objetivo = rng.randrange(n)
+        exactas = Dijkstra(g.transpuesto()).distancias(objetivo)
+        h = {v: (0 if d == float('inf') else d * rng.random()) for v, d in zip(g.nombres, exactas)}
+        inicio = rng.randrange(n)
+        camino, costo = busqueda_a_estrella_csr(g, inicio, objetivo, h)
+        if exactas[g.id(inicio)] == float('inf'):
+            assert camino is None
+        else:
+            assert costo == exactas[g.id(inicio)]
+            assert _costo_camino(grafo, camino) == costo
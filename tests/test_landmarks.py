@@ -0,0 +1,18 @@
+import numpy as np
+
+from costo_uniforme import Dijkstra
+from grafo_csr import GrafoCSR
+from landmarks import LandmarksALT
+
+
+# Pesos enteros grandes: la preparación tiene que ir por el heap (antes usaba cubetas y
+# recorría millones de cubetas vacías) y la heurística sigue siendo admisible.
+def test_pesos_enteros_grandes():
+    n = 300
+    ida, vuelta = np.arange(n - 1), np.arange(1, n)
+    g = GrafoCSR.desde_aristas(n, np.r_[ida, vuelta], np.r_[vuelta, ida], np.full(2 * n - 2, 1e5))
+    lm = LandmarksALT.preparar(g, k=2, procesos=1)
+    exactas = Dijkstra(g.transpuesto()).distancias(n - 1)
+    h = lm.heuristica(n - 1)
+    assert all(h(v) <= exactas[v] for v in range(n))
+    assert h(0) == exactas[0]
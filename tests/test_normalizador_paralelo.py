@@ -0,0 +1,56 @@
+import pytest
+
+import normalizador_paralelo
+from main import normalizar_y_generar_balanceado
+from normalizador_paralelo import normalizar_y_generar_balanceado_paralelo
+
+# Duplicados (mismo _norm con otra mayúscula, y repetidos exactos en rangos distintos),
+# líneas sin ':' o sin palabra, paréntesis, acentos, CRLF mezclado con LF y la última
+# línea sin salto final.
+FUENTE = (
+    "Casa : lugar para vivir (sust.)\r\n"
+    "perro : animal doméstico\n"
+    "línea sin separador\n"
+    "árbol : planta leñosa\r\n"
+    "\r\n"
+    "casa : definición repetida que no debe ganar\n"
+    "123 : sin palabra\n"
+    "Perro : otra vez\r\n"
+    "ñandú : ave corredora (zool.)\n"
+    "gato: felino\n"
+    "  sol  :  estrella  \r\n"
+    "perro : tercera vez\n"
+    "agua : líquido\r\n"
+    "ÁRBOL : mayúsculas\n"
+    "luna : satélite"
+).encode('utf-8')
+
+
+@pytest.mark.parametrize('tam_rango', [1, 5, 17, 64, 1 << 20])
+def test_paralelo_igual_que_serie(tmp_path, monkeypatch, capsys, tam_rango):
+    fuente = tmp_path / 'fuente.txt'
+    fuente.write_bytes(FUENTE)
+    serie, paralelo = tmp_path / 'serie.txt', tmp_path / 'paralelo.txt'
+
+    # rangos chicos: los cortes caen en medio de líneas y se corren al próximo '\n'
+    monkeypatch.setattr(normalizador_paralelo, 'TAM_MIN_RANGO', tam_rango)
+    rangos = normalizador_paralelo._rangos_por_lineas(str(fuente), 64)
+    assert rangos[0][0] == 0 and rangos[-1][1] == len(FUENTE)
+    assert all(FUENTE[fin - 1:fin] == b'\n' for _, fin in rangos[:-1])
+
+    tuplas_serie = normalizar_y_generar_balanceado(str(fuente), str(serie))
+    tuplas_paralelo = normalizar_y_generar_balanceado_paralelo(str(fuente), str(paralelo), trabajadores=2)
+    capsys.readouterr()
+
+    assert tuplas_paralelo == tuplas_serie
+    assert paralelo.read_bytes() == serie.read_bytes()
+    palabras = [palabra for _, palabra, _ in tuplas_serie]
+    assert sorted(palabras) == sorted(set(palabras))
+    assert 'luna' in palabras
+    assert 'Casa : lugar para vivir ' in [linea for _, _, linea in tuplas_serie]
+
+
+def test_archivo_inexistente(tmp_path, capsys):
+    salida = tmp_path / 'salida.txt'
+    assert normalizar_y_generar_balanceado_paralelo(str(tmp_path / 'no_existe.txt'), str(salida)) == []
+    assert normalizar_y_generar_balanceado(str(tmp_path / 'no_existe.txt'), str(salida)) == []
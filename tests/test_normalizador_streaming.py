@@ -0,0 +1,71 @@
+import pytest
+
+import normalizador_streaming
+from main import normalizar_y_generar_balanceado
+from normalizador_streaming import normalizar_y_generar_balanceado_streaming
+
+# Duplicados exactos y con otra mayúscula o acento (gana la primera aparición), líneas sin
+# ':' o sin palabra, sumas ASCII repetidas entre palabras distintas, CRLF mezclado con LF y
+# la última línea sin salto final.
+FUENTE = (
+    "Casa : lugar para vivir (sust.)\r\n"
+    "perro : animal doméstico\n"
+    "línea sin separador\n"
+    "árbol : planta leñosa\r\n"
+    "\r\n"
+    "casa : definición repetida que no debe ganar\n"
+    "123 : sin palabra\n"
+    "Perro : otra vez\r\n"
+    "ñandú : ave corredora (zool.)\n"
+    "gato: felino\n"
+    "toga : prenda\n"
+    "  sol  :  estrella  \r\n"
+    "perro : tercera vez\n"
+    "agua : líquido\r\n"
+    "ÁRBOL : mayúsculas\n"
+    "ab : par\n"
+    "ba : par invertido\n"
+    "CASA : otra más\n"
+    "luna : satélite"
+).encode('utf-8')
+
+
+@pytest.mark.parametrize('registros_por_run', [1, 2, 3, 1000])
+def test_streaming_igual_que_en_memoria(tmp_path, monkeypatch, capsys, registros_por_run):
+    fuente = tmp_path / 'fuente.txt'
+    fuente.write_bytes(FUENTE)
+    memoria, streaming = tmp_path / 'memoria.txt', tmp_path / 'streaming.txt'
+
+    # cuenta los runs de cada fase: con pocos registros por run y max_runs_abiertos=2
+    # hay fusiones intermedias
+    runs = []
+    generar = normalizador_streaming._generar_runs
+
+    def contar_runs(registros, tam, directorio):
+        rutas = generar(registros, tam, directorio)
+        runs.append(len(rutas))
+        return rutas
+    monkeypatch.setattr(normalizador_streaming, '_generar_runs', contar_runs)
+
+    tuplas = normalizar_y_generar_balanceado(str(fuente), str(memoria))
+    n = normalizar_y_generar_balanceado_streaming(str(fuente), str(streaming),
+                                                  registros_por_run=registros_por_run,
+                                                  max_runs_abiertos=2, dir_temporal=str(tmp_path))
+    capsys.readouterr()
+
+    assert n == len(tuplas)
+    assert streaming.read_bytes() == memoria.read_bytes()
+    if registros_por_run <= 3:
+        assert runs[0] > 2 and runs[1] > 2
+    palabras = [palabra for _, palabra, _ in tuplas]
+    assert sorted(palabras) == sorted(set(palabras))
+    assert 'Casa : lugar para vivir ' in [linea for _, _, linea in tuplas]
+    # los temporales se borran al terminar
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['fuente.txt', 'memoria.txt', 'streaming.txt']
+
+
+def test_archivo_inexistente(tmp_path, capsys):
+    salida = tmp_path / 'salida.txt'
+    assert normalizar_y_generar_balanceado_streaming(str(tmp_path / 'no_existe.txt'), str(salida)) == 0
+    assert 'no se encontró' in capsys.readouterr().out
+    assert not salida.exists()
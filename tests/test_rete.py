@@ -0,0 +1,87 @@
+import random
+
+from inferencia import RedRete, _normalizar_regla
+
+
+# Punto fijo ingenuo: aplica todas las reglas a todos los elementos hasta que nada cambia.
+def _cierre(afirmados: set, reglas: list) -> set:
+    normalizadas = [_normalizar_regla(regla) for regla in reglas]
+    hechos = set(afirmados)
+    cambio = True
+    while cambio:
+        cambio = False
+        for elem in {e for _, e in hechos}:
+            for antecedentes, consecuente in normalizadas:
+                if (consecuente, elem) not in hechos and all((a, elem) in hechos for a in antecedentes):
+                    hechos.add((consecuente, elem))
+                    cambio = True
+    return hechos
+
+
+def _estado(red: RedRete) -> set:
+    return {(p, e) for p, conjunto in red.base.por_predicado.items() for e in conjunto}
+
+
+def test_ciclo_se_retira_sin_soporte():
+    red = RedRete([('A', 'B'), ('B', 'A'), (('A', 'C'), 'D')])
+    assert sorted(red.cargar({'A': ['x'], 'C': ['x']})) == ['x es B', 'x es D']
+    # B y A se sostienen mutuamente, pero ninguno tiene soporte fuera del ciclo
+    assert sorted(red.retractar('A', 'x')) == ['x es A', 'x es B', 'x es D']
+    assert _estado(red) == {('C', 'x')}
+
+    # afirmado por otro lado, el ciclo se re-deriva y B queda aunque se retracte A
+    red.afirmar('B', 'x')
+    assert _estado(red) == {('A', 'x'), ('B', 'x'), ('C', 'x'), ('D', 'x')}
+    red.afirmar('A', 'x')
+    assert red.retractar('A', 'x') == []
+    assert _estado(red) == {('A', 'x'), ('B', 'x'), ('C', 'x'), ('D', 'x')}
+    # retractar algo no afirmado no cambia nada
+    assert red.retractar('D', 'x') == []
+    assert sorted(red.retractar('B', 'x')) == ['x es A', 'x es B', 'x es D']
+    assert _estado(red) == {('C', 'x')}
+
+
+def test_conjuncion_pierde_un_antecedente():
+    red = RedRete([(('EsEstudiante', 'EsHumano'), 'Aprueba'), ('EsHumano', 'EsMortal')])
+    red.cargar({'EsHumano': ['ana', 'beto'], 'EsEstudiante': ['ana']})
+    assert red.contiene('Aprueba', 'ana') and not red.contiene('Aprueba', 'beto')
+    assert red.afirmar('EsEstudiante', 'beto') == ['beto es Aprueba']
+    assert sorted(red.retractar('EsHumano', 'ana')) == ['ana es Aprueba', 'ana es EsHumano',
+                                                        'ana es EsMortal']
+    assert red.contiene('EsEstudiante', 'ana') and red.contiene('Aprueba', 'beto')
+
+
+def test_igual_que_punto_fijo_ingenuo():
+    rnd = random.Random(11)
+    predicados, elementos = [f'P{i}' for i in range(7)], list(range(6))
+    for _ in range(200):
+        reglas = []
+        for _ in range(rnd.randint(1, 9)):
+            antecedentes = tuple(rnd.sample(predicados, rnd.randint(1, 3)))
+            if len(antecedentes) == 1 and rnd.random() < 0.5:
+                antecedentes = antecedentes[0]
+            reglas.append((antecedentes, rnd.choice(predicados)))
+        hechos = {p: rnd.sample(elementos, rnd.randint(0, 3)) for p in rnd.sample(predicados, 3)}
+        afirmados = {(p, e) for p, es in hechos.items() for e in es}
+
+        red = RedRete(reglas)
+        conclusiones = red.cargar(hechos)
+        esperado = _cierre(afirmados, reglas)
+        assert _estado(red) == esperado
+        assert sorted(conclusiones) == sorted(f'{e} es {p}' for p, e in esperado - afirmados)
+
+        for _ in range(15):
+            p, e = rnd.choice(predicados), rnd.choice(elementos)
+            antes = _estado(red)
+            if rnd.random() < 0.5:
+                red.afirmar(p, e)
+                afirmados.add((p, e))
+            else:
+                retirados = red.retractar(p, e)
+                afirmados.discard((p, e))
+                assert sorted(retirados) == sorted(f'{x} es {q}' for q, x in antes - _estado(red))
+            esperado = _cierre(afirmados, reglas)
+            assert _estado(red) == esperado
+            # cada memoria beta tiene exactamente los elementos que cumplen su prefijo
+            for prefijo, nodo in red._nodos.items():
+                assert nodo.memoria == {x for x in elementos if all((a, x) in esperado for a in prefijo)}
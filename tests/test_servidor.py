@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+from servidor import ServidorDiccionario, cargar_arbol
+
+
+def _arbol(tmp_path):
+    fuente = tmp_path / 'balanceado.txt'
+    fuente.write_text("perro : animal (Suma ASCII: 546)\ngato : felino (Suma ASCII: 423)\n"
+                      "pez : acuático (Suma ASCII: 335)\n", encoding='utf-8')
+    return cargar_arbol(balanceado=str(fuente))
+
+
+def test_cargar_arbol_deja_el_indice_de_prefijos_ordenado(tmp_path, capsys):
+    arbol = _arbol(tmp_path)
+    assert not arbol.prefijos._pendientes
+    assert [n.palabra for n in arbol.con_prefijo('pe')] == ['perro', 'pez']
+
+
+# Un error inesperado en una petición (acá OverflowError por int(inf)) se responde como
+# error y la misma conexión sigue atendiendo.
+def test_error_en_una_peticion_no_corta_la_conexion(tmp_path, capsys):
+    servidor = ServidorDiccionario(_arbol(tmp_path))
+    ruta = str(tmp_path / 'srv.sock')
+
+    async def probar():
+        srv = await asyncio.start_unix_server(servidor._conexion, path=ruta)
+        async with srv:
+            reader, writer = await asyncio.open_unix_connection(ruta)
+            respuestas = []
+            for linea in ('{"id": 1, "op": "dls", "palabra": "perro", "limite": 1e400}',
+                          '[1, 2]',
+                          '{"id": 3, "op": "buscar", "palabra": "gato"}'):
+                writer.write(linea.encode('utf-8') + b"\n")
+                await writer.drain()
+                respuestas.append(json.loads(await reader.readline()))
+            writer.close()
+            return respuestas
+
+    sobrecarga, lista, buscar = asyncio.run(probar())
+    assert sobrecarga['id'] == 1 and not sobrecarga['ok'] and 'OverflowError' in sobrecarga['error']
+    assert not lista['ok'] and 'TypeError' in lista['error']
+    assert buscar['ok'] and buscar['resultado']['palabra'] == 'gato'
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Los módulos sin interfaz gráfica tienen que importarse aunque Python no traiga tkinter.
+MODULOS = ['main', 'exportar_arbol', 'arbol_compacto', 'snapshot', 'servidor',
+           'normalizador_paralelo', 'normalizador_streaming', 'layout_arbol']
+
+SIN_TK = """
+import sys
+sys.modules['tkinter'] = None
+sys.path[:0] = [{raiz!r}, {raiz!r} + '/Proyecto IA']
+for modulo in {modulos!r}:
+    __import__(modulo)
+"""
+
+
+def test_modulos_sin_tkinter():
+    codigo = SIN_TK.format(raiz=RAIZ, modulos=MODULOS)
+    resultado = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True)
+    assert resultado.returncode == 0, resultado.stderr
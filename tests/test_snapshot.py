@@ -0,0 +1,58 @@
+import struct
+
+import pytest
+
+from arbol_compacto import ArbolCompacto
+from main import calcular_suma_ascii
+from snapshot import cargar_snapshot, guardar_snapshot, hash_fuente
+
+PALABRAS = ['perro', 'gato', 'pez', 'árbol', 'casa']
+
+
+def _guardar(tmp_path, archivo_fuente=None):
+    tuplas = sorted((calcular_suma_ascii(p), p, f"{p} : def {p}") for p in PALABRAS)
+    ruta = str(tmp_path / 'dicc.snap')
+    guardar_snapshot(ArbolCompacto.desde_ordenada(tuplas), ruta, archivo_fuente)
+    return ruta
+
+
+def test_snapshot_es_de_solo_lectura(tmp_path):
+    arbol = cargar_snapshot(_guardar(tmp_path))
+    assert arbol.solo_lectura
+    with pytest.raises(TypeError, match='solo lectura'):
+        arbol.insertar(calcular_suma_ascii('luna'), 'luna', 'satélite')
+
+    copia = arbol.editable()
+    copia.insertar(calcular_suma_ascii('luna'), 'luna', 'satélite')
+    assert copia.significado(copia.buscar('luna')) == 'satélite'
+    assert all(copia.palabra(copia.buscar(p)) == p for p in PALABRAS)
+    assert arbol.buscar('luna') is None
+
+
+def test_fuente_inexistente(tmp_path, capsys):
+    falta = str(tmp_path / 'no_existe.txt')
+    assert hash_fuente(falta) is None
+    ruta = _guardar(tmp_path, falta)
+    assert 'sin hash' in capsys.readouterr().out
+    assert cargar_snapshot(ruta) is not None
+    assert cargar_snapshot(ruta, falta) is None
+    assert 'no se puede verificar' in capsys.readouterr().out
+
+
+def test_desplazamientos_de_64_bits(tmp_path):
+    arbol = cargar_snapshot(_guardar(tmp_path))
+    assert arbol.inicios.format == 'q'
+    assert all(arbol.palabra(arbol.buscar(p)) == p for p in PALABRAS)
+    copia = arbol.editable()
+    assert copia.inicios.typecode == 'q'
+    # un desplazamiento que no entra en int32 no desborda el pool
+    copia.inicios.append(2 ** 31)
+
+
+def test_rechaza_version_anterior(tmp_path, capsys):
+    ruta = _guardar(tmp_path)
+    with open(ruta, 'r+b') as f:
+        f.seek(8)
+        f.write(struct.pack('<H', 1))
+    assert cargar_snapshot(ruta) is None
+    assert 'no soportada' in capsys.readouterr().out